@@ -0,0 +1,81 @@
+"""
+Benchmark asyncio event loop lag caused by logging to a slow stream with sync & async stream handlers.
+
+Run: `LOGGING__AUTOLOAD=0 PYTHONPATH=src python benchmarks/bench_asyncio.py`
+"""
+
+import asyncio
+import io
+import logging
+import statistics
+import time
+
+from typing_extensions import override
+
+from no_log_tears import get_logger
+from no_log_tears.handler import AsyncStreamHandler
+
+
+class SlowStream(io.StringIO):
+    """Stream that takes 0.1 ms per write & flush call (e.g. a pipe or a terminal under load)."""
+
+    @override
+    def write(self, s: str) -> int:
+        time.sleep(0.0001)
+        return super().write(s)
+
+    @override
+    def flush(self) -> None:
+        time.sleep(0.0001)
+
+
+async def measure(handler: logging.Handler, tasks: int, records: int) -> list[float]:
+    logger = logging.getLogger("bench")
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    log = get_logger("bench")
+
+    lags = list[float]()
+
+    async def worker(i: int) -> None:
+        for j in range(records):
+            log.info("task %d record %d", i, j)
+            await asyncio.sleep(0)
+
+    async def ticker(done: asyncio.Event) -> None:
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - start - 0.001)
+
+    done = asyncio.Event()
+    tick = asyncio.create_task(ticker(done))
+    await asyncio.gather(*(worker(i) for i in range(tasks)))
+    await log.aflush()
+    done.set()
+    await tick
+
+    handler.close()
+
+    return lags
+
+
+def main() -> None:
+    for name, handler in (
+        ("StreamHandler", logging.StreamHandler(SlowStream())),
+        ("AsyncStreamHandler", AsyncStreamHandler(SlowStream())),
+    ):
+        start = time.perf_counter()
+        lags = asyncio.run(measure(handler, tasks=10, records=200))
+        elapsed = time.perf_counter() - start
+
+        print(  # noqa: T201
+            f"{name:<20} total {elapsed * 1e3:8.1f} ms"
+            f"    loop lag p50 {statistics.median(lags) * 1e3:6.2f} ms"
+            f"    max {max(lags) * 1e3:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark binary log encoding against JSON output: encoding throughput, file handler throughput and output size.
+
+Run: `LOGGING__AUTOLOAD=0 PYTHONPATH=src python benchmarks/bench_binary.py`
+"""
+
+import io
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from no_log_tears.binary import BinaryDecoder, BinaryEncoder
+from no_log_tears.formatter import JSONFormatter
+from no_log_tears.handler import BinaryFileHandler
+
+
+def create_records(count: int) -> list[logging.LogRecord]:
+    records = []
+    for i in range(count):
+        record = logging.LogRecord(
+            "app.service.orders",
+            logging.INFO,
+            __file__,
+            42,
+            "order %s processed in %.3f s",
+            (f"order-{i}", i / 1000),
+            None,
+            "process_order",
+        )
+        record.__dict__.update({"user_id": i % 100, "items": ["apple", "pear"], "total": 12.5})
+        records.append(record)
+
+    return records
+
+
+def report(label: str, count: int, elapsed: float, size: int) -> None:
+    print(  # noqa: T201
+        f"{label:<28} {count / elapsed:10,.0f} records/s    {elapsed / count * 1e9:8.1f} ns/record"
+        f"    {size / count:6.1f} bytes/record"
+    )
+
+
+def main() -> None:
+    count = 100_000
+
+    records = create_records(count)
+    formatter = JSONFormatter()
+    start = time.perf_counter()
+    size = sum(len(formatter.format(record)) + 1 for record in records)
+    report("JSONFormatter.format", count, time.perf_counter() - start, size)
+
+    records = create_records(count)
+    encoder = BinaryEncoder()
+    start = time.perf_counter()
+    data = encoder.header() + b"".join(encoder.encode(record) for record in records)
+    report("BinaryEncoder.encode", count, time.perf_counter() - start, len(data))
+
+    start = time.perf_counter()
+    decoded = sum(1 for _ in BinaryDecoder().decode_stream(io.BytesIO(data)))
+    report("BinaryDecoder.decode", decoded, time.perf_counter() - start, len(data))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_handler = logging.FileHandler(Path(tmp) / "app.log")
+        json_handler.setFormatter(JSONFormatter())
+        binary_handler = BinaryFileHandler(Path(tmp) / "app.nltb")
+
+        for label, handler, path in (
+            ("FileHandler + JSONFormatter", json_handler, Path(tmp) / "app.log"),
+            ("BinaryFileHandler", binary_handler, Path(tmp) / "app.nltb"),
+        ):
+            records = create_records(count)
+            start = time.perf_counter()
+            for record in records:
+                handler.handle(record)
+            handler.close()
+            report(label, count, time.perf_counter() - start, path.stat().st_size)
+
+
+if __name__ == "__main__":
+    main()
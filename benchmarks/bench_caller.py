@@ -0,0 +1,31 @@
+"""
+Benchmark log calls with different caller info lookup modes.
+
+Run: `LOGGING__AUTOLOAD=0 PYTHONPATH=src python benchmarks/bench_caller.py`
+"""
+
+import logging
+import timeit
+
+from no_log_tears import get_logger
+from no_log_tears.caller import set_caller_modes
+
+
+def main() -> None:
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.NullHandler())
+
+    log = get_logger("bench")
+    number = 100_000
+
+    for mode in ("full", "frame", "off"):
+        set_caller_modes({"bench": mode})  # type: ignore[dict-item]
+
+        elapsed = min(timeit.repeat(lambda: log.info("hello"), number=number, repeat=5))
+        print(f"caller={mode:<10} {elapsed / number * 1e9:8.1f} ns/call")  # noqa: T201
+
+    set_caller_modes({})
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Benchmark handler dispatch for loggers at different hierarchy depths with and without flattened handler dispatch.
+
+Run: `LOGGING__AUTOLOAD=0 PYTHONPATH=src python benchmarks/bench_dispatch.py`
+"""
+
+import logging
+import timeit
+
+from no_log_tears.dispatch import set_handler_dispatch
+
+
+def main() -> None:
+    number = 200_000
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.NullHandler())
+
+    record = logging.LogRecord("bench", logging.INFO, __file__, 1, "hello", (), None)
+
+    for depth in (1, 4, 8, 16):
+        # NOTE: create all intermediate loggers, otherwise the logger parent is the root logger (placeholders are
+        # skipped).
+        names = [".".join(f"level{i}" for i in range(n)) for n in range(1, depth + 1)]
+        logger = [logging.getLogger(name) for name in names][-1]
+
+        for enabled in (False, True):
+            set_handler_dispatch(enabled)
+
+            elapsed = min(timeit.repeat(lambda: logger.callHandlers(record), number=number, repeat=5))
+            label = f"depth={depth}, flatten_handlers={enabled}"
+            print(f"{label:<40} {elapsed / number * 1e9:8.1f} ns/record")  # noqa: T201
+
+    set_handler_dispatch(False)  # noqa: FBT003
+
+
+if __name__ == "__main__":
+    main()
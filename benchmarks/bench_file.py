@@ -0,0 +1,56 @@
+"""
+Benchmark memory-mapped file handler against builtin file & stream handlers with `brief` and `json` formatters.
+
+Run: `LOGGING__AUTOLOAD=0 PYTHONPATH=src python benchmarks/bench_file.py`
+"""
+
+import logging
+import tempfile
+import time
+import typing as t
+from pathlib import Path
+
+from no_log_tears.config import DictConfigurator
+from no_log_tears.handler import MemoryMappedFileHandler
+
+
+def main() -> None:
+    records = 200_000
+    formatters = DictConfigurator.create_default()["formatters"]
+    assert isinstance(formatters, dict)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        factories: dict[str, t.Callable[[Path], logging.Handler]] = {
+            "FileHandler": lambda path: logging.FileHandler(path),
+            "StreamHandler": lambda path: logging.StreamHandler(path.open("w")),  # noqa: SIM115
+            "MemoryMappedFileHandler": lambda path: MemoryMappedFileHandler(path),
+        }
+
+        for formatter_name in ("brief", "json"):
+            config = DictConfigurator({"version": 1, "formatters": {formatter_name: formatters[formatter_name]}})
+            formatter = config.configure_formatter(formatters[formatter_name])
+
+            for name, factory in factories.items():
+                path = Path(tmp) / f"{formatter_name}-{name}.log"
+                handler = factory(path)
+                handler.setFormatter(formatter)
+                batch = [
+                    logging.makeLogRecord({"msg": "record %d", "args": (i,), "levelno": logging.INFO, "key": "value"})
+                    for i in range(records)
+                ]
+
+                start = time.perf_counter()
+                for record in batch:
+                    handler.handle(record)
+                handler.close()
+                elapsed = time.perf_counter() - start
+
+                label = f"{formatter_name}, {name}"
+                print(  # noqa: T201
+                    f"{label:<32} {records / elapsed:10,.0f} records/s"
+                    f"    {elapsed / records * 1e9:8.1f} ns/record    {path.stat().st_size / 1e6:6.1f} MB"
+                )
+
+
+if __name__ == "__main__":
+    main()
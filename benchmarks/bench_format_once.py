@@ -0,0 +1,41 @@
+"""
+Benchmark per-record cost with 1-4 handlers sharing the same formatter.
+
+Run: `LOGGING__AUTOLOAD=0 PYTHONPATH=src python benchmarks/bench_format_once.py`
+"""
+
+import logging
+import os
+import timeit
+
+from no_log_tears import get_logger
+from no_log_tears.config import DictConfigurator
+
+
+def main() -> None:
+    number = 50_000
+    devnull = open(os.devnull, "w")  # noqa: PTH123, SIM115
+
+    for formatter in ("brief", "json"):
+        for handlers in (1, 2, 4):
+            config = DictConfigurator.create_default(level="INFO")
+            config["handlers"] = {
+                f"handler{i}": {
+                    "class": "logging.StreamHandler",
+                    "formatter": formatter,
+                    "stream": devnull,
+                }
+                for i in range(handlers)
+            }
+            config["root"] = {"level": "INFO", "handlers": list(config["handlers"])}
+            DictConfigurator(config).configure()
+
+            log = get_logger("bench")
+
+            elapsed = min(timeit.repeat(lambda: log.info("hello %s", "world", key="value"), number=number, repeat=5))
+            label = f"{formatter}, handlers={handlers}"
+            print(f"{label:<30} {elapsed / number * 1e9:8.1f} ns/record")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark indexed search over newline-delimited JSON logs against a full scan (parse & filter each line).
+
+Run: `LOGGING__AUTOLOAD=0 PYTHONPATH=src python benchmarks/bench_index.py`
+"""
+
+import json
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from no_log_tears.binary import RecordFilter
+from no_log_tears.formatter import JSONFormatter
+from no_log_tears.index import LogIndex
+
+
+def write_log(path: Path, count: int) -> None:
+    formatter = JSONFormatter()
+    loggers = [f"app.service{i}" for i in range(20)]
+
+    with path.open("w") as fd:
+        for i in range(count):
+            record = logging.LogRecord(
+                loggers[i % len(loggers)],
+                logging.ERROR if i % 1000 == 0 else logging.INFO,
+                __file__,
+                42,
+                "request %s handled",
+                (i,),
+                None,
+            )
+            record.created = 1_700_000_000 + i / 100
+            record.__dict__.update({"request_id": f"req-{i}", "user_id": i % 5000})
+            fd.write(formatter.format(record) + "\n")
+
+
+def full_scan(path: Path, record_filter: RecordFilter, fields: dict[str, object]) -> int:
+    found = 0
+
+    with path.open("rb") as fd:
+        for line in fd:
+            values = json.loads(line)
+            if record_filter.match(
+                round(values["created"] * 1_000_000), values["levelno"], values["name"]
+            ) and all(values.get(key) == value for key, value in fields.items()):
+                found += 1
+
+    return found
+
+
+def main() -> None:
+    count = 500_000
+    queries = {
+        "errors": (RecordFilter(level=logging.ERROR), {}),
+        "logger & 1 min": (RecordFilter(since=1_700_001_000, until=1_700_001_060, loggers=["app.service3"]), {}),
+        "field equality": (RecordFilter(), {"request_id": "req-123456"}),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "app.log"
+        write_log(path, count)
+        print(f"log file: {count:,} records, {path.stat().st_size / 1e6:.1f} MB")  # noqa: T201
+
+        start = time.perf_counter()
+        LogIndex(path).update()
+        index_size = LogIndex(path).index_path.stat().st_size
+        print(  # noqa: T201
+            f"index build: {time.perf_counter() - start:.2f} s, index size {index_size / 1e3:.1f} KB"
+        )
+
+        with path.open("a") as fd:
+            fd.write(path.read_text().splitlines(keepends=True)[-1] * 1000)
+        start = time.perf_counter()
+        LogIndex(path).update()
+        print(f"incremental update (1000 lines): {(time.perf_counter() - start) * 1000:.1f} ms")  # noqa: T201
+
+        for label, (record_filter, fields) in queries.items():
+            start = time.perf_counter()
+            expected = full_scan(path, record_filter, fields)
+            scan_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            found = sum(1 for _ in LogIndex(path).search(record_filter, fields))
+            search_time = time.perf_counter() - start
+
+            assert found == expected, (label, found, expected)
+            print(  # noqa: T201
+                f"{label:<16} {found:6} records    full scan {scan_time * 1000:8.1f} ms"
+                f"    indexed search {search_time * 1000:8.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark disabled-level log calls through `LogMixin._log`.
+
+Run: `LOGGING__AUTOLOAD=0 PYTHONPATH=src python benchmarks/bench_mixin.py`
+"""
+
+import logging
+import timeit
+import typing as t
+
+from typing_extensions import override
+
+from no_log_tears import LogMixin
+
+
+class Plain(LogMixin):
+    def work(self) -> None:
+        self._log.debug("working")
+
+
+class WithExtra(LogMixin):
+    def __init__(self) -> None:
+        self.state = {"spam": "eggs"}
+
+    def work(self) -> None:
+        self._log.debug("working")
+
+    def bound_work(self) -> None:
+        log = self._log(foo="bar")
+        log.debug("working")
+
+    @override
+    def _log_extra(self) -> t.Mapping[str, object]:
+        return {"state_len": len(self.state), "state": dict(self.state)}
+
+
+def main() -> None:
+    logging.getLogger().setLevel(logging.INFO)
+
+    plain = Plain()
+    with_extra = WithExtra()
+    number = 200_000
+
+    for name, func in (
+        ("plain._log.debug", plain.work),
+        ("with_extra._log.debug", with_extra.work),
+        ("with_extra._log(foo=...).debug", with_extra.bound_work),
+    ):
+        elapsed = min(timeit.repeat(func, number=number, repeat=5))
+        print(f"{name:<40} {elapsed / number * 1e9:8.1f} ns/call")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
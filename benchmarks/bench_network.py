@@ -0,0 +1,88 @@
+"""
+Benchmark network handler throughput & emit latency against a local TCP collector stand-in.
+
+Run: `LOGGING__AUTOLOAD=0 PYTHONPATH=src python benchmarks/bench_network.py`
+"""
+
+import logging
+import socket
+import socketserver
+import statistics
+import threading
+import time
+
+from typing_extensions import override
+
+from no_log_tears.formatter import JSONFormatter
+from no_log_tears.handler import NetworkHandler
+
+
+class Sink(socketserver.StreamRequestHandler):
+    received = 0
+
+    @override
+    def handle(self) -> None:
+        for _ in self.rfile:
+            Sink.received += 1
+
+
+def measure(name: str, handler: logging.Handler, records: int) -> None:
+    Sink.received = 0
+    # NOTE: new record instance for each emit, so formatter output cache is not hit.
+    batch = [
+        logging.makeLogRecord({"msg": "hello %s", "args": ("world",), "levelno": logging.INFO, "key": "value"})
+        for _ in range(records)
+    ]
+    latencies = list[float]()
+
+    start = time.perf_counter()
+    for record in batch:
+        emit_start = time.perf_counter_ns()
+        handler.handle(record)
+        latencies.append(time.perf_counter_ns() - emit_start)
+    emitted = time.perf_counter() - start
+
+    while Sink.received < records and time.perf_counter() - start < 60:  # noqa: PLR2004
+        time.sleep(0.001)
+    delivered = time.perf_counter() - start
+
+    handler.close()
+
+    latencies.sort()
+    print(  # noqa: T201
+        f"{name:<28}"
+        f" emit {records / emitted:10,.0f} records/s"
+        f"    delivered {Sink.received / delivered:10,.0f} records/s"
+        f"    emit latency p50 {statistics.median(latencies) / 1e3:6.1f} us"
+        f" p99 {latencies[int(len(latencies) * 0.99)] / 1e3:6.1f} us"
+        f" max {latencies[-1] / 1e3:8.1f} us"
+    )
+
+
+def main() -> None:
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Sink)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+
+    records = 100_000
+
+    # NOTE: baseline -- blocking NDJSON writes to the socket in the emitting thread.
+    conn = socket.create_connection((str(host), int(port)))
+    stream_handler = logging.StreamHandler(conn.makefile("w"))
+    stream_handler.setFormatter(JSONFormatter())
+    measure("StreamHandler (socket)", stream_handler, records)
+    conn.close()
+
+    for connections in (1, 2):
+        measure(
+            f"NetworkHandler connections={connections}",
+            NetworkHandler(host=str(host), port=int(port), connections=connections),
+            records,
+        )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark per-record cost with and without unused record fields collection.
+
+Run: `LOGGING__AUTOLOAD=0 PYTHONPATH=src python benchmarks/bench_record_fields.py`
+"""
+
+import logging
+import os
+import timeit
+
+from no_log_tears.config import DictConfigurator
+
+
+def main() -> None:
+    number = 100_000
+    devnull = open(os.devnull, "w")  # noqa: PTH123, SIM115
+
+    for disable in (False, True):
+        config = DictConfigurator.create_default(level="INFO")
+        config["handlers"] = {
+            "console": {
+                "class": "logging.StreamHandler",
+                "formatter": "brief",
+                "stream": devnull,
+            },
+        }
+        config["disable_unused_record_fields"] = disable
+        DictConfigurator(config).configure()
+
+        log = logging.getLogger("bench")
+        record = logging.LogRecord
+
+        def make_record() -> None:
+            record("bench", logging.INFO, __file__, 1, "hello", (), None)
+
+        def log_record() -> None:
+            log.info("hello")
+
+        for name, func in (("LogRecord()", make_record), ("log.info (brief)", log_record)):
+            elapsed = min(timeit.repeat(func, number=number, repeat=5))
+            label = f"{name}, disable_unused_record_fields={disable}"
+            print(f"{label:<60} {elapsed / number * 1e9:8.1f} ns/record")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark logging throughput (records per second) at 1-32 threads for `brief` and `json` presets.
+
+Run on both GIL and free-threaded interpreters (e.g. `python3.13` and `python3.13t`) to compare multi-core scaling.
+
+Run: `LOGGING__AUTOLOAD=0 PYTHONPATH=src python benchmarks/bench_threads.py`
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+
+from no_log_tears import get_logger
+from no_log_tears.config import DictConfigurator
+from no_log_tears.handler import AsyncStreamHandler
+
+RECORDS_PER_THREAD = 10_000
+
+
+def configure(formatter: str, handler_class: str) -> None:
+    config = DictConfigurator.create_default(level="INFO", formatter=formatter)
+    config["handlers"] = {
+        "console": {
+            "class": handler_class,
+            "formatter": formatter,
+            "stream": "ext://sys.stdout",
+        },
+    }
+    DictConfigurator(config).configure()
+
+
+def run(threads: int) -> float:
+    log = get_logger("bench")
+    barrier = threading.Barrier(threads + 1)
+
+    def worker() -> None:
+        barrier.wait()
+        for i in range(RECORDS_PER_THREAD):
+            log.info("record %d", i, key="value")
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+    return threads * RECORDS_PER_THREAD / (time.perf_counter() - start)
+
+
+def main() -> None:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(  # noqa: T201
+        f"python {sys.version.split()[0]}, GIL enabled: {is_gil_enabled}, CPUs: {os.cpu_count()}",
+        file=sys.stderr,
+    )
+
+    # NOTE: records are written to stdout, redirect it to /dev/null, so the benchmark measures logging overhead only.
+    with open(os.devnull, "w") as devnull:  # noqa: PTH123
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            for formatter in ("brief", "json"):
+                for handler_class in (
+                    "logging.StreamHandler",
+                    f"{AsyncStreamHandler.__module__}.{AsyncStreamHandler.__name__}",
+                ):
+                    configure(formatter, handler_class)
+
+                    for threads in (1, 2, 4, 8, 16, 32):
+                        rate = run(threads)
+                        label = f"{formatter}, {handler_class.rsplit('.', 1)[-1]}, threads={threads}"
+                        print(f"{label:<45} {rate:12,.0f} records/s", file=sys.stderr)  # noqa: T201
+
+            logging.shutdown()
+
+        finally:
+            sys.stdout = stdout
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+"""
+Command line tools for log files.
+
+Run: `python -m no_log_tears --help`
+"""
+
+import argparse
+import json
+import logging
+import sys
+import typing as t
+from datetime import datetime
+from pathlib import Path
+
+from no_log_tears.binary import BinaryDecoder, RecordFilter
+from no_log_tears.config import DictConfigurator
+from no_log_tears.index import DEFAULT_BLOCK_SIZE, LogIndex
+from no_log_tears.load import DEFAULT_PROFILE, LoadProfile, run_load
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> int:
+    """Run command line tool."""
+    parser = _create_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        return t.cast(int, args.func(args))
+
+    except BrokenPipeError:
+        # NOTE: output was closed (e.g. piped to `head`), it's ok.
+        return 0
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m no_log_tears", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    read = commands.add_parser("read", help="convert binary log files (see `BinaryFileHandler`) to text")
+    read.add_argument("files", nargs="+", type=Path, help="binary log files (`-` for stdin)")
+    read.add_argument(
+        "-f",
+        "--format",
+        default="json",
+        choices=("json", "brief", "verbose"),
+        help="output formatter from default configuration (default: %(default)s)",
+    )
+    _add_filter_arguments(read)
+    read.set_defaults(func=_read)
+
+    index = commands.add_parser("index", help="build or update sidecar indexes of JSON log files (see `LogIndex`)")
+    index.add_argument("files", nargs="+", type=Path, help="newline-delimited JSON log files")
+    index.add_argument(
+        "--block-size",
+        type=int,
+        default=DEFAULT_BLOCK_SIZE,
+        help="index block size in bytes (default: %(default)s)",
+    )
+    index.set_defaults(func=_index)
+
+    search = commands.add_parser("search", help="search JSON log files using sidecar indexes")
+    search.add_argument("files", nargs="+", type=Path, help="newline-delimited JSON log files")
+    _add_filter_arguments(search)
+    search.add_argument(
+        "--field",
+        action="append",
+        dest="fields",
+        type=_parse_field,
+        metavar="KEY=VALUE",
+        help="top-level field value, JSON or a string (can be repeated)",
+    )
+    search.add_argument(
+        "--no-update",
+        action="store_false",
+        dest="update",
+        help="don't update indexes before search (appended lines are still checked one by one)",
+    )
+    search.set_defaults(func=_search)
+
+    load = commands.add_parser("load", help="generate logging load, report throughput, latency, CPU time and bytes")
+    load.add_argument("--config", type=Path, help="logging configuration file (.json or .yaml), default configuration")
+    load.add_argument("--mode", default=DEFAULT_PROFILE["mode"], choices=("threads", "processes", "asyncio"))
+    load.add_argument("--workers", type=int, default=DEFAULT_PROFILE["workers"], help="number of emitters")
+    load.add_argument("--records", type=int, default=DEFAULT_PROFILE["records"], help="log calls per emitter")
+    load.add_argument(
+        "--level",
+        action="append",
+        dest="levels",
+        type=_parse_level_weight,
+        metavar="LEVEL=WEIGHT",
+        help=f"log call level weight (can be repeated, default: {_format_levels(DEFAULT_PROFILE['levels'])})",
+    )
+    load.add_argument("--extra-fields", type=int, default=DEFAULT_PROFILE["extra_fields"], help="extra fields per call")
+    load.add_argument("--extra-size", type=int, default=DEFAULT_PROFILE["extra_size"], help="extra field value length")
+    load.add_argument(
+        "--context-depth",
+        type=int,
+        default=DEFAULT_PROFILE["context_depth"],
+        help="number of nested bound logger contexts",
+    )
+    load.add_argument(
+        "--exception-rate",
+        type=float,
+        default=DEFAULT_PROFILE["exception_rate"],
+        help="fraction of log calls with exception info",
+    )
+    load.add_argument("--seed", type=int, default=DEFAULT_PROFILE["seed"], help="random seed of the calls mix")
+    load.add_argument("--output", type=Path, help="write results to JSON file")
+    load.set_defaults(func=_load)
+
+    return parser
+
+
+def _add_filter_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--since", type=_parse_time, help="min record time (ISO 8601, local time if no timezone)")
+    parser.add_argument("--until", type=_parse_time, help="max record time (ISO 8601, local time if no timezone)")
+    parser.add_argument("--level", type=_parse_level, help="min record level (name or number)")
+    parser.add_argument(
+        "--logger",
+        action="append",
+        dest="loggers",
+        help="logger name, includes child loggers (can be repeated)",
+    )
+
+
+def _create_filter(args: argparse.Namespace) -> RecordFilter:
+    return RecordFilter(since=args.since, until=args.until, level=args.level, loggers=args.loggers)
+
+
+def _create_formatter(name: str) -> logging.Formatter:
+    formatters = DictConfigurator.create_default()["formatters"]
+    assert isinstance(formatters, dict)
+
+    configurator = DictConfigurator({"version": 1, "formatters": formatters})
+    return t.cast(logging.Formatter, configurator.configure_formatter(formatters[name]))
+
+
+def _read(args: argparse.Namespace) -> int:
+    formatter = _create_formatter(args.format)
+    record_filter = _create_filter(args)
+    write = sys.stdout.write
+
+    for path in args.files:
+        decoder = BinaryDecoder(record_filter)
+
+        with _open_binary(path) as stream:
+            for record in decoder.decode_stream(stream):
+                write(formatter.format(record))
+                write("\n")
+
+    return 0
+
+
+def _index(args: argparse.Namespace) -> int:
+    for path in args.files:
+        count = LogIndex(path, block_size=args.block_size).update()
+        sys.stdout.write(f"{path}: {count} new lines indexed\n")
+
+    return 0
+
+
+def _search(args: argparse.Namespace) -> int:
+    record_filter = _create_filter(args)
+    fields = dict(args.fields or ())
+    write = sys.stdout.write
+
+    for path in args.files:
+        index = LogIndex(path)
+        if args.update:
+            index.update()
+
+        for line in index.search(record_filter, fields):
+            write(line)
+            write("\n")
+
+    return 0
+
+
+def _load(args: argparse.Namespace) -> int:
+    profile: LoadProfile = {
+        "mode": args.mode,
+        "workers": args.workers,
+        "records": args.records,
+        "levels": dict(args.levels) if args.levels else DEFAULT_PROFILE["levels"],
+        "extra_fields": args.extra_fields,
+        "extra_size": args.extra_size,
+        "context_depth": args.context_depth,
+        "exception_rate": args.exception_rate,
+        "seed": args.seed,
+    }
+    results = run_load(profile, _read_config(args.config) if args.config is not None else None)
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    latency = t.cast(dict[str, float], results["latency_us"])
+    cpu = t.cast(dict[str, float], results["cpu_s"])
+    sys.stdout.write(
+        f"records: {results['records']} in {results['duration_s']:.3f} s ({results['throughput_rps']:,.0f} records/s)\n"
+        f"latency: p50 {latency['p50']:.1f} us, p99 {latency['p99']:.1f} us, p999 {latency['p999']:.1f} us, "
+        f"max {latency['max']:.1f} us\n"
+        f"cpu: user {cpu['user']:.3f} s, system {cpu['system']:.3f} s\n"
+        f"written: {results['bytes_written']} bytes ({results['bytes_per_record']:.1f} bytes/record)\n"
+    )
+
+    return 0
+
+
+def _read_config(path: Path) -> dict[str, object]:
+    if path.suffix in {".yml", ".yaml"}:
+        import yaml
+
+        return t.cast(dict[str, object], yaml.safe_load(path.read_text()))
+
+    return t.cast(dict[str, object], json.loads(path.read_text()))
+
+
+def _open_binary(path: Path) -> t.BinaryIO:
+    if str(path) == "-":
+        # NOTE: don't close stdin on exit from `with` block.
+        return open(sys.stdin.fileno(), "rb", closefd=False)
+
+    return path.open("rb")
+
+
+def _parse_time(value: str) -> float:
+    # NOTE: `datetime.fromisoformat` supports `Z` suffix only since python 3.11.
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def _parse_field(value: str) -> tuple[str, object]:
+    key, sep, raw = value.partition("=")
+    if not sep or not key:
+        msg = f"expected KEY=VALUE: {value}"
+        raise argparse.ArgumentTypeError(msg)
+
+    try:
+        return key, json.loads(raw)
+
+    except ValueError:
+        return key, raw
+
+
+def _parse_level_weight(value: str) -> tuple[int, float]:
+    level, sep, weight = value.partition("=")
+    try:
+        return _parse_level(level), float(weight) if sep else 1.0
+
+    except (ValueError, argparse.ArgumentTypeError) as err:
+        msg = f"expected LEVEL=WEIGHT: {value}"
+        raise argparse.ArgumentTypeError(msg) from err
+
+
+def _format_levels(levels: t.Mapping[t.Union[str, int], float]) -> str:
+    return " ".join(f"{level}={weight:g}" for level, weight in levels.items())
+
+
+def _parse_level(value: str) -> int:
+    if value.isdigit():
+        return int(value)
+
+    level = logging.getLevelName(value.upper())
+    if not isinstance(level, int):
+        msg = f"unknown level: {value}"
+        raise argparse.ArgumentTypeError(msg)
+
+    return level
+
+
+if __name__ == "__main__":
+    sys.exit(main())
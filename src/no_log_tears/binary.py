@@ -0,0 +1,523 @@
+"""
+Compact binary encoding of log records.
+
+Binary log stream is a sequence of frames, each frame is prefixed with its length (varint). Frame types:
+
+    * header -- magic bytes & format version, resets the stream state (interned strings & time base). Each stream
+      starts with a header frame.
+    * string -- interned string definition: id (varint) and UTF-8 bytes. Logger names, message templates, record field
+      names and repeated field values (path, function, thread & process names) are interned, so each of them is
+      written once per stream and records refer to them by id.
+    * record -- log record: time (zigzag varint delta from the previous record time in microseconds), level (varint),
+      logger name & message template ids, message args and other record fields with typed values.
+
+Typed values: `None`, `bool`, `int` (zigzag varint), `float` (8 bytes), `str`, lists, tuples and dicts. Other objects
+are converted the same way `JSONFormatter` does (see `DEFAULT_ADAPTERS` and `SupportsLog`), otherwise `str` is used.
+
+Decoded records can be formatted with any formatter (e.g. `JSONFormatter` or `SoftFormatter`), record `created` time
+has microsecond precision, `exc_info` is not kept (`exc_text` is written instead).
+"""
+
+import logging
+import os
+import struct
+import typing as t
+
+from no_log_tears.formatter.json import DEFAULT_ADAPTERS, LogAdapter, SupportsLog
+from no_log_tears.formatter.traceback import TracebackFormatter
+
+MAGIC: t.Final[bytes] = b"NLTB"
+VERSION: t.Final[int] = 1
+
+_FRAME_HEADER: t.Final[int] = 0
+_FRAME_STRING: t.Final[int] = 1
+_FRAME_RECORD: t.Final[int] = 2
+
+_VALUE_NONE: t.Final[int] = 0
+_VALUE_FALSE: t.Final[int] = 1
+_VALUE_TRUE: t.Final[int] = 2
+_VALUE_INT: t.Final[int] = 3
+_VALUE_FLOAT: t.Final[int] = 4
+_VALUE_STR: t.Final[int] = 5
+_VALUE_REF: t.Final[int] = 6
+_VALUE_LIST: t.Final[int] = 7
+_VALUE_DICT: t.Final[int] = 8
+_VALUE_TUPLE: t.Final[int] = 9
+
+_FLOAT: t.Final[struct.Struct] = struct.Struct("<d")
+_MAX_DEPTH: t.Final[int] = 32
+
+# NOTE: these fields are written in record frame header or can be derived from other fields.
+_SKIPPED_FIELDS: t.Final[frozenset[str]] = frozenset(
+    {
+        "args",
+        "asctime",
+        "created",
+        "exc_info",
+        "filename",
+        "levelno",
+        "message",
+        "module",
+        "msecs",
+        "msg",
+        "name",
+    }
+)
+# NOTE: values of these fields are usually repeated across records.
+_INTERNED_FIELDS: t.Final[frozenset[str]] = frozenset(
+    {"funcName", "levelname", "pathname", "processName", "taskName", "threadName"}
+)
+
+
+class BinaryDecodeError(ValueError):
+    """Raised when binary log stream can't be decoded."""
+
+
+class BinaryEncoder:
+    """
+    Encodes log records into binary frames.
+
+    Encoder keeps the stream state (interned strings & the previous record time), so the frames must be written to
+    the same stream in the same order. `header` starts a new stream (or resets the state of the current one). When
+    `max_interned` strings are interned, the state is reset (a header frame is written before the next record).
+    """
+
+    def __init__(
+        self,
+        max_interned: int = 65536,
+        traceback_tail: t.Optional[int] = None,
+        adapters: t.Optional[t.Mapping[type[object], LogAdapter]] = None,
+    ) -> None:
+        """BinaryEncoder constructor."""
+        self.__max_interned = max_interned
+        self.__traceback = TracebackFormatter(traceback_tail=traceback_tail)
+        self.__adapters = {**DEFAULT_ADAPTERS, **(adapters or {})}
+        # NOTE: interned strings are mapped to their encoded varint ids, so ids are not encoded for each record.
+        self.__strings: dict[str, bytes] = {}
+        self.__last_time = 0
+
+    def header(self) -> bytes:
+        """Reset the stream state and return the header frame."""
+        self.__strings.clear()
+        self.__last_time = 0
+
+        frame = bytearray((_FRAME_HEADER,))
+        frame += MAGIC
+        _write_varint(frame, VERSION)
+
+        buf = bytearray()
+        _write_frame(buf, frame)
+
+        return bytes(buf)
+
+    def encode(self, record: logging.LogRecord) -> bytes:
+        """Return frames of the record (preceded by new interned strings frames)."""
+        buf = bytearray(self.header()) if len(self.__strings) >= self.__max_interned else bytearray()
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.__traceback.formatException(record.exc_info)
+
+        time_us = round(record.created * 1_000_000)
+
+        frame = bytearray((_FRAME_RECORD,))
+        _write_varint(frame, _zigzag(time_us - self.__last_time))
+        _write_varint(frame, record.levelno)
+        frame += self.__ref(buf, record.name)
+        frame += self.__ref(buf, record.msg if isinstance(record.msg, str) else str(record.msg))
+        self.__write_value(buf, frame, record.args, record.levelno, 0)
+
+        fields = [(key, value) for key, value in record.__dict__.items() if key not in _SKIPPED_FIELDS]
+        _write_varint(frame, len(fields))
+
+        for key, value in fields:
+            frame += self.__ref(buf, key)
+
+            value_type = type(value)
+            # NOTE: the most common value types are encoded inline, without `__write_value` call.
+            if value_type is str:
+                if key in _INTERNED_FIELDS:
+                    frame.append(_VALUE_REF)
+                    frame += self.__ref(buf, value)
+
+                else:
+                    data = value.encode(errors="surrogateescape")
+                    frame.append(_VALUE_STR)
+                    _write_varint(frame, len(data))
+                    frame += data
+
+            elif value_type is int:
+                frame.append(_VALUE_INT)
+                _write_varint(frame, _zigzag(value))
+
+            else:
+                self.__write_value(buf, frame, value, record.levelno, 0)
+
+        _write_frame(buf, frame)
+        self.__last_time = time_us
+
+        return bytes(buf)
+
+    def __ref(self, buf: bytearray, value: str) -> bytes:
+        ref = self.__strings.get(value)
+
+        if ref is None:
+            encoded = bytearray()
+            _write_varint(encoded, len(self.__strings))
+            ref = self.__strings[value] = bytes(encoded)
+
+            frame = bytearray((_FRAME_STRING,))
+            frame += ref
+            frame += value.encode(errors="surrogateescape")
+            _write_frame(buf, frame)
+
+        return ref
+
+    # NOTE: ignore C901, because values are dispatched by type in a single place.
+    def __write_value(  # noqa: C901
+        self,
+        buf: bytearray,
+        frame: bytearray,
+        value: object,
+        level: int,
+        depth: int,
+    ) -> None:
+        if value is None:
+            frame.append(_VALUE_NONE)
+
+        elif value is True:
+            frame.append(_VALUE_TRUE)
+
+        elif value is False:
+            frame.append(_VALUE_FALSE)
+
+        elif isinstance(value, str):
+            data = value.encode(errors="surrogateescape")
+            frame.append(_VALUE_STR)
+            _write_varint(frame, len(data))
+            frame += data
+
+        elif isinstance(value, int):
+            frame.append(_VALUE_INT)
+            _write_varint(frame, _zigzag(int(value)))
+
+        elif isinstance(value, float):
+            frame.append(_VALUE_FLOAT)
+            frame += _FLOAT.pack(value)
+
+        elif depth >= _MAX_DEPTH:
+            self.__write_value(buf, frame, "...", level, depth)
+
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            frame.append(_VALUE_TUPLE if isinstance(value, tuple) else _VALUE_LIST)
+            _write_varint(frame, len(value))
+            for item in value:
+                self.__write_value(buf, frame, item, level, depth + 1)
+
+        elif isinstance(value, dict):
+            frame.append(_VALUE_DICT)
+            _write_varint(frame, len(value))
+            for key, item in value.items():
+                frame += self.__ref(buf, key if isinstance(key, str) else str(key))
+                self.__write_value(buf, frame, item, level, depth + 1)
+
+        else:
+            self.__write_value(buf, frame, self.__adapt(value, level), level, depth + 1)
+
+    def __adapt(self, value: object, level: int) -> object:
+        for base in type(value).__mro__:
+            adapter = self.__adapters.get(base)
+            if adapter is not None:
+                return adapter(value, level)
+
+        if hasattr(value, "__log__"):
+            return t.cast(SupportsLog, value).__log__(level)
+
+        return str(value)
+
+
+class RecordFilter:
+    """Filters records by time range (`since` / `until` timestamps), min level and logger names (with children)."""
+
+    def __init__(
+        self,
+        since: t.Optional[float] = None,
+        until: t.Optional[float] = None,
+        level: t.Optional[int] = None,
+        loggers: t.Optional[t.Sequence[str]] = None,
+    ) -> None:
+        """RecordFilter constructor."""
+        self.__since = round(since * 1_000_000) if since is not None else None
+        self.__until = round(until * 1_000_000) if until is not None else None
+        self.__level = level
+        self.__loggers = tuple(loggers) if loggers else None
+        self.__prefixes = tuple(f"{name}." for name in loggers) if loggers else None
+        self.__names: dict[str, bool] = {}
+
+    def match(self, time_us: int, level: int, name: str) -> bool:
+        """Check record time (in microseconds), level and logger name."""
+        if self.__level is not None and level < self.__level:
+            return False
+
+        if self.__since is not None and time_us < self.__since:
+            return False
+
+        if self.__until is not None and time_us > self.__until:
+            return False
+
+        return self.match_name(name)
+
+    def match_level(self, level: int) -> bool:
+        """Check record level."""
+        return self.__level is None or level >= self.__level
+
+    def match_time_range(self, min_time_us: int, max_time_us: int) -> bool:
+        """Check if records of the time range (in microseconds) may match."""
+        return (self.__since is None or max_time_us >= self.__since) and (
+            self.__until is None or min_time_us <= self.__until
+        )
+
+    def match_name(self, name: str) -> bool:
+        """Check logger name."""
+        if self.__loggers is None or self.__prefixes is None:
+            return True
+
+        matched = self.__names.get(name)
+        if matched is None:
+            matched = self.__names[name] = name in self.__loggers or name.startswith(self.__prefixes)
+
+        return matched
+
+
+class BinaryDecoder:
+    """
+    Decodes binary frames into log records.
+
+    Records that don't match `record_filter` are skipped without decoding of their fields. Incomplete frame at the end
+    of the stream (e.g. the process was killed during write) is ignored.
+    """
+
+    def __init__(self, record_filter: t.Optional[RecordFilter] = None) -> None:
+        """BinaryDecoder constructor."""
+        self.__filter = record_filter
+        self.__strings = list[str]()
+        self.__last_time = 0
+        self.__has_header = False
+        self.__readers: dict[int, t.Callable[[bytes, int], tuple[object, int]]] = {
+            _VALUE_NONE: lambda _, offset: (None, offset),
+            _VALUE_FALSE: lambda _, offset: (False, offset),
+            _VALUE_TRUE: lambda _, offset: (True, offset),
+            _VALUE_INT: self.__read_int,
+            _VALUE_FLOAT: self.__read_float,
+            _VALUE_STR: self.__read_str,
+            _VALUE_REF: self.__read_ref,
+            _VALUE_LIST: self.__read_list,
+            _VALUE_TUPLE: self.__read_tuple,
+            _VALUE_DICT: self.__read_dict,
+        }
+
+    def decode_stream(self, stream: t.BinaryIO, chunk_size: int = 1024 * 1024) -> t.Iterator[logging.LogRecord]:
+        """Read frames from binary stream and decode log records."""
+        data = b""
+
+        while chunk := stream.read(chunk_size):
+            data = data + chunk if data else chunk
+            offset = yield from self.decode(data)
+            data = data[offset:]
+
+    def decode(self, data: bytes) -> t.Generator[logging.LogRecord, None, int]:
+        """Decode log records from complete frames in data, return the offset after the last complete frame."""
+        offset = 0
+        size = len(data)
+
+        while offset < size:
+            try:
+                length, start = _read_varint(data, offset)
+
+            except IndexError:
+                break
+
+            end = start + length
+            if end > size:
+                break
+
+            record = self.__decode_frame(data, start, end)
+            if record is not None:
+                yield record
+
+            offset = end
+
+        return offset
+
+    def __decode_frame(self, data: bytes, start: int, end: int) -> t.Optional[logging.LogRecord]:
+        frame_type = data[start]
+
+        if frame_type == _FRAME_HEADER:
+            if data[start + 1 : start + 1 + len(MAGIC)] != MAGIC:
+                msg = "invalid binary log header"
+                raise BinaryDecodeError(msg, start)
+
+            self.__strings.clear()
+            self.__last_time = 0
+            self.__has_header = True
+
+            return None
+
+        if not self.__has_header:
+            msg = "binary log stream must start with header"
+            raise BinaryDecodeError(msg, start)
+
+        if frame_type == _FRAME_STRING:
+            ref, offset = _read_varint(data, start + 1)
+            if ref != len(self.__strings):
+                msg = "unexpected interned string id"
+                raise BinaryDecodeError(msg, ref, len(self.__strings))
+
+            self.__strings.append(data[offset:end].decode(errors="surrogateescape"))
+            return None
+
+        if frame_type == _FRAME_RECORD:
+            return self.__decode_record(data, start + 1)
+
+        msg = "unknown binary log frame type"
+        raise BinaryDecodeError(msg, frame_type, start)
+
+    def __decode_record(self, data: bytes, offset: int) -> t.Optional[logging.LogRecord]:
+        strings = self.__strings
+
+        delta, offset = _read_varint(data, offset)
+        time_us = self.__last_time = self.__last_time + _unzigzag(delta)
+        level, offset = _read_varint(data, offset)
+        name_ref, offset = _read_varint(data, offset)
+        name = strings[name_ref]
+
+        if self.__filter is not None and not self.__filter.match(time_us, level, name):
+            return None
+
+        msg_ref, offset = _read_varint(data, offset)
+        args, offset = self.__read_value(data, offset)
+
+        created = time_us / 1_000_000
+        values: dict[str, object] = {
+            "name": name,
+            "msg": strings[msg_ref],
+            "args": args,
+            "levelname": logging.getLevelName(level),
+            "levelno": level,
+            "pathname": "",
+            "lineno": 0,
+            "funcName": None,
+            "created": created,
+            "msecs": (created - int(created)) * 1000,
+            "relativeCreated": 0.0,
+            "exc_info": None,
+            "exc_text": None,
+            "stack_info": None,
+            "thread": None,
+            "threadName": None,
+            "processName": None,
+            "process": None,
+        }
+
+        count, offset = _read_varint(data, offset)
+        for _ in range(count):
+            key_ref, offset = _read_varint(data, offset)
+            values[strings[key_ref]], offset = self.__read_value(data, offset)
+
+        pathname = values["pathname"]
+        if isinstance(pathname, str):
+            filename = os.path.basename(pathname)  # noqa: PTH119
+            values["filename"] = filename
+            values["module"] = os.path.splitext(filename)[0]  # noqa: PTH122
+
+        else:
+            # NOTE: the same values as `logging.LogRecord` sets for invalid path.
+            values["filename"] = pathname
+            values["module"] = "Unknown module"
+
+        record = logging.LogRecord.__new__(logging.LogRecord)
+        record.__dict__.update(values)
+
+        return record
+
+    def __read_value(self, data: bytes, offset: int) -> tuple[object, int]:
+        tag = data[offset]
+        reader = self.__readers.get(tag)
+
+        if reader is None:
+            msg = "unknown binary log value type"
+            raise BinaryDecodeError(msg, tag, offset)
+
+        return reader(data, offset + 1)
+
+    def __read_str(self, data: bytes, offset: int) -> tuple[object, int]:
+        length, offset = _read_varint(data, offset)
+        return data[offset : offset + length].decode(errors="surrogateescape"), offset + length
+
+    def __read_ref(self, data: bytes, offset: int) -> tuple[object, int]:
+        ref, offset = _read_varint(data, offset)
+        return self.__strings[ref], offset
+
+    def __read_int(self, data: bytes, offset: int) -> tuple[object, int]:
+        value, offset = _read_varint(data, offset)
+        return _unzigzag(value), offset
+
+    def __read_float(self, data: bytes, offset: int) -> tuple[object, int]:
+        return _FLOAT.unpack_from(data, offset)[0], offset + _FLOAT.size
+
+    def __read_list(self, data: bytes, offset: int) -> tuple[object, int]:
+        length, offset = _read_varint(data, offset)
+        items = list[object]()
+        for _ in range(length):
+            item, offset = self.__read_value(data, offset)
+            items.append(item)
+
+        return items, offset
+
+    def __read_tuple(self, data: bytes, offset: int) -> tuple[object, int]:
+        items, offset = self.__read_list(data, offset)
+        return tuple(t.cast(list[object], items)), offset
+
+    def __read_dict(self, data: bytes, offset: int) -> tuple[object, int]:
+        length, offset = _read_varint(data, offset)
+        mapping: dict[str, object] = {}
+        for _ in range(length):
+            key_ref, offset = _read_varint(data, offset)
+            mapping[self.__strings[key_ref]], offset = self.__read_value(data, offset)
+
+        return mapping, offset
+
+
+def _zigzag(value: int) -> int:
+    return value << 1 if value >= 0 else ((-value) << 1) - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+def _write_varint(buf: bytearray, value: int) -> None:
+    while value >= 0x80:  # noqa: PLR2004
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+
+    buf.append(value)
+
+
+def _read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+
+    while True:
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+
+        if byte < 0x80:  # noqa: PLR2004
+            return result, offset
+
+        shift += 7
+
+
+def _write_frame(buf: bytearray, frame: bytearray) -> None:
+    _write_varint(buf, len(frame))
+    buf += frame
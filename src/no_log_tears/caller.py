@@ -0,0 +1,182 @@
+"""Caller info (`pathname`, `lineno`, `funcName` record fields) lookup modes for loggers."""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+import sys
+import traceback
+import typing as t
+
+if t.TYPE_CHECKING:
+    from types import FrameType
+
+CallerMode = t.Literal["full", "frame", "off"]
+"""
+Caller info lookup mode.
+
+* `full` -- builtin `logging` behavior, walk the stack to find the first frame outside of logging modules.
+* `frame` -- take the frame at fixed depth (computed once for `no_log_tears.Logger` calls), fallback to `full` if the
+  frame at that depth doesn't look like a caller of logging method (e.g. direct `logging.Logger` calls).
+* `off` -- don't look up the caller, record gets `(unknown file)`, `0` and `(unknown function)` values.
+"""
+
+CALLER_MODES: t.Final[frozenset[str]] = frozenset(t.get_args(CallerMode))
+
+_UNKNOWN_CALLER: t.Final[tuple[str, int, str, None]] = ("(unknown file)", 0, "(unknown function)", None)
+_INTERNAL_FILES: t.Final[frozenset[str]] = frozenset(
+    {
+        logging.addLevelName.__code__.co_filename,
+        __file__,
+        os.path.join(os.path.dirname(__file__), "logger.py"),  # noqa: PTH118,PTH120
+    }
+)
+_ROOT_NAME: t.Final[str] = "root"
+
+_modes: dict[str, CallerMode] = {}
+# NOTE: cache is filled without locks: concurrent writes of the same logger name store the same mode.
+_resolved_modes: dict[str, CallerMode] = {}
+_frame_depth: t.Optional[int] = None
+_base_find_caller = logging.Logger.findCaller
+
+
+def set_caller_modes(modes: t.Mapping[str, t.Optional[CallerMode]]) -> None:
+    """
+    Set caller info lookup modes by logger names (mode is applied to the logger and its descendants).
+
+    Previously set modes are reset. Builtin `logging.Logger.findCaller` method is patched only if at least one
+    non-`full` mode is set.
+    """
+    global _frame_depth  # noqa: PLW0603
+
+    _modes.clear()
+    _modes.update({name or _ROOT_NAME: mode for name, mode in modes.items() if mode is not None})
+    _resolved_modes.clear()
+
+    if any(mode != "full" for mode in _modes.values()):
+        if _frame_depth is None and "frame" in _modes.values():
+            _frame_depth = _calibrate_frame_depth()
+
+        logging.Logger.findCaller = _find_caller  # type: ignore[method-assign]
+
+    else:
+        logging.Logger.findCaller = _base_find_caller  # type: ignore[method-assign]
+
+
+def get_caller_mode(name: str) -> CallerMode:
+    """Get caller info lookup mode for logger (mode of the nearest configured ancestor or `full`)."""
+    mode = _resolved_modes.get(name)
+
+    if mode is None:
+        mode = _resolved_modes[name] = _resolve_mode(name)
+
+    return mode
+
+
+def _resolve_mode(name: str) -> CallerMode:
+    parts = name.split(".")
+
+    for i in range(len(parts), 0, -1):
+        mode = _modes.get(".".join(parts[:i]))
+        if mode is not None:
+            return mode
+
+    return _modes.get(_ROOT_NAME, "full")
+
+
+# NOTE: ignore FBT002, because this is a `logging.Logger.findCaller` method patch.
+def _find_caller(
+    self: logging.Logger,
+    stack_info: bool = False,  # noqa: FBT001,FBT002
+    stacklevel: int = 1,
+) -> tuple[str, int, str, t.Optional[str]]:
+    mode = _resolved_modes.get(self.name) or get_caller_mode(self.name)
+
+    if not stack_info and stacklevel == 1:
+        if mode == "off":
+            return _UNKNOWN_CALLER
+
+        if mode == "frame" and _frame_depth is not None:
+            try:
+                below = sys._getframe(_frame_depth - 1)  # noqa: SLF001
+
+            except ValueError:
+                pass
+
+            else:
+                frame = below.f_back
+                if (
+                    frame is not None
+                    and below.f_code.co_filename in _INTERNAL_FILES
+                    and frame.f_code.co_filename not in _INTERNAL_FILES
+                ):
+                    return frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name, None
+
+    return _walk_caller(sys._getframe(1), stack_info, stacklevel)  # noqa: SLF001
+
+
+def _walk_caller(
+    frame: t.Optional[FrameType],
+    stack_info: bool,  # noqa: FBT001
+    stacklevel: int,
+) -> tuple[str, int, str, t.Optional[str]]:
+    while frame is not None:
+        if frame.f_code.co_filename not in _INTERNAL_FILES:
+            stacklevel -= 1
+            if stacklevel <= 0 or frame.f_back is None:
+                break
+
+        frame = frame.f_back
+
+    if frame is None:
+        return _UNKNOWN_CALLER
+
+    sinfo = None
+    if stack_info:
+        with io.StringIO() as sio:
+            sio.write("Stack (most recent call last):\n")
+            traceback.print_stack(frame, file=sio)
+            sinfo = sio.getvalue().removesuffix("\n")
+
+    return frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name, sinfo
+
+
+def _calibrate_frame_depth() -> t.Optional[int]:
+    # NOTE: import here to avoid circular imports, logger module depends on config module.
+    from no_log_tears.logger import Logger
+
+    depth: t.Optional[int] = None
+
+    # NOTE: ignore FBT001, because this is a `logging.Logger.findCaller` method replacement.
+    def probe_find_caller(
+        stack_info: bool = False,  # noqa: ARG001,FBT001,FBT002
+        stacklevel: int = 1,  # noqa: ARG001
+    ) -> tuple[str, int, str, t.Optional[str]]:
+        nonlocal depth
+
+        frame: t.Optional[FrameType] = sys._getframe(0)  # noqa: SLF001
+        for i in range(32):
+            if frame is None:
+                break
+
+            if frame.f_code is probe_call.__code__:
+                depth = i
+                break
+
+            frame = frame.f_back
+
+        return _UNKNOWN_CALLER
+
+    # NOTE: probe logger is not registered in logging manager, so it doesn't affect the logger hierarchy.
+    probe = logging.Logger(f"{__name__}.probe", logging.DEBUG)  # noqa: LOG001
+    probe.propagate = False
+    probe.addHandler(logging.NullHandler())
+    probe.findCaller = probe_find_caller  # type: ignore[method-assign]
+
+    def probe_call() -> None:
+        Logger(probe).info("probe")
+
+    probe_call()
+
+    return depth
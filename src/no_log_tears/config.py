@@ -1,18 +1,38 @@
 """Basic configuration for logging."""
 
 import logging
+import logging.handlers
 import os
+import re
 import typing as t
 from logging.config import DictConfigurator as BaseDictConfigurator
 
 from typing_extensions import override
 
+from no_log_tears.caller import CALLER_MODES, CallerMode, set_caller_modes
+from no_log_tears.dispatch import set_handler_dispatch
 from no_log_tears.formatter.json import JSONFormatter
 from no_log_tears.formatter.soft import SoftFormatter
 
 LoggingLevelName = t.Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 LoggingLevelOrName = t.Union[int, LoggingLevelName]
 
+# NOTE: `logging.LogRecord` fields that are collected only if the appropriate `logging` module flag is set.
+_RECORD_FIELD_COLLECTORS: t.Final[t.Mapping[str, t.Collection[str]]] = {
+    "logThreads": ("thread", "threadName"),
+    "logProcesses": ("process",),
+    "logMultiprocessing": ("processName",),
+    "logAsyncioTasks": ("taskName",),
+}
+
+# NOTE: these handlers pass the whole record further (to a queue, buffer or network), so all fields may be used.
+_RECORD_PASSING_HANDLERS: t.Final[tuple[type[logging.Handler], ...]] = (
+    logging.handlers.QueueHandler,
+    logging.handlers.BufferingHandler,
+    logging.handlers.SocketHandler,
+    logging.handlers.HTTPHandler,
+)
+
 
 def is_autoload_enabled() -> bool:
     """
@@ -41,6 +61,60 @@ def is_patch_enabled() -> bool:
     return int(os.getenv("LOGGING__PATCH", "1")) > 0
 
 
+def get_used_record_fields(handler: logging.Handler) -> t.Optional[frozenset[str]]:
+    """
+    Return log record fields that are used by handler (by its formatter).
+
+    Returns `None` if it can't be determined or all fields may be used (e.g. `__other__` in `SoftFormatter` format or
+    `JSONFormatter` dumps all fields).
+    """
+    if isinstance(handler, _RECORD_PASSING_HANDLERS):
+        return None
+
+    formatter = handler.formatter if handler.formatter is not None else logging.Formatter()
+
+    if isinstance(formatter, (SoftFormatter, JSONFormatter)):
+        return formatter.used_fields
+
+    formatter_type = type(formatter)
+    if (
+        formatter_type.format is logging.Formatter.format
+        and formatter_type.formatMessage is logging.Formatter.formatMessage
+        # NOTE: only `%` style is checked, other formatting styles are treated conservatively.
+        and type(formatter._style) is logging.PercentStyle  # noqa: SLF001
+        and isinstance(formatter._fmt, str)  # noqa: SLF001
+    ):
+        return frozenset(re.findall(r"%\((?P<field>\w+)\)", formatter._fmt))  # noqa: SLF001
+
+    return None
+
+
+def disable_unused_record_fields() -> None:
+    """
+    Disable collection of `logging.LogRecord` fields that are not used by handlers of any existing logger.
+
+    Affects `logging.logThreads`, `logging.logProcesses`, `logging.logMultiprocessing` and `logging.logAsyncioTasks`
+    flags: the flag is set only if at least one handler uses the appropriate fields (thread, process, process name and
+    asyncio task name lookups are skipped for each record otherwise). Handlers that are added later are not taken into
+    account.
+    """
+    loggers = [logging.getLogger()] + [
+        logger for logger in logging.Logger.manager.loggerDict.values() if isinstance(logger, logging.Logger)
+    ]
+
+    used_fields = set[str]()
+    for handler in {handler for logger in loggers for handler in logger.handlers}:
+        handler_fields = get_used_record_fields(handler)
+        if handler_fields is None:
+            return
+
+        used_fields.update(handler_fields)
+
+    for flag, fields in _RECORD_FIELD_COLLECTORS.items():
+        if hasattr(logging, flag):
+            setattr(logging, flag, not used_fields.isdisjoint(fields))
+
+
 class DictConfigurator(BaseDictConfigurator):
     """
     Logging configuration based on dict.
@@ -73,12 +147,19 @@ class DictConfigurator(BaseDictConfigurator):
 
         Default configuration can be overridden by providing custom values or environment variables.
 
+        Root logger and loggers accept `caller` option -- caller info lookup mode (`full`, `frame` or `off`), see
+        `no_log_tears.caller.CallerMode`.
+
         Environment variables:
 
             * `LOGGING__FORMATTER` -- default formatter name, (default `brief`)
             * `LOGGING__HANDLER` -- default handler name, (default `console`)
             * `LOGGING__LEVEL` -- default root logger level, (default `WARNING`)
             * `LOGGING__TRACEBACK` -- default traceback tail length, (default `100`)
+            * `LOGGING__DISABLE_UNUSED_RECORD_FIELDS` -- disable collection of record fields (thread, process, etc.)
+              that are not used by configured handlers, see `disable_unused_record_fields` (default `0`)
+            * `LOGGING__FLATTEN_HANDLERS` -- precompute handlers of the logger hierarchy for each logger, see
+              `no_log_tears.dispatch.set_handler_dispatch` (default `0`)
         """
         return {
             "version": 1,
@@ -142,6 +223,8 @@ class DictConfigurator(BaseDictConfigurator):
             "incremental": False,
             "disable_existing_loggers": False,
             "capture_warnings": True,
+            "disable_unused_record_fields": int(os.getenv("LOGGING__DISABLE_UNUSED_RECORD_FIELDS", "0")) > 0,
+            "flatten_handlers": int(os.getenv("LOGGING__FLATTEN_HANDLERS", "0")) > 0,
         }
 
     def __init__(
@@ -168,5 +251,35 @@ class DictConfigurator(BaseDictConfigurator):
     def configure(self) -> None:
         """Apply logging configuration."""
         config: t.Mapping[str, object] = self.config  # type: ignore[attr-defined]
+        caller_modes = self.__get_caller_modes(config)
+
         logging.captureWarnings(bool(config.get("capture_warnings", False)))
         super().configure()
+
+        if config.get("disable_unused_record_fields", False):
+            disable_unused_record_fields()
+
+        if not config.get("incremental", False):
+            set_caller_modes(caller_modes)
+            set_handler_dispatch(bool(config.get("flatten_handlers", False)))
+
+    def __get_caller_modes(self, config: t.Mapping[str, object]) -> dict[str, t.Optional[CallerMode]]:
+        root = config.get("root")
+        loggers = config.get("loggers")
+
+        modes: dict[str, t.Optional[CallerMode]] = {}
+
+        if isinstance(root, t.Mapping):
+            modes[""] = root.get("caller")
+
+        if isinstance(loggers, t.Mapping):
+            modes.update(
+                (name, logger.get("caller")) for name, logger in loggers.items() if isinstance(logger, t.Mapping)
+            )
+
+        for name, mode in modes.items():
+            if mode is not None and mode not in CALLER_MODES:
+                msg = "invalid caller mode"
+                raise ValueError(msg, name, mode)
+
+        return modes
@@ -0,0 +1,116 @@
+"""Flattened handler dispatch: per-logger precomputed handlers of the logger hierarchy."""
+
+import logging
+import typing as t
+
+# NOTE: logger attributes that affect the set of handlers that are called for the logger records.
+_DISPATCH_ATTRS: t.Final[frozenset[str]] = frozenset({"handlers", "parent", "propagate"})
+
+_base_call_handlers = logging.Logger.callHandlers
+_base_add_handler = logging.Logger.addHandler
+_base_remove_handler = logging.Logger.removeHandler
+_base_setattr = logging.Logger.__setattr__
+
+_generation = 0
+_tables: dict[logging.Logger, tuple[int, tuple[logging.Handler, ...]]] = {}
+
+
+def set_handler_dispatch(enabled: bool) -> None:  # noqa: FBT001
+    """
+    Enable / disable flattened handler dispatch.
+
+    When enabled, `logging.Logger.callHandlers` calls handlers from precomputed per-logger tuple (handlers of the
+    logger and its ancestors up to the first non-propagating logger) in a single loop, instead of walking the logger
+    hierarchy for each record. Tables for existing loggers are computed immediately, for other loggers -- on the first
+    record.
+
+    Tables are invalidated when handlers are added / removed (`addHandler`, `removeHandler`), when `handlers`,
+    `propagate` or `parent` attribute of any logger is set (e.g. a new logger is inserted into the hierarchy) and on
+    `invalidate_handler_dispatch` call. In-place modifications of `logger.handlers` list are not tracked. Handler levels
+    and filters are checked for each record, as usual.
+    """
+    if enabled:
+        logging.Logger.callHandlers = _call_handlers  # type: ignore[method-assign]
+        logging.Logger.addHandler = _add_handler  # type: ignore[method-assign]
+        logging.Logger.removeHandler = _remove_handler  # type: ignore[method-assign]
+        logging.Logger.__setattr__ = _setattr  # type: ignore[method-assign,assignment]
+
+        invalidate_handler_dispatch()
+        for logger in _iter_loggers():
+            _get_handlers(logger)
+
+    else:
+        logging.Logger.callHandlers = _base_call_handlers  # type: ignore[method-assign]
+        logging.Logger.addHandler = _base_add_handler  # type: ignore[method-assign]
+        logging.Logger.removeHandler = _base_remove_handler  # type: ignore[method-assign]
+        logging.Logger.__setattr__ = _base_setattr  # type: ignore[method-assign]
+
+        invalidate_handler_dispatch()
+
+
+def invalidate_handler_dispatch() -> None:
+    """Invalidate precomputed handler tables of all loggers (e.g. after in-place `logger.handlers` modification)."""
+    global _generation  # noqa: PLW0603
+
+    _generation += 1
+    _tables.clear()
+
+
+def _iter_loggers() -> t.Iterator[logging.Logger]:
+    yield logging.getLogger()
+    # NOTE: copy values, because logger dict may be modified by other threads.
+    for logger in list(logging.Logger.manager.loggerDict.values()):
+        if isinstance(logger, logging.Logger):
+            yield logger
+
+
+def _get_handlers(logger: logging.Logger) -> tuple[logging.Handler, ...]:
+    generation = _generation
+    entry = _tables.get(logger)
+
+    if entry is not None and entry[0] == generation:
+        return entry[1]
+
+    handlers = list[logging.Handler]()
+
+    current: t.Optional[logging.Logger] = logger
+    while current is not None:
+        handlers.extend(current.handlers)
+        current = current.parent if current.propagate else None
+
+    result = tuple(handlers)
+    # NOTE: if tables were invalidated while handlers were collected, the entry is stale and will be recomputed.
+    _tables[logger] = (generation, result)
+
+    return result
+
+
+def _call_handlers(self: logging.Logger, record: logging.LogRecord) -> None:
+    handlers = _get_handlers(self)
+
+    if not handlers:
+        # NOTE: fallback to builtin behavior to use `logging.lastResort` handler.
+        _base_call_handlers(self, record)
+        return
+
+    levelno = record.levelno
+    for handler in handlers:
+        if levelno >= handler.level:
+            handler.handle(record)
+
+
+def _add_handler(self: logging.Logger, hdlr: logging.Handler) -> None:
+    _base_add_handler(self, hdlr)
+    invalidate_handler_dispatch()
+
+
+def _remove_handler(self: logging.Logger, hdlr: logging.Handler) -> None:
+    _base_remove_handler(self, hdlr)
+    invalidate_handler_dispatch()
+
+
+def _setattr(self: logging.Logger, name: str, value: object) -> None:
+    _base_setattr(self, name, value)
+
+    if name in _DISPATCH_ATTRS:
+        invalidate_handler_dispatch()
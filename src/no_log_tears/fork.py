@@ -0,0 +1,89 @@
+"""
+Fork safety of the package objects.
+
+Handlers with background threads, buffers or locks register their hooks with `register_at_fork`, so after `os.fork`
+(e.g. in pre-fork servers like gunicorn or `multiprocessing` with `fork` start method) the child process doesn't inherit
+stopped threads, held locks and records that belong to the parent process.
+"""
+
+import os
+import typing as t
+import weakref
+from pathlib import Path
+
+_Hooks = tuple[
+    t.Optional[weakref.WeakMethod[t.Callable[[], None]]],
+    t.Optional[weakref.WeakMethod[t.Callable[[], None]]],
+    t.Optional[weakref.WeakMethod[t.Callable[[], None]]],
+]
+
+_hooks = list[_Hooks]()
+_forking = list[tuple[t.Optional[t.Callable[[], None]], ...]]()
+
+
+def register_at_fork(
+    *,
+    before: t.Optional[t.Callable[[], None]] = None,
+    after_in_parent: t.Optional[t.Callable[[], None]] = None,
+    after_in_child: t.Optional[t.Callable[[], None]] = None,
+) -> None:
+    """
+    Register bound methods to be called around `os.fork` (see `os.register_at_fork`).
+
+    Methods are referenced weakly, so the object can be garbage collected, then its hooks are not called. `before`
+    hooks are called in reverse registration order, `after_in_parent` and `after_in_child` -- in registration order.
+    """
+    # NOTE: remove hooks of garbage collected objects, list is replaced, so it's safe to iterate in fork hooks.
+    global _hooks  # noqa: PLW0603
+
+    _hooks = [
+        *(hooks for hooks in _hooks if all(hook is None or hook() is not None for hook in hooks)),
+        (_ref(before), _ref(after_in_parent), _ref(after_in_child)),
+    ]
+
+
+def get_process_path(path: Path, pid: t.Optional[int] = None) -> Path:
+    """Return path of the file for the process (e.g. `app.log` -> `app.1234.log`), current process by default."""
+    return path.with_name(f"{path.stem}.{pid if pid is not None else os.getpid()}{path.suffix}")
+
+
+def _ref(method: t.Optional[t.Callable[[], None]]) -> t.Optional[weakref.WeakMethod[t.Callable[[], None]]]:
+    return weakref.WeakMethod(method) if method is not None else None
+
+
+def _before_fork() -> None:
+    # NOTE: keep strong references until the fork is done, so the same objects get before & after hooks.
+    _forking[:] = [tuple(hook() if hook is not None else None for hook in hooks) for hooks in _hooks]
+
+    for before, _, _ in reversed(_forking):
+        if before is not None:
+            before()
+
+
+def _after_fork_in_parent() -> None:
+    try:
+        for _, after_in_parent, _ in _forking:
+            if after_in_parent is not None:
+                after_in_parent()
+
+    finally:
+        _forking.clear()
+
+
+def _after_fork_in_child() -> None:
+    try:
+        for _, _, after_in_child in _forking:
+            if after_in_child is not None:
+                after_in_child()
+
+    finally:
+        _forking.clear()
+
+
+# NOTE: `os.register_at_fork` is not available on Windows (there is no fork).
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_before_fork,
+        after_in_parent=_after_fork_in_parent,
+        after_in_child=_after_fork_in_child,
+    )
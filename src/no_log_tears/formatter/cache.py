@@ -0,0 +1,31 @@
+"""Provides format output cache for formatters that are shared between handlers."""
+
+import logging
+import threading
+import typing as t
+
+
+class LastRecordCache:
+    """
+    Keeps the output of the last formatted record (per thread).
+
+    Handlers of a logger hierarchy handle the record one by one in the same thread, so when a formatter instance is
+    shared between handlers (e.g. console & file handlers with the same `json` formatter), the record is formatted
+    once and the output is reused by other handlers. The record is matched by identity, so the record must not be
+    modified between handlers (e.g. by handler filters) to get a fresh output.
+
+    The last record is kept referenced until the next record is formatted in the same thread.
+    """
+
+    def __init__(self) -> None:
+        """LastRecordCache constructor."""
+        self.__local = threading.local()
+
+    def get(self, record: logging.LogRecord) -> t.Optional[str]:
+        """Return the cached output if the record is the last formatted record in current thread."""
+        last: t.Optional[tuple[logging.LogRecord, str]] = getattr(self.__local, "last", None)
+        return last[1] if last is not None and last[0] is record else None
+
+    def set(self, record: logging.LogRecord, output: str) -> None:
+        """Remember the output of the record."""
+        self.__local.last = (record, output)
@@ -1,15 +1,40 @@
 """Provides JSON logging formatter."""
 
+import abc
 import json
 import logging
+import threading
 import typing as t
 from datetime import date, datetime, time, timedelta
-from functools import singledispatchmethod
 
 from typing_extensions import override
 
+from no_log_tears.formatter.cache import LastRecordCache
 from no_log_tears.formatter.datetime import ISO8601DatetimeFormatter
+from no_log_tears.formatter.limit import ValueAdapter, ValueLimiter
 from no_log_tears.formatter.traceback import TracebackFormatter, TracebackGenerator
+from no_log_tears.record import BASE_FIELDS
+
+
+class SupportsLog(t.Protocol):
+    """Interface for objects that can render themselves into compact structured values for logging."""
+
+    @abc.abstractmethod
+    def __log__(self, level: int) -> object:
+        """Return structured object representation (e.g. a dict) for the given logging level."""
+        raise NotImplementedError
+
+
+LogAdapter = ValueAdapter
+"""Renders object of specific type into structured value for the given logging level."""
+
+DEFAULT_ADAPTERS: t.Final[t.Mapping[type[object], LogAdapter]] = {
+    date: lambda obj, _: obj.isoformat(),
+    time: lambda obj, _: obj.isoformat(),
+    datetime: lambda obj, _: obj.isoformat(),
+    timedelta: lambda obj, _: str(obj),
+}
+"""Default value adapters of `JSONFormatter`."""
 
 
 class JSONFormatter(TracebackFormatter):
@@ -28,15 +53,39 @@ class JSONFormatter(TracebackFormatter):
         * `datetime` - to date time string in ISO format.
         * `timedelta` - to python string representation.
         * `tuple`, `set`, `frozenset` - to python list (to JSON array).
+        * objects with `__log__(level)` method (see `SupportsLog`) - to the value it returns, `level` is the record
+          logging level.
+
+    Custom conversions can be provided with `adapters` -- a mapping from type to a callable that accepts the object and
+    the record logging level. Adapters are resolved by type MRO once per type and then cached.
 
     If type is unknown - uses `__str__`.
+
+    Values are limited by `max_depth` (nesting depth) and `max_items` (number of items in each collection). Depth and
+    items limits are applied to converted values only (e.g. values returned by `__log__`), builtin collections are
+    dumped as is. If `max_string` (string length) or `max_bytes` (approximate total size of record values) limit is set,
+    all record values are limited, oversized values are cut with truncation markers (see `ValueLimiter`).
+
+    If `fields` is provided - only these fields are dumped (in the given order, missing fields are `null`). Special
+    field `__other__` adds all the other record fields (except `exclude` fields, `__base__` excludes base
+    `logging.LogRecord` fields), `message` field is the rendered record message.
+
+    Output is computed once per record and reused when formatter is shared between handlers (see `LastRecordCache`).
     """
 
-    def __init__(
+    # NOTE: ignore PLR0913, because formatter can be constructed via dict configurator.
+    def __init__(  # noqa: PLR0913
         self,
         encoder: t.Optional[json.JSONEncoder] = None,
         traceback_tail: t.Optional[int] = None,
         traceback_generator: t.Optional[TracebackGenerator] = None,
+        adapters: t.Optional[t.Mapping[type[object], LogAdapter]] = None,
+        max_depth: t.Optional[int] = 10,
+        max_items: t.Optional[int] = None,
+        max_string: t.Optional[int] = None,
+        max_bytes: t.Optional[int] = None,
+        fields: t.Optional[t.Sequence[str]] = None,
+        exclude: t.Union[str, t.Sequence[str], None] = None,
     ) -> None:
         """JSONFormatter constructor."""
         super().__init__()
@@ -47,40 +96,87 @@ class JSONFormatter(TracebackFormatter):
         )
         self.__time = ISO8601DatetimeFormatter()
         self.__traceback = TracebackFormatter(traceback_tail=traceback_tail, traceback_generator=traceback_generator)
+        self.__adapters = {**DEFAULT_ADAPTERS, **(adapters or {})}
+        self.__limiter = ValueLimiter(
+            default=str,
+            resolve_adapter=self.__resolve_adapter,
+            max_depth=max_depth,
+            max_items=max_items,
+            max_string=max_string,
+            max_bytes=max_bytes,
+        )
+        self.__local = threading.local()
+        self.__cache = LastRecordCache()
+        self.__fields = tuple(fields) if fields is not None else None
+        self.__field_set = frozenset(fields) if fields is not None else frozenset()
+        excluded = frozenset([exclude] if isinstance(exclude, str) else exclude if exclude is not None else ())
+        self.__non_other_fields = (
+            self.__field_set | (excluded - {"__base__"}) | (BASE_FIELDS if "__base__" in excluded else frozenset())
+        )
+
+    @property
+    def used_fields(self) -> t.Optional[frozenset[str]]:
+        """Return record fields used by formatter or `None` if all fields are dumped."""
+        return self.__field_set if self.__fields is not None and "__other__" not in self.__field_set else None
 
     @override
     def format(self, record: logging.LogRecord) -> str:
         """Format given log record to JSON string."""
+        output = self.__cache.get(record)
+        if output is None:
+            output = self.__format(record)
+            self.__cache.set(record, output)
+
+        return output
+
+    def __format(self, record: logging.LogRecord) -> str:
         if not hasattr(record, "asctime"):
             record.asctime = self.__time.formatTime(record)
 
         if not hasattr(record, "exc_text") and getattr(record, "exc_info", None):
             record.exc_text = self.__traceback.formatException(record.exc_info)
 
-        return self.__encoder.encode(record.__dict__)
+        values = self.__select_fields(record) if self.__fields is not None else record.__dict__
 
-    @singledispatchmethod
-    def __encode_default(self, obj: object) -> object:
-        return str(obj)
+        if self.__limiter.is_limiting_strings:
+            return self.__encoder.encode(self.__limiter.convert_fields(values, record.levelno))
+
+        # NOTE: record level is passed to `__log__` and adapters via thread local, so encoder can be reused.
+        self.__local.level = record.levelno
+
+        return self.__encoder.encode(values)
 
-    @__encode_default.register
-    def __encode_date(self, obj: date) -> str:
-        return obj.isoformat()
+    def __select_fields(self, record: logging.LogRecord) -> t.Mapping[str, object]:
+        assert self.__fields is not None
+
+        record_values = record.__dict__
+        values: dict[str, object] = {}
+
+        for field in self.__fields:
+            if field == "__other__":
+                values.update(
+                    (key, value) for key, value in record_values.items() if key not in self.__non_other_fields
+                )
+            elif field == "message":
+                values[field] = record.getMessage()
+            else:
+                values[field] = record_values.get(field)
+
+        return values
+
+    def __encode_default(self, obj: object) -> object:
+        return self.__limiter.convert(obj, getattr(self.__local, "level", logging.NOTSET))
 
-    @__encode_default.register
-    def __encode_time(self, obj: time) -> str:
-        return obj.isoformat()
+    def __resolve_adapter(self, obj_type: type[object]) -> t.Optional[LogAdapter]:
+        for base in obj_type.__mro__:
+            adapter = self.__adapters.get(base)
+            if adapter is not None:
+                return adapter
 
-    @__encode_default.register
-    def __encode_datetime(self, obj: datetime) -> str:
-        return obj.isoformat()
+        if hasattr(obj_type, "__log__"):
+            return self.__adapt_loggable
 
-    @__encode_default.register
-    def __encode_timedelta(self, obj: timedelta) -> str:
-        return str(obj)
+        return None
 
-    @__encode_default.register(tuple)
-    @__encode_default.register(set)
-    @__encode_default.register(frozenset)
-    def __encode_iterable(self, obj: t.Iterable[object]) -> list[object]:
-        return list(obj)
+    def __adapt_loggable(self, obj: SupportsLog, level: int) -> object:
+        return obj.__log__(level)
@@ -0,0 +1,207 @@
+"""Provides value size limits for logging formatters."""
+
+import sys
+import typing as t
+from itertools import islice
+
+from typing_extensions import override
+
+ValueAdapter = t.Callable[[t.Any, int], object]
+"""Converts object of specific type into another value for the given logging level."""
+
+_SCALARS: t.Final[frozenset[type[object]]] = frozenset({int, float, bool, type(None)})
+_SCALAR_SIZE: t.Final[int] = 8
+
+
+class Verbatim(str):
+    """String that is rendered as is by `repr` (e.g. to keep `repr` of unknown objects inside containers unquoted)."""
+
+    __slots__ = ()
+
+    @override
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class _Budget:
+    __slots__ = ("remaining",)
+
+    def __init__(self, remaining: int) -> None:
+        self.remaining = remaining
+
+
+class ValueLimiter:
+    """
+    Converts values to bounded plain python values: dicts, lists, strings and scalars.
+
+    Limits (`None` -- no limit):
+
+        * `max_depth` -- max nesting depth of collections, deeper values are replaced with `...`.
+        * `max_items` -- max number of items in each collection, `... +N items` marker is added.
+        * `max_string` -- max string length, `...(+N chars)` suffix is added.
+        * `max_bytes` -- max total size of converted values (approximately, in characters), values that don't fit are
+          replaced with `...`. When fields are converted with `convert_fields`, budget is shared between all fields.
+
+    Limits are enforced during conversion: collections are iterated only up to the limit and strings are sliced, so
+    oversized values are never copied in full. Objects of other types are converted with adapter (resolved by
+    `resolve_adapter` once per type) or with `default` (e.g. `str` or `repr`), then the result is limited.
+    """
+
+    # NOTE: ignore PLR0913, because limiter is constructed from formatter options.
+    def __init__(  # noqa: PLR0913
+        self,
+        default: t.Callable[[object], object],
+        resolve_adapter: t.Optional[t.Callable[[type[object]], t.Optional[ValueAdapter]]] = None,
+        max_depth: t.Optional[int] = None,
+        max_items: t.Optional[int] = None,
+        max_string: t.Optional[int] = None,
+        max_bytes: t.Optional[int] = None,
+    ) -> None:
+        """ValueLimiter constructor."""
+        self.__default = default
+        self.__resolve_adapter = resolve_adapter
+        self.__max_depth = max_depth if max_depth is not None else sys.maxsize
+        self.__max_items = max_items
+        self.__max_string = max_string
+        self.__max_bytes = max_bytes
+        # NOTE: cache is filled without locks: concurrent writes of the same type store equivalent converters.
+        self.__converters: dict[type[object], t.Callable[[t.Any, int, int, t.Optional[_Budget]], object]] = {}
+
+    @property
+    def is_limiting_strings(self) -> bool:
+        """Return `True` if string or total size limits are set (thus every string value has to be checked)."""
+        return self.__max_string is not None or self.__max_bytes is not None
+
+    @property
+    def is_limiting(self) -> bool:
+        """Return `True` if any limit is set."""
+        return self.is_limiting_strings or self.__max_items is not None or self.__max_depth != sys.maxsize
+
+    def convert(self, obj: object, level: int) -> object:
+        """Convert one value within the limits."""
+        budget = _Budget(self.__max_bytes) if self.__max_bytes is not None else None
+        return self.__convert(obj, level, self.__max_depth, budget)
+
+    def convert_fields(self, fields: t.Mapping[str, object], level: int) -> dict[str, object]:
+        """Convert field values (e.g. log record dict) within the limits, field names are always kept."""
+        budget = _Budget(self.__max_bytes) if self.__max_bytes is not None else None
+        depth = self.__max_depth - 1
+
+        return {key: self.__convert(value, level, depth, budget) for key, value in fields.items()}
+
+    def __convert(self, obj: object, level: int, depth: int, budget: t.Optional[_Budget]) -> object:
+        obj_type = type(obj)
+
+        if obj_type is str:
+            return self.__convert_str(t.cast(str, obj), level, depth, budget)
+
+        if obj_type in _SCALARS:
+            return self.__convert_scalar(obj, level, depth, budget)
+
+        converter = self.__converters.get(obj_type)
+        if converter is None:
+            converter = self.__converters[obj_type] = self.__resolve_converter(obj_type)
+
+        return converter(obj, level, depth, budget)
+
+    def __resolve_converter(
+        self,
+        obj_type: type[object],
+    ) -> t.Callable[[t.Any, int, int, t.Optional[_Budget]], object]:
+        adapter = self.__resolve_adapter(obj_type) if self.__resolve_adapter is not None else None
+        if adapter is not None:
+            return self.__wrap_adapter(adapter)
+
+        if issubclass(obj_type, dict):
+            return self.__convert_mapping
+
+        if issubclass(obj_type, (list, tuple, set, frozenset)):
+            return self.__convert_iterable
+
+        if issubclass(obj_type, str):
+            return self.__convert_str
+
+        if issubclass(obj_type, (int, float)):
+            return self.__convert_scalar
+
+        return self.__wrap_adapter(self.__adapt_default)
+
+    def __wrap_adapter(self, adapter: ValueAdapter) -> t.Callable[[t.Any, int, int, t.Optional[_Budget]], object]:
+        def convert(obj: object, level: int, depth: int, budget: t.Optional[_Budget]) -> object:
+            value = adapter(obj, level)
+            # NOTE: if adapter returns the same object, it can't be converted any further.
+            return self.__convert(value, level, depth, budget) if value is not obj else self.__default(obj)
+
+        return convert
+
+    def __adapt_default(self, obj: object, _: int) -> object:
+        return self.__default(obj)
+
+    def __convert_scalar(self, obj: object, _level: int, _depth: int, budget: t.Optional[_Budget]) -> object:
+        if budget is not None:
+            if budget.remaining <= 0:
+                return "..."
+            budget.remaining -= _SCALAR_SIZE
+
+        return obj
+
+    def __convert_str(self, obj: str, _level: int, _depth: int, budget: t.Optional[_Budget]) -> object:
+        limit = self.__max_string
+        if budget is not None:
+            if budget.remaining <= 0:
+                return "..."
+            limit = min(limit, budget.remaining) if limit is not None else budget.remaining
+
+        size = len(obj)
+
+        if limit is not None and size > limit:
+            if budget is not None:
+                budget.remaining -= limit
+            cut = f"{obj[:limit]}...(+{size - limit} chars)"
+            return Verbatim(cut) if isinstance(obj, Verbatim) else cut
+
+        if budget is not None:
+            budget.remaining -= size
+
+        return obj
+
+    def __convert_mapping(
+        self,
+        obj: t.Mapping[object, object],
+        level: int,
+        depth: int,
+        budget: t.Optional[_Budget],
+    ) -> object:
+        if depth <= 0 or (budget is not None and budget.remaining <= 0):
+            return "..."
+
+        items = obj.items() if self.__max_items is None else islice(obj.items(), self.__max_items)
+        result = {
+            key if type(key) is str or type(key) in _SCALARS else str(key): self.__convert(
+                value, level, depth - 1, budget
+            )
+            for key, value in items
+        }
+
+        if self.__max_items is not None and len(obj) > self.__max_items:
+            result["..."] = f"+{len(obj) - self.__max_items} items"
+
+        return result
+
+    def __convert_iterable(
+        self,
+        obj: t.Collection[object],
+        level: int,
+        depth: int,
+        budget: t.Optional[_Budget],
+    ) -> object:
+        if depth <= 0 or (budget is not None and budget.remaining <= 0):
+            return "..."
+
+        items = obj if self.__max_items is None else islice(obj, self.__max_items)
+        result = [self.__convert(value, level, depth - 1, budget) for value in items]
+
+        if self.__max_items is not None and len(obj) > self.__max_items:
+            result.append(f"... +{len(obj) - self.__max_items} items")
+
+        return result
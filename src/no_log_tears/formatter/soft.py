@@ -8,7 +8,14 @@ from types import TracebackType
 from typing_extensions import override
 
 from no_log_tears.formatter import ISO8601DatetimeFormatter
+from no_log_tears.formatter.cache import LastRecordCache
+from no_log_tears.formatter.limit import ValueLimiter, Verbatim
 from no_log_tears.formatter.traceback import TracebackFormatter, TracebackGenerator
+from no_log_tears.record import BASE_FIELDS
+
+
+def _verbatim_repr(obj: object) -> Verbatim:
+    return Verbatim(repr(obj))
 
 
 class SoftFormatter(logging.Formatter):
@@ -22,6 +29,11 @@ class SoftFormatter(logging.Formatter):
     If `__other__` field is present in format string - all other fields will be included in a dict under this key.
 
     If `exclude` is provided - these fields will be excluded from `__other__` dict.
+
+    `__other__` values can be limited with `max_depth`, `max_items`, `max_string` and `max_bytes` (see `ValueLimiter`),
+    oversized values are cut with truncation markers.
+
+    Output is computed once per record and reused when formatter is shared between handlers (see `LastRecordCache`).
     """
 
     # NOTE: ignore PLR0913, because formatter can be constructed via dict configurator.
@@ -35,6 +47,10 @@ class SoftFormatter(logging.Formatter):
         unknown: t.Optional[str] = None,
         traceback_tail: t.Optional[int] = None,
         traceback_generator: t.Optional[TracebackGenerator] = None,
+        max_depth: t.Optional[int] = None,
+        max_items: t.Optional[int] = None,
+        max_string: t.Optional[int] = None,
+        max_bytes: t.Optional[int] = None,
     ) -> None:
         """SoftFormatter constructor."""
         super().__init__(
@@ -56,36 +72,33 @@ class SoftFormatter(logging.Formatter):
         ) - {"__base__"}
 
         if exclude is not None and "__base__" in exclude:
-            # the following fields are base fields in `logging.LogRecord`
-            self.__non_other_fields.update(
-                {
-                    "args",
-                    "asctime",
-                    "created",
-                    "exc_info",
-                    "exc_text",
-                    "filename",
-                    "funcName",
-                    "levelname",
-                    "levelno",
-                    "lineno",
-                    "module",
-                    "msecs",
-                    "msg",
-                    "name",
-                    "pathname",
-                    "process",
-                    "processName",
-                    "relativeCreated",
-                    "stack_info",
-                    "taskName",
-                    "thread",
-                    "threadName",
-                }
-            )
+            self.__non_other_fields.update(BASE_FIELDS)
 
         self.__time = ISO8601DatetimeFormatter() if datefmt == "ISO8601" else None
         self.__traceback = TracebackFormatter(traceback_tail=traceback_tail, traceback_generator=traceback_generator)
+        limiter = ValueLimiter(
+            default=_verbatim_repr,
+            max_depth=max_depth,
+            max_items=max_items,
+            max_string=max_string,
+            max_bytes=max_bytes,
+        )
+        self.__limiter = limiter if limiter.is_limiting else None
+        self.__cache = LastRecordCache()
+
+    @property
+    def used_fields(self) -> t.Optional[frozenset[str]]:
+        """Return record fields used by formatter or `None` if all fields may be used (`__other__` is in format)."""
+        return frozenset(self.__main_fields) if not self.__add_other else None
+
+    @override
+    def format(self, record: logging.LogRecord) -> str:
+        output = self.__cache.get(record)
+        if output is None:
+            output = super().format(record)
+            self.__cache.set(record, output)
+
+        return output
 
     @override
     def formatTime(self, record: logging.LogRecord, datefmt: t.Optional[str] = None) -> str:
@@ -103,10 +116,13 @@ class SoftFormatter(logging.Formatter):
         }
 
         if self.__add_other:
-            items["__other__"] = {
+            other = {
                 field: getattr(record, field, self.__unknown)
                 for field in (record.__dict__.keys() - self.__non_other_fields)
             }
+            items["__other__"] = (
+                self.__limiter.convert_fields(other, record.levelno) if self.__limiter is not None else other
+            )
 
         return self._fmt % items
 
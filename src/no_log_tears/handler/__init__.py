@@ -0,0 +1,14 @@
+"""Provides `logging.Handler` implementations."""
+
+__all__ = [
+    "AsyncFlushable",
+    "AsyncStreamHandler",
+    "BinaryFileHandler",
+    "MemoryMappedFileHandler",
+    "NetworkHandler",
+]
+
+from no_log_tears.handler.binary import BinaryFileHandler
+from no_log_tears.handler.file import MemoryMappedFileHandler
+from no_log_tears.handler.network import NetworkHandler
+from no_log_tears.handler.stream import AsyncFlushable, AsyncStreamHandler
@@ -0,0 +1,30 @@
+"""Provides base classes for handlers."""
+
+import logging
+
+from typing_extensions import override
+
+
+class LocklessHandler(logging.Handler):
+    """
+    Handler that doesn't acquire handler lock on `handle`.
+
+    Suitable for handlers which `emit` only formats the record and passes the output to a thread-safe queue, so
+    emitting threads don't contend on the handler lock. Formatter must be thread-safe (builtin and `no_log_tears`
+    formatters are).
+    """
+
+    @override
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Filter & emit the record without acquiring handler lock."""
+        # NOTE: since python 3.12 filter may return a modified record instance.
+        rv: object = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+
+        if not rv:
+            return False
+
+        self.emit(record)
+
+        return True
@@ -0,0 +1,103 @@
+"""Provides file handler that writes log records in compact binary format."""
+
+import logging
+import os
+import typing as t
+from pathlib import Path
+
+from typing_extensions import override
+
+from no_log_tears.binary import BinaryEncoder
+from no_log_tears.fork import get_process_path, register_at_fork
+from no_log_tears.formatter.json import LogAdapter
+
+
+class BinaryFileHandler(logging.FileHandler):
+    """
+    Appends log records to a file in compact binary format (see `no_log_tears.binary`).
+
+    Records are encoded as is, handler formatter is not used. A header frame is written each time the file is opened,
+    so the file can be appended by multiple handler instances (one after another). Use `python -m no_log_tears read`
+    to convert the file to `JSONFormatter` or `SoftFormatter` output.
+
+    Unlike `logging.FileHandler`, records are not written after each record: encoded records are kept in the buffer
+    and written when it exceeds `buffer_size` bytes, on `flush` and on close. Records in the buffer are lost if the
+    process is killed (the reader ignores the incomplete frame at the end of the file).
+
+    Fork safe: records in the buffer of the child process are discarded (the parent writes them). Interned strings of
+    the parent and the child streams would be mixed up in one file, so the child process writes to its own file
+    (`<filename stem>.<pid><filename suffix>`, see `get_process_path`).
+    """
+
+    # NOTE: ignore PLR0913, because handler can be constructed via dict configurator.
+    def __init__(  # noqa: PLR0913
+        self,
+        filename: t.Union[str, os.PathLike[str]],
+        delay: bool = False,  # noqa: FBT001,FBT002
+        max_interned: int = 65536,
+        traceback_tail: t.Optional[int] = None,
+        adapters: t.Optional[t.Mapping[type[object], LogAdapter]] = None,
+        buffer_size: int = 64 * 1024,
+    ) -> None:
+        """BinaryFileHandler constructor."""
+        self.__encoder = BinaryEncoder(max_interned=max_interned, traceback_tail=traceback_tail, adapters=adapters)
+        self.__buffer = bytearray()
+        self.__buffer_size = buffer_size
+        self.__bytes_written = 0
+        super().__init__(filename, mode="ab", delay=delay)
+
+        register_at_fork(after_in_child=self.__after_fork_in_child)
+
+    @override
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()  # type: ignore[assignment]
+
+            self.__buffer += self.__encoder.encode(record)
+            if len(self.__buffer) >= self.__buffer_size:
+                self.__write()
+
+        except RecursionError:
+            raise
+
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+
+    @property
+    def bytes_written(self) -> int:
+        """Return the number of bytes written to the file by this handler (excluding buffered records)."""
+        return self.__bytes_written
+
+    @override
+    def flush(self) -> None:
+        """Write buffered records to the file."""
+        self.acquire()
+        try:
+            if self.stream is not None and self.__buffer:
+                self.__write()
+
+        finally:
+            self.release()
+
+    @override
+    def _open(self) -> t.BinaryIO:  # type: ignore[override]
+        # NOTE: the file is not buffered, the handler keeps its own buffer (see `__after_fork_in_child`).
+        stream = t.cast(t.BinaryIO, open(self.baseFilename, self.mode, buffering=0))  # noqa: PTH123,SIM115
+        stream.write(self.__encoder.header())
+        return stream
+
+    def __write(self) -> None:
+        t.cast(t.BinaryIO, self.stream).write(self.__buffer)
+        self.__bytes_written += len(self.__buffer)
+        self.__buffer.clear()
+
+    def __after_fork_in_child(self) -> None:
+        # NOTE: the buffer is empty, so closing of the inherited file doesn't write anything to it.
+        self.__buffer.clear()
+
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+        self.baseFilename = str(get_process_path(Path(self.baseFilename)))
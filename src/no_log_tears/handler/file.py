@@ -0,0 +1,200 @@
+"""Provides memory-mapped append-only file handler."""
+
+import logging
+import mmap
+import os
+import typing as t
+from pathlib import Path
+
+from typing_extensions import override
+
+from no_log_tears.fork import get_process_path, register_at_fork
+
+
+class MemoryMappedFileHandler(logging.Handler):
+    """
+    Appends formatted records to a file via memory mapping, instead of issuing a `write` syscall per record.
+
+    Any formatter output can be written (e.g. `JSONFormatter` or `SoftFormatter`), one record per line.
+
+    The file is preallocated with `segment_size` bytes and mapped into memory, records are copied into the mapping. When
+    the mapped segment is full, the file grows by another segment (and is remapped). If `max_bytes` is set, the file is
+    rotated when the next record doesn't fit into `max_bytes`: `app.log` -> `app.log.1` -> ... up to `backup_count`
+    files (like `logging.handlers.RotatingFileHandler`). On close (and before rotation) the trailing unused part of the
+    segment is trimmed.
+
+    Crash safety:
+
+        * process kill (e.g. `SIGKILL`, `os._exit`, unhandled signal) -- all records that were emitted (`emit`
+          returned) survive: the mapping is shared, so the data is already in the OS page cache and is written to disk
+          by the OS. The file is not trimmed, so it ends with zero bytes (slack) after the last record, readers should
+          ignore trailing NUL bytes. When the handler is created for such a file again, it continues after the last
+          record and the slack is trimmed on close.
+        * OS crash or power loss -- only records that were written to disk survive: `flush` (`msync`) forces
+          it, otherwise it's up to the OS page cache writeback.
+
+    Fork safe: the mapping can't be shared by processes, so the child process leaves the inherited file to the parent
+    and writes to its own file (`<filename stem>.<pid><filename suffix>`, see `get_process_path`), it's opened on the
+    first emit.
+    """
+
+    # NOTE: ignore PLR0913, because handler can be constructed via dict configurator.
+    def __init__(  # noqa: PLR0913
+        self,
+        filename: t.Union[str, os.PathLike[str]],
+        segment_size: int = 16 * 1024 * 1024,
+        max_bytes: t.Optional[int] = None,
+        backup_count: int = 0,
+        encoding: str = "utf-8",
+        level: int = logging.NOTSET,
+    ) -> None:
+        """MemoryMappedFileHandler constructor."""
+        super().__init__(level)
+        self.__path = Path(filename).absolute()
+        self.__segment_size = segment_size
+        self.__max_bytes = max_bytes
+        self.__backup_count = backup_count
+        self.__encoding = encoding
+        self.__terminator = "\n"
+
+        self.__fd = -1
+        self.__mmap: t.Optional[mmap.mmap] = None
+        self.__size = 0
+        self.__limit = 0
+        self.__pos = 0
+        self.__open()
+
+        register_at_fork(after_in_child=self.__after_fork_in_child)
+
+    @property
+    def path(self) -> Path:
+        """Return path to the current log file."""
+        return self.__path
+
+    @override
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            data = (self.format(record) + self.__terminator).encode(self.__encoding)
+            end = self.__pos + len(data)
+
+            if end > self.__limit:
+                self.__reserve(len(data))
+                end = self.__pos + len(data)
+
+            assert self.__mmap is not None
+            self.__mmap[self.__pos : end] = data
+            self.__pos = end
+
+        except RecursionError:
+            raise
+
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+
+    @override
+    def flush(self) -> None:
+        """Write mapped data to disk (`msync`)."""
+        self.acquire()
+        try:
+            if self.__mmap is not None:
+                self.__mmap.flush()
+
+        finally:
+            self.release()
+
+    @override
+    def close(self) -> None:
+        """Trim the unused part of the file and close it."""
+        self.acquire()
+        try:
+            self.__close_file()
+
+        finally:
+            self.release()
+
+        super().close()
+
+    def __open(self) -> None:
+        self.__path.parent.mkdir(parents=True, exist_ok=True)
+        self.__fd = os.open(self.__path, os.O_RDWR | os.O_CREAT, 0o644)
+        self.__pos = self.__find_data_end()
+        self.__map(self.__pos + self.__segment_size)
+
+    def __find_data_end(self) -> int:
+        size = os.fstat(self.__fd).st_size
+        chunk_size = 64 * 1024
+
+        # NOTE: the file may end with zero bytes slack after a crash, find the end of the last record.
+        end = size
+        while end > 0:
+            start = max(end - chunk_size, 0)
+            os.lseek(self.__fd, start, os.SEEK_SET)
+            chunk = os.read(self.__fd, end - start).rstrip(b"\x00")
+            if chunk:
+                return start + len(chunk)
+
+            end = start
+
+        return 0
+
+    def __map(self, size: int) -> None:
+        if self.__mmap is not None:
+            self.__mmap.close()
+
+        os.ftruncate(self.__fd, size)
+        self.__mmap = mmap.mmap(self.__fd, size)
+        self.__size = size
+        # NOTE: emit calls `__reserve` only when the record crosses the limit (the end of the mapping or `max_bytes`).
+        self.__limit = min(size, self.__max_bytes) if self.__max_bytes is not None else size
+
+    def __reserve(self, length: int) -> None:
+        if self.__fd < 0:
+            self.__open()
+
+        if self.__max_bytes is not None and self.__pos > 0 and self.__pos + length > self.__max_bytes:
+            self.__rotate()
+
+        if self.__pos + length > self.__size:
+            segments = (self.__pos + length - self.__size) // self.__segment_size + 1
+            self.__map(self.__size + segments * self.__segment_size)
+
+    def __rotate(self) -> None:
+        self.__close_file()
+
+        if self.__backup_count > 0:
+            for i in range(self.__backup_count - 1, 0, -1):
+                source = self.__path.with_name(f"{self.__path.name}.{i}")
+                if source.exists():
+                    source.replace(self.__path.with_name(f"{self.__path.name}.{i + 1}"))
+
+            self.__path.replace(self.__path.with_name(f"{self.__path.name}.1"))
+
+        else:
+            self.__path.unlink()
+
+        self.__open()
+
+    def __close_file(self) -> None:
+        if self.__mmap is not None:
+            self.__mmap.close()
+            self.__mmap = None
+
+        if self.__fd >= 0:
+            os.ftruncate(self.__fd, self.__pos)
+            os.close(self.__fd)
+            self.__fd = -1
+
+    def __after_fork_in_child(self) -> None:
+        # NOTE: don't trim the inherited file, the parent process keeps writing to it.
+        if self.__mmap is not None:
+            self.__mmap.close()
+            self.__mmap = None
+
+        if self.__fd >= 0:
+            os.close(self.__fd)
+            self.__fd = -1
+
+        self.__path = get_process_path(self.__path)
+        self.__size = 0
+        self.__limit = 0
+        self.__pos = 0
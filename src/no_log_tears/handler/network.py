@@ -0,0 +1,393 @@
+"""Provides handler that ships log records to a log collector over TCP or Unix socket."""
+
+import contextlib
+import logging
+import random
+import socket
+import threading
+import time
+import typing as t
+from collections import deque
+from pathlib import Path
+
+from typing_extensions import override
+
+from no_log_tears.fork import get_process_path, register_at_fork
+from no_log_tears.formatter.json import JSONFormatter
+from no_log_tears.handler.base import LocklessHandler
+
+_IDLE_WAIT: t.Final[float] = 1.0
+
+
+class NetworkHandler(LocklessHandler):
+    """
+    Ships newline-delimited formatted records (`JSONFormatter` output by default) to a log collector.
+
+    Collector address is either `host` & `port` (TCP) or `path` (Unix socket).
+
+    Emitting thread never blocks: the record is formatted and appended to the bounded in-memory buffer
+    (`max_queue_size` records, the oldest records are dropped when it's full). `connections` worker threads (started on
+    the first record) keep persistent connections to the collector and send records in batches (up to `batch_size`
+    records per write).
+
+    When the collector is unavailable, workers reconnect with exponential backoff with jitter (`backoff_base` ..
+    `backoff_max` seconds). Meanwhile, records are kept in the in-memory buffer or, if `spill_path` is set, they are
+    moved to the spill file (up to `spill_max_bytes`, then records are dropped). Spilled records are sent first after
+    reconnect. Delivery is at-least-once: a batch that was partially written before connection loss is sent again.
+    Records order is kept for a single connection only.
+
+    `flush` waits (up to `timeout` seconds) until the buffer is sent while the collector is available. `close` sends
+    the remaining records (up to `timeout` seconds) and stops the workers.
+
+    Fork safe: in the child process buffered records of the parent are discarded (the parent sends them), inherited
+    connections are closed and workers are started on the first emit. The child process spills records to its own
+    spill file (`<spill_path stem>.<pid><spill_path suffix>`, see `get_process_path`).
+    """
+
+    # NOTE: ignore PLR0913, because handler can be constructed via dict configurator.
+    def __init__(  # noqa: PLR0913
+        self,
+        host: t.Optional[str] = None,
+        port: t.Optional[int] = None,
+        path: t.Optional[str] = None,
+        connections: int = 1,
+        batch_size: int = 512,
+        max_queue_size: int = 100_000,
+        spill_path: t.Optional[str] = None,
+        spill_max_bytes: int = 64 * 1024 * 1024,
+        backoff_base: float = 0.1,
+        backoff_max: float = 10.0,
+        timeout: float = 5.0,
+        level: int = logging.NOTSET,
+    ) -> None:
+        """NetworkHandler constructor."""
+        if path is None and (host is None or port is None):
+            msg = "either path or host and port must be provided"
+            raise ValueError(msg, host, port, path)
+
+        super().__init__(level)
+        self.setFormatter(JSONFormatter())
+
+        self.__host = host
+        self.__port = port
+        self.__path = path
+        self.__connections = connections
+        self.__batch_size = batch_size
+        self.__max_queue_size = max_queue_size
+        self.__spill_path = Path(spill_path) if spill_path is not None else None
+        self.__spill_max_bytes = spill_max_bytes
+        self.__spill_lock = threading.Lock()
+        # NOTE: spill file may be left by the previous process, it's sent after the first record.
+        self.__spilled = self.__spill_path is not None and self.__spill_path.exists()
+        self.__backoff_base = backoff_base
+        self.__backoff_max = backoff_max
+        self.__timeout = timeout
+
+        self.__queue = deque[str]()
+        self.__ready = threading.Event()
+        self.__closing = threading.Event()
+        self.__workers = list[threading.Thread]()
+        self.__workers_lock = threading.Lock()
+        # NOTE: each worker updates only its own item.
+        self.__in_flight = [0] * connections
+        self.__connected = [False] * connections
+        self.__sockets: list[t.Optional[socket.socket]] = [None] * connections
+        self.__dropped = 0
+        self.__dropped_lock = threading.Lock()
+
+        register_at_fork(after_in_child=self.__after_fork_in_child)
+
+    @property
+    def dropped(self) -> int:
+        """Return total number of records that were dropped (buffer or spill file overflow)."""
+        return self.__dropped
+
+    @override
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = self.format(record) + "\n"
+
+            if len(self.__queue) >= self.__max_queue_size:
+                try:
+                    self.__queue.popleft()
+
+                except IndexError:
+                    pass
+
+                else:
+                    self.__add_dropped(1)
+
+            self.__queue.append(line)
+
+            if not self.__ready.is_set():
+                self.__ready.set()
+
+            if not self.__workers:
+                self.__start()
+
+        except RecursionError:
+            raise
+
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+
+    @override
+    def flush(self) -> None:
+        """Wait until buffered records are sent, while the collector is available."""
+        deadline = time.monotonic() + self.__timeout
+
+        while (
+            (self.__queue or any(self.__in_flight))
+            and any(self.__connected)
+            and time.monotonic() < deadline
+            and not self.__closing.wait(0.001)
+        ):
+            pass
+
+    @override
+    def close(self) -> None:
+        """Send the remaining records and stop the workers."""
+        self.__closing.set()
+        self.__ready.set()
+
+        with self.__workers_lock:
+            workers, self.__workers = self.__workers, []
+
+        deadline = time.monotonic() + self.__timeout
+        for worker in workers:
+            worker.join(max(deadline - time.monotonic(), 0.0))
+
+        super().close()
+
+    def __start(self) -> None:
+        with self.__workers_lock:
+            if self.__workers or self.__closing.is_set():
+                return
+
+            self.__workers = [
+                threading.Thread(
+                    target=self.__work,
+                    args=(index,),
+                    name=f"{self.__class__.__name__}-{id(self):x}-{index}",
+                    daemon=True,
+                )
+                for index in range(self.__connections)
+            ]
+
+            for worker in self.__workers:
+                worker.start()
+
+    def __work(self, index: int) -> None:
+        conn: t.Optional[socket.socket] = None
+        batch = list[str]()
+        attempt = 0
+
+        try:
+            while True:
+                if not batch:
+                    batch = self.__wait_batch(index)
+                    if not batch and not self.__spilled:
+                        return
+
+                if conn is None:
+                    conn = self.__open(index)
+
+                    if conn is None:
+                        batch = self.__park(batch, index)
+                        if self.__closing.is_set():
+                            return
+
+                        self.__closing.wait(self.__get_backoff_delay(attempt))
+                        attempt += 1
+                        continue
+
+                    attempt = 0
+
+                if self.__send(conn, batch):
+                    batch = []
+                    self.__in_flight[index] = 0
+
+                else:
+                    self.__disconnect(conn, index)
+                    conn = None
+
+        finally:
+            self.__in_flight[index] = 0
+            if conn is not None:
+                self.__disconnect(conn, index)
+
+    def __wait_batch(self, index: int) -> list[str]:
+        while True:
+            # NOTE: mark worker as busy before taking the batch, so `flush` doesn't miss taken records.
+            self.__in_flight[index] = 1
+            batch = self.__take_batch()
+            self.__in_flight[index] = len(batch)
+
+            # NOTE: spilled records are sent as soon as the collector is available, even without new records.
+            if batch or self.__spilled or self.__closing.is_set():
+                return batch
+
+            # NOTE: wait with timeout, because wake up may be missed on close (event may be cleared by another worker
+            # concurrently).
+            self.__ready.wait(_IDLE_WAIT)
+            if not self.__closing.is_set():
+                self.__ready.clear()
+
+    def __open(self, index: int) -> t.Optional[socket.socket]:
+        conn = self.__connect()
+        if conn is not None:
+            self.__connected[index] = True
+            self.__sockets[index] = conn
+
+        return conn
+
+    def __send(self, conn: socket.socket, batch: t.Sequence[str]) -> bool:
+        try:
+            if self.__spilled:
+                self.__replay_spill(conn)
+
+            if batch:
+                conn.sendall("".join(batch).encode())
+
+        except OSError:
+            return False
+
+        return True
+
+    def __park(self, batch: list[str], index: int) -> list[str]:
+        # NOTE: records are kept in memory while the collector is unavailable, unless spill file is set or handler is
+        # closing (then records are spilled or dropped).
+        if self.__spill_path is None and not self.__closing.is_set():
+            return batch
+
+        self.__spill_or_drop(batch)
+        self.__spill_or_drop(self.__take_all())
+        self.__in_flight[index] = 0
+
+        return []
+
+    def __take_batch(self) -> list[str]:
+        batch = list[str]()
+
+        try:
+            for _ in range(self.__batch_size):
+                batch.append(self.__queue.popleft())
+
+        except IndexError:
+            pass
+
+        return batch
+
+    def __take_all(self) -> list[str]:
+        lines = list[str]()
+
+        try:
+            while True:
+                lines.append(self.__queue.popleft())
+
+        except IndexError:
+            pass
+
+        return lines
+
+    def __connect(self) -> t.Optional[socket.socket]:
+        try:
+            if self.__path is not None:
+                conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                try:
+                    conn.settimeout(self.__timeout)
+                    conn.connect(self.__path)
+
+                except OSError:
+                    conn.close()
+                    raise
+
+            else:
+                assert self.__host is not None
+                assert self.__port is not None
+                conn = socket.create_connection((self.__host, self.__port), timeout=self.__timeout)
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        except OSError:
+            return None
+
+        return conn
+
+    def __disconnect(self, conn: socket.socket, index: int) -> None:
+        self.__connected[index] = False
+        self.__sockets[index] = None
+
+        with contextlib.suppress(OSError):
+            conn.close()
+
+    def __get_backoff_delay(self, attempt: int) -> float:
+        delay = min(self.__backoff_max, self.__backoff_base * 2.0 ** min(attempt, 32))
+        # NOTE: ignore S311, jitter is not a cryptographic use of random.
+        return delay * random.uniform(0.5, 1.0)  # noqa: S311
+
+    def __spill_or_drop(self, lines: t.Sequence[str]) -> None:
+        if not lines:
+            return
+
+        if self.__spill_path is None:
+            self.__add_dropped(len(lines))
+            return
+
+        data = "".join(lines).encode()
+
+        with self.__spill_lock:
+            try:
+                size = self.__spill_path.stat().st_size if self.__spill_path.exists() else 0
+                if size + len(data) > self.__spill_max_bytes:
+                    self.__add_dropped(len(lines))
+                    return
+
+                with self.__spill_path.open("ab") as fd:
+                    fd.write(data)
+
+                self.__spilled = True
+
+            except OSError:
+                self.__add_dropped(len(lines))
+
+    def __replay_spill(self, conn: socket.socket) -> None:
+        assert self.__spill_path is not None
+
+        with self.__spill_lock:
+            if not self.__spill_path.exists():
+                self.__spilled = False
+                return
+
+            with self.__spill_path.open("rb") as fd:
+                while chunk := fd.read(1024 * 1024):
+                    conn.sendall(chunk)
+
+            self.__spill_path.unlink()
+            self.__spilled = False
+
+    def __add_dropped(self, count: int) -> None:
+        with self.__dropped_lock:
+            self.__dropped += count
+
+    def __after_fork_in_child(self) -> None:
+        # NOTE: close only the inherited file descriptors, the connections are still used by the parent process.
+        for conn in self.__sockets:
+            if conn is not None:
+                with contextlib.suppress(OSError):
+                    conn.close()
+
+        if self.__spill_path is not None:
+            self.__spill_path = get_process_path(self.__spill_path)
+
+        self.__spill_lock = threading.Lock()
+        self.__spilled = self.__spill_path is not None and self.__spill_path.exists()
+        self.__queue = deque()
+        self.__ready = threading.Event()
+        self.__closing = threading.Event()
+        self.__workers = []
+        self.__workers_lock = threading.Lock()
+        self.__in_flight = [0] * self.__connections
+        self.__connected = [False] * self.__connections
+        self.__sockets = [None] * self.__connections
+        self.__dropped = 0
+        self.__dropped_lock = threading.Lock()
@@ -0,0 +1,213 @@
+"""Provides stream handler that doesn't block on stream writes."""
+
+import abc
+import asyncio
+import contextlib
+import logging
+import threading
+import typing as t
+from queue import Empty, SimpleQueue
+
+from typing_extensions import override
+
+from no_log_tears.fork import register_at_fork
+from no_log_tears.handler.base import LocklessHandler
+
+
+@t.runtime_checkable
+class AsyncFlushable(t.Protocol):
+    """Interface for handlers that can be flushed without blocking asyncio event loop."""
+
+    @abc.abstractmethod
+    async def aflush(self) -> None:
+        """Wait until all emitted records are written."""
+        raise NotImplementedError
+
+
+class _Stop:
+    pass
+
+
+class AsyncStreamHandler(LocklessHandler, logging.StreamHandler):  # type: ignore[type-arg]
+    """
+    Stream handler that writes formatted records to the stream in a dedicated writer thread.
+
+    Records are formatted in the emitting thread and put to the queue, so `emit` never blocks on stream I/O (e.g. when
+    logging from asyncio event loop). Writer thread is started on first emit, it writes queued records in batches and
+    flushes the stream after each batch.
+
+    If `max_queue_size` is set and the queue is full - records are dropped, the number of dropped records is written
+    to the stream when the queue is drained.
+
+    `flush` blocks until all queued records are written, `aflush` waits for the same in asyncio event loop without
+    blocking it.
+
+    Handler lock is not acquired on `handle` (see `LocklessHandler`), so emitting threads don't contend on the handler
+    (this matters for free-threaded python builds).
+
+    Fork safe: the fork waits until the writer thread finishes writing the current batch. In the child process queued
+    records of the parent are discarded (the parent writes them) and the writer thread is started on the first emit.
+    """
+
+    def __init__(
+        self,
+        stream: t.Optional[t.TextIO] = None,
+        max_queue_size: t.Optional[int] = None,
+        batch_size: int = 1024,
+    ) -> None:
+        """AsyncStreamHandler constructor."""
+        super().__init__(stream)
+        self.__max_queue_size = max_queue_size
+        self.__batch_size = batch_size
+        self.__queue = SimpleQueue[t.Union[str, t.Callable[[], None], _Stop]]()
+        self.__thread: t.Optional[threading.Thread] = None
+        self.__thread_lock = threading.Lock()
+        self.__dropped = 0
+        self.__dropped_lock = threading.Lock()
+        self.__reported_dropped = 0
+        self.__write_lock = threading.Lock()
+
+        register_at_fork(
+            before=self.__before_fork,
+            after_in_parent=self.__after_fork_in_parent,
+            after_in_child=self.__after_fork_in_child,
+        )
+
+    @property
+    def dropped(self) -> int:
+        """Return total number of records that were dropped, because the queue was full."""
+        return self.__dropped
+
+    @override
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.__max_queue_size is not None and self.__queue.qsize() >= self.__max_queue_size:
+                with self.__dropped_lock:
+                    self.__dropped += 1
+                return
+
+            self.__queue.put(self.format(record) + self.terminator)
+
+            if self.__thread is None:
+                self.__start()
+
+        except RecursionError:
+            raise
+
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+
+    @override
+    def flush(self) -> None:
+        """Block until all queued records are written to the stream."""
+        if self.__thread is None or not self.__thread.is_alive():
+            super().flush()
+            return
+
+        done = threading.Event()
+        self.__queue.put(done.set)
+        done.wait()
+
+    async def aflush(self) -> None:
+        """Wait until all queued records are written to the stream without blocking the event loop."""
+        if self.__thread is None or not self.__thread.is_alive():
+            return
+
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+
+        def notify() -> None:
+            if not done.done():
+                done.set_result(None)
+
+        def notify_threadsafe() -> None:
+            # NOTE: event loop may be closed while waiting (e.g. the awaiting task was cancelled).
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(notify)
+
+        self.__queue.put(notify_threadsafe)
+        await done
+
+    @override
+    def close(self) -> None:
+        """Write all queued records, stop the writer thread and close the handler."""
+        with self.__thread_lock:
+            thread, self.__thread = self.__thread, None
+
+        if thread is not None:
+            self.__queue.put(_Stop())
+            thread.join()
+
+        super().close()
+
+    def __start(self) -> None:
+        with self.__thread_lock:
+            if self.__thread is None:
+                self.__thread = threading.Thread(
+                    target=self.__write_loop,
+                    name=f"{self.__class__.__name__}-{id(self):x}",
+                    daemon=True,
+                )
+                self.__thread.start()
+
+    def __write_loop(self) -> None:
+        item: t.Union[str, t.Callable[[], None], _Stop, None] = None
+
+        while True:
+            if item is None:
+                item = self.__queue.get()
+
+            batch = list[str]()
+            while isinstance(item, str) and len(batch) < self.__batch_size:
+                batch.append(item)
+
+                try:
+                    item = self.__queue.get_nowait()
+
+                except Empty:
+                    item = None
+
+            self.__write(batch)
+
+            if isinstance(item, _Stop):
+                return
+
+            if item is not None and not isinstance(item, str):
+                item()
+                item = None
+
+    def __write(self, batch: t.Sequence[str]) -> None:
+        dropped = self.__dropped - self.__reported_dropped
+        self.__reported_dropped += dropped
+
+        if not batch and not dropped:
+            return
+
+        # NOTE: write lock is held by the forking thread, so the stream isn't forked in the middle of the write.
+        with self.__write_lock:
+            try:
+                stream = self.stream
+                stream.write("".join(batch))
+                if dropped:
+                    stream.write(f"... {dropped} log records were dropped (queue is full){self.terminator}")
+                stream.flush()
+
+            except Exception:  # noqa: BLE001
+                self.handleError(logging.makeLogRecord({"msg": "can't write log records batch", "batch": batch}))
+
+    def __before_fork(self) -> None:
+        self.__thread_lock.acquire()
+        self.__write_lock.acquire()
+
+    def __after_fork_in_parent(self) -> None:
+        self.__write_lock.release()
+        self.__thread_lock.release()
+
+    def __after_fork_in_child(self) -> None:
+        self.__queue = SimpleQueue()
+        self.__thread = None
+        self.__thread_lock = threading.Lock()
+        self.__dropped = 0
+        self.__dropped_lock = threading.Lock()
+        self.__reported_dropped = 0
+        self.__write_lock = threading.Lock()
@@ -0,0 +1,394 @@
+"""
+Sidecar index over newline-delimited JSON log files (e.g. `JSONFormatter` output).
+
+Log file is split into blocks (about `block_size` bytes each, at line boundaries). The index keeps start offset and
+time range (min & max record time) of each block, and per-level and per-logger postings (ids of blocks that contain
+records of the level / logger). Search selects candidate blocks by the index and parses only the lines of these blocks
+from memory-mapped log file; lines that don't contain JSON-encoded values of the queried fields are skipped without
+parsing.
+
+Record time, level and logger name are taken from `created` (or `asctime`), `levelno` (or `levelname`) and `name`
+fields.
+
+The index is stored in `<log file>.idx` sidecar file (JSON) and is updated incrementally: only complete lines that were
+appended since the last update are indexed (trailing zero bytes, left by `MemoryMappedFileHandler`, are ignored). If the
+log file was replaced (e.g. rotated by a handler, truncated or rewritten), the index is rebuilt. If the file was
+rotated to `<log file>.1` backup, the index is moved to the backup sidecar.
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import typing as t
+from datetime import datetime
+from pathlib import Path
+
+from no_log_tears.binary import RecordFilter
+
+INDEX_SUFFIX: t.Final[str] = ".idx"
+DEFAULT_BLOCK_SIZE: t.Final[int] = 64 * 1024
+
+_VERSION: t.Final[int] = 1
+_HEAD_SIZE: t.Final[int] = 4096
+# NOTE: time range of the block without valid records, it doesn't match any time range.
+_NO_MIN_TIME: t.Final[int] = 2**62
+_NO_MAX_TIME: t.Final[int] = -(2**62)
+_MISSING: t.Final[object] = object()
+
+
+class LogIndex:
+    """
+    Sidecar index of newline-delimited JSON log file.
+
+    `update` indexes the lines that were appended since the last update and saves the index. `search` returns lines
+    of the matching records, lines that were appended after the last `update` are checked one by one.
+    """
+
+    def __init__(
+        self,
+        path: t.Union[str, os.PathLike[str]],
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> None:
+        """LogIndex constructor, loads the sidecar index file if it exists."""
+        self.__path = Path(path)
+        self.__index_path = _get_index_path(self.__path)
+        self.__block_size = block_size
+
+        self.__identity = (0, 0)
+        self.__head = (0, "")
+        self.__end = 0
+        self.__offsets = list[int]()
+        self.__min_times = list[int]()
+        self.__max_times = list[int]()
+        self.__levels: dict[int, list[int]] = {}
+        self.__loggers: dict[str, list[int]] = {}
+
+        self.__load()
+
+    @property
+    def path(self) -> Path:
+        """Return path to the log file."""
+        return self.__path
+
+    @property
+    def index_path(self) -> Path:
+        """Return path to the sidecar index file."""
+        return self.__index_path
+
+    @property
+    def indexed_size(self) -> int:
+        """Return the number of indexed bytes from the start of the log file."""
+        return self.__end
+
+    def update(self) -> int:
+        """Index the appended lines (rebuild the index if the log file was replaced), return the number of new lines."""
+        count = 0
+
+        with self.__path.open("rb") as fd:
+            stat = os.fstat(fd.fileno())
+
+            if not self.__is_current(fd, stat):
+                self.__move_to_backup()
+                self.__reset((stat.st_dev, stat.st_ino))
+
+            if stat.st_size > self.__end:
+                with mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    count = self.__index(data, self.__end, _find_lines_end(data, self.__end, stat.st_size))
+
+                    if self.__head[0] < min(self.__end, _HEAD_SIZE):
+                        head_size = min(self.__end, _HEAD_SIZE)
+                        self.__head = (head_size, _hash(data[:head_size]))
+
+        self.__save()
+
+        return count
+
+    def search(
+        self,
+        record_filter: t.Optional[RecordFilter] = None,
+        fields: t.Optional[t.Mapping[str, object]] = None,
+    ) -> t.Iterator[str]:
+        """Return lines of the records that match the filter and have the given top-level field values."""
+        fields = dict(fields or {})
+        needles = _get_needles(fields)
+
+        with self.__path.open("rb") as fd:
+            stat = os.fstat(fd.fileno())
+            if stat.st_size == 0:
+                return
+
+            indexed = self.__is_current(fd, stat)
+
+            with mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                ranges = self.__select_ranges(record_filter) if indexed else []
+
+                tail = self.__end if indexed else 0
+                ranges.append((tail, _find_lines_end(data, tail, stat.st_size)))
+
+                for start, end in ranges:
+                    yield from _scan(data, start, end, record_filter, fields, needles)
+
+    def __reset(self, identity: tuple[int, int]) -> None:
+        self.__identity = identity
+        self.__head = (0, _hash(b""))
+        self.__end = 0
+        self.__offsets.clear()
+        self.__min_times.clear()
+        self.__max_times.clear()
+        self.__levels.clear()
+        self.__loggers.clear()
+
+    def __is_current(self, fd: t.BinaryIO, stat: os.stat_result) -> bool:
+        if (stat.st_dev, stat.st_ino) != self.__identity or stat.st_size < self.__end:
+            return False
+
+        head_size, digest = self.__head
+        fd.seek(0)
+
+        return _hash(fd.read(head_size)) == digest
+
+    def __move_to_backup(self) -> None:
+        # NOTE: `RotatingFileHandler` & `MemoryMappedFileHandler` rename the log file to `<name>.1` on rotation, so the
+        # index is still valid for the backup file.
+        if self.__end == 0:
+            return
+
+        backup = self.__path.with_name(f"{self.__path.name}.1")
+
+        try:
+            stat = backup.stat()
+            if (stat.st_dev, stat.st_ino) == self.__identity and self.__index_path.exists():
+                self.__index_path.replace(_get_index_path(backup))
+
+        except OSError:
+            pass
+
+    def __index(self, data: mmap.mmap, start: int, end: int) -> int:
+        offsets = self.__offsets
+        count = 0
+        offset = start
+
+        while offset < end:
+            line_end = data.find(b"\n", offset, end)
+            if line_end < 0:
+                line_end = end
+
+            if not offsets or offset - offsets[-1] >= self.__block_size:
+                offsets.append(offset)
+                self.__min_times.append(_NO_MIN_TIME)
+                self.__max_times.append(_NO_MAX_TIME)
+
+            values = _parse_line(data[offset:line_end])
+            offset = line_end + 1
+
+            if values is None:
+                continue
+
+            block = len(offsets) - 1
+            time_us, level, name = _get_key(values)
+
+            self.__min_times[block] = min(self.__min_times[block], time_us)
+            self.__max_times[block] = max(self.__max_times[block], time_us)
+            _add_posting(self.__levels.setdefault(level, []), block)
+            _add_posting(self.__loggers.setdefault(name, []), block)
+            count += 1
+
+        self.__end = end
+
+        return count
+
+    def __select_ranges(self, record_filter: t.Optional[RecordFilter]) -> list[tuple[int, int]]:
+        blocks: t.Iterable[int] = range(len(self.__offsets))
+
+        if record_filter is not None:
+            by_level = {
+                block
+                for level, postings in self.__levels.items()
+                if record_filter.match_level(level)
+                for block in postings
+            }
+            by_logger = {
+                block
+                for name, postings in self.__loggers.items()
+                if record_filter.match_name(name)
+                for block in postings
+            }
+            blocks = sorted(
+                block
+                for block in by_level & by_logger
+                if record_filter.match_time_range(self.__min_times[block], self.__max_times[block])
+            )
+
+        ranges = list[tuple[int, int]]()
+
+        for block in blocks:
+            start = self.__offsets[block]
+            end = self.__offsets[block + 1] if block + 1 < len(self.__offsets) else self.__end
+
+            # NOTE: merge adjacent blocks, so they are scanned in one pass.
+            if ranges and ranges[-1][1] == start:
+                ranges[-1] = (ranges[-1][0], end)
+
+            else:
+                ranges.append((start, end))
+
+        return ranges
+
+    def __load(self) -> None:
+        try:
+            state = json.loads(self.__index_path.read_bytes())
+            if state["version"] != _VERSION:
+                return
+
+            self.__identity = (state["device"], state["inode"])
+            self.__head = (state["head"][0], state["head"][1])
+            self.__end = state["end"]
+            self.__offsets = state["offsets"]
+            self.__min_times = state["min_times"]
+            self.__max_times = state["max_times"]
+            self.__levels = {int(level): postings for level, postings in state["levels"].items()}
+            self.__loggers = state["loggers"]
+
+        except (OSError, ValueError, LookupError, TypeError):
+            # NOTE: missing or broken index is rebuilt on update.
+            self.__reset((0, 0))
+
+    def __save(self) -> None:
+        state = {
+            "version": _VERSION,
+            "device": self.__identity[0],
+            "inode": self.__identity[1],
+            "head": self.__head,
+            "end": self.__end,
+            "offsets": self.__offsets,
+            "min_times": self.__min_times,
+            "max_times": self.__max_times,
+            "levels": self.__levels,
+            "loggers": self.__loggers,
+        }
+
+        # NOTE: write to temporary file and replace, so readers never see partially written index.
+        tmp_path = self.__index_path.with_name(f"{self.__index_path.name}.tmp")
+        tmp_path.write_text(json.dumps(state, separators=(",", ":")), encoding="utf-8")
+        tmp_path.replace(self.__index_path)
+
+
+def _get_index_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}{INDEX_SUFFIX}")
+
+
+def _hash(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _find_lines_end(data: mmap.mmap, start: int, size: int) -> int:
+    # NOTE: zero bytes can't be a part of JSON line, they are the preallocated slack of memory-mapped file.
+    slack = data.find(b"\x00", start, size)
+    last = data.rfind(b"\n", start, slack if slack >= 0 else size)
+
+    return last + 1 if last >= 0 else start
+
+
+def _add_posting(postings: list[int], block: int) -> None:
+    if not postings or postings[-1] != block:
+        postings.append(block)
+
+
+def _parse_line(line: bytes) -> t.Optional[dict[str, object]]:
+    try:
+        values = json.loads(line)
+
+    except ValueError:
+        return None
+
+    return values if isinstance(values, dict) else None
+
+
+def _get_key(values: t.Mapping[str, object]) -> tuple[int, int, str]:
+    created = values.get("created")
+    asctime = values.get("asctime")
+
+    if isinstance(created, (int, float)) and not isinstance(created, bool):
+        time_us = round(created * 1_000_000)
+
+    elif isinstance(asctime, str):
+        try:
+            time_us = round(datetime.fromisoformat(asctime).timestamp() * 1_000_000)
+
+        except ValueError:
+            time_us = 0
+
+    else:
+        time_us = 0
+
+    level = values.get("levelno")
+    if not isinstance(level, int):
+        level_name = values.get("levelname")
+        level = logging.getLevelName(level_name) if isinstance(level_name, str) else logging.NOTSET
+        if not isinstance(level, int):
+            level = logging.NOTSET
+
+    name = values.get("name")
+
+    return time_us, level, name if isinstance(name, str) else ""
+
+
+def _get_needles(fields: t.Mapping[str, object]) -> list[bytes]:
+    needles = list[bytes]()
+
+    for value in fields.values():
+        # NOTE: containers may be encoded with different separators, non-ASCII strings may be escaped or not.
+        if isinstance(value, (dict, list)):
+            continue
+
+        encoded = json.dumps(value)
+        if encoded == json.dumps(value, ensure_ascii=False):
+            needles.append(encoded.encode())
+
+    return needles
+
+
+# NOTE: ignore PLR0913, because scan parameters are the search query.
+def _scan(  # noqa: PLR0913
+    data: mmap.mmap,
+    start: int,
+    end: int,
+    record_filter: t.Optional[RecordFilter],
+    fields: t.Mapping[str, object],
+    needles: t.Sequence[bytes],
+) -> t.Iterator[str]:
+    # NOTE: the longest needle is the most selective one, lines are found by it without iterating over all lines.
+    needle = max(needles, key=len) if needles else b""
+    offset = start
+
+    while offset < end:
+        if needle:
+            found = data.find(needle, offset, end)
+            if found < 0:
+                return
+
+            offset = data.rfind(b"\n", offset, found) + 1 or offset
+
+        line_end = data.find(b"\n", offset, end)
+        if line_end < 0:
+            line_end = end
+
+        line = data[offset:line_end]
+        offset = line_end + 1
+
+        if not all(needle in line for needle in needles):
+            continue
+
+        values = _parse_line(line)
+        if values is None:
+            continue
+
+        if record_filter is not None and not record_filter.match(*_get_key(values)):
+            continue
+
+        if any(values.get(key, _MISSING) != value for key, value in fields.items()):
+            continue
+
+        yield line.decode(errors="replace")
@@ -0,0 +1,341 @@
+"""
+Logging load generator: reproduces a logging workload to size hardware and validate configuration changes.
+
+Run: `python -m no_log_tears load --help`
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import platform
+import random
+import sys
+import threading
+import time
+import typing as t
+from array import array
+
+from no_log_tears import configure_logging
+from no_log_tears.logger import Logger
+
+if t.TYPE_CHECKING:
+    from no_log_tears.settings import LoggingSettings
+
+ConfigLike = t.Union[t.Mapping[str, object], "LoggingSettings", None]
+"""Logging configuration accepted by `configure_logging` (dict config or `LoggingSettings`)."""
+
+LoadMode = t.Literal["threads", "processes", "asyncio"]
+
+
+class LoadProfile(t.TypedDict, total=False):
+    """
+    Logging workload.
+
+    * `mode` -- emitters are threads, processes or asyncio tasks (of a single event loop).
+    * `workers` -- number of emitters.
+    * `records` -- number of log calls of each emitter.
+    * `levels` -- relative weights of log call levels (level name or number to weight).
+    * `extra_fields` -- number of extra fields passed to each log call.
+    * `extra_size` -- length of each extra field string value.
+    * `context_depth` -- number of nested bound contexts of the logger (`log(key=value)` calls), one field each.
+    * `exception_rate` -- fraction of log calls with exception info (a caught exception with traceback).
+    * `seed` -- random seed of levels & exceptions mix.
+    """
+
+    mode: LoadMode
+    workers: int
+    records: int
+    levels: t.Mapping[t.Union[str, int], float]
+    extra_fields: int
+    extra_size: int
+    context_depth: int
+    exception_rate: float
+    seed: int
+
+
+DEFAULT_PROFILE: t.Final[LoadProfile] = {
+    "mode": "threads",
+    "workers": 4,
+    "records": 10_000,
+    "levels": {"DEBUG": 10, "INFO": 80, "WARNING": 8, "ERROR": 2},
+    "extra_fields": 4,
+    "extra_size": 16,
+    "context_depth": 2,
+    "exception_rate": 0.001,
+    "seed": 0,
+}
+
+_MODES: t.Final[frozenset[str]] = frozenset(t.get_args(LoadMode))
+_PERCENTILES: t.Final[t.Mapping[str, float]] = {"p50": 0.5, "p99": 0.99, "p999": 0.999}
+
+_process_barrier: t.Optional[threading.Barrier] = None
+
+
+class LoadError(Exception):
+    """Exception that is raised & logged by the load generator."""
+
+
+class _WorkerResult(t.NamedTuple):
+    # NOTE: wall clock time is used, so it can be compared between processes.
+    start: float
+    end: float
+    latencies: bytes
+    user: float
+    system: float
+    written: int
+
+
+def run_load(profile: t.Optional[LoadProfile] = None, config: ConfigLike = None) -> dict[str, object]:
+    """
+    Configure logging, run the workload and return results (JSON serializable).
+
+    Results: total number of records, wall duration (from the first emitter start until handlers are flushed) and
+    throughput, log call latency
+    percentiles (microseconds), CPU time (user & system seconds of the process and worker processes) and the number of
+    bytes written by handlers (formatted records size, see `ByteMeter`).
+    """
+    load = t.cast(LoadProfile, {**DEFAULT_PROFILE, **(profile or {})})
+    if load["mode"] not in _MODES:
+        msg = "unknown load mode"
+        raise ValueError(msg, load["mode"])
+
+    start_times = os.times()
+
+    if load["mode"] == "processes":
+        ctx = multiprocessing.get_context()
+        barrier = ctx.Barrier(load["workers"])
+
+        # NOTE: each pool process gets one task, it waits on the barrier until all processes are configured.
+        with ctx.Pool(load["workers"], initializer=_init_process, initargs=(barrier,)) as pool:
+            results = pool.starmap(
+                _run_process,
+                [(load, config, index) for index in range(load["workers"])],
+                chunksize=1,
+            )
+
+        user, system = sum(result.user for result in results), sum(result.system for result in results)
+        written = sum(result.written for result in results)
+
+    else:
+        # NOTE: `LoggingSettings` is accepted when pydantic is installed.
+        configure_logging(config)  # type: ignore[arg-type]
+        meter = ByteMeter()
+
+        results = _run_threads(load) if load["mode"] == "threads" else asyncio.run(_run_tasks(load))
+        written = meter.close()
+        results[-1] = results[-1]._replace(end=time.time())
+
+        end_times = os.times()
+        user, system = end_times.user - start_times.user, end_times.system - start_times.system
+
+    duration = max(result.end for result in results) - min(result.start for result in results) if results else 0.0
+
+    latencies = sorted(latency for result in results for latency in array("q", result.latencies))
+    count = len(latencies)
+
+    return {
+        "profile": dict(load),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "records": count,
+        "duration_s": duration,
+        "throughput_rps": count / duration if duration > 0 else 0.0,
+        "latency_us": {
+            **{name: _get_percentile(latencies, q) / 1000 for name, q in _PERCENTILES.items()},
+            "max": (latencies[-1] if latencies else 0) / 1000,
+            "mean": (sum(latencies) / count if count else 0) / 1000,
+        },
+        "cpu_s": {"user": user, "system": system},
+        "bytes_written": written,
+        "bytes_per_record": written / count if count else 0.0,
+    }
+
+
+class ByteMeter:
+    """
+    Counts the size of records that are written by all configured handlers (of the root logger and other loggers).
+
+    Formatted records size (characters of formatter output and a terminator) is counted, handlers that don't use
+    formatter (e.g. `BinaryFileHandler`) are counted by their `bytes_written` property. `close` flushes & closes the
+    handlers and returns the total.
+    """
+
+    def __init__(self) -> None:
+        """ByteMeter constructor, wraps `format` of the handlers."""
+        self.__handlers = _get_handlers()
+        self.__sizes = list[int]()
+        self.__initial = {handler: t.cast(int, getattr(handler, "bytes_written", 0)) for handler in self.__handlers}
+
+        for handler in self.__handlers:
+            if not hasattr(handler, "bytes_written"):
+                handler.format = self.__wrap(handler.format)  # type: ignore[method-assign,assignment]
+
+    def close(self) -> int:
+        """Flush & close handlers, return the number of written bytes."""
+        for handler in self.__handlers:
+            handler.flush()
+
+        written = sum(self.__sizes) + sum(
+            t.cast(int, getattr(handler, "bytes_written", 0)) - initial for handler, initial in self.__initial.items()
+        )
+
+        for handler in self.__handlers:
+            handler.close()
+
+        return written
+
+    def __wrap(self, format_: t.Callable[[logging.LogRecord], str]) -> t.Callable[[logging.LogRecord], str]:
+        sizes = self.__sizes
+
+        def format_and_count(record: logging.LogRecord) -> str:
+            output = format_(record)
+            # NOTE: list append is thread-safe, sizes are summed on close.
+            sizes.append(len(output) + 1)
+            return output
+
+        return format_and_count
+
+
+def _get_handlers() -> list[logging.Handler]:
+    loggers = [logging.getLogger()] + [
+        logger for logger in list(logging.Logger.manager.loggerDict.values()) if isinstance(logger, logging.Logger)
+    ]
+    # NOTE: handler may be shared by loggers, dict keeps the order.
+    return list(dict.fromkeys(handler for logger in loggers for handler in logger.handlers))
+
+
+def _get_percentile(values: t.Sequence[int], q: float) -> float:
+    if not values:
+        return 0.0
+
+    return float(values[min(len(values) - 1, int(q * len(values)))])
+
+
+def _create_logger(load: LoadProfile, index: int) -> tuple[Logger, dict[str, object]]:
+    log = Logger.get_by_name(f"no_log_tears.load.worker{index}")
+    for depth in range(load["context_depth"]):
+        log = log(**{f"context_{depth}": f"value-{index}-{depth}"})
+
+    value = "x" * load["extra_size"]
+    extra: dict[str, object] = {f"extra_{i}": value for i in range(load["extra_fields"])}
+
+    return log, extra
+
+
+def _create_plan(load: LoadProfile, index: int) -> list[tuple[int, bool]]:
+    rnd = random.Random(load["seed"] * 1_000_003 + index)  # noqa: S311
+    levels = [_get_level(level) for level in load["levels"]]
+    weights = list(load["levels"].values())
+
+    return [
+        (level, rnd.random() < load["exception_rate"])
+        for level in rnd.choices(levels, weights=weights, k=load["records"])
+    ]
+
+
+def _get_level(level: t.Union[str, int]) -> int:
+    if isinstance(level, int):
+        return level
+
+    value = logging.getLevelName(level.upper())
+    if not isinstance(value, int):
+        msg = "unknown log level"
+        raise TypeError(msg, level)
+
+    return value
+
+
+def _emit(log: Logger, level: int, with_exception: bool, i: int, extra: t.Mapping[str, object]) -> int:  # noqa: FBT001
+    # NOTE: extra values are passed as keyword arguments (see `Logger.process`).
+    log_call = t.cast(t.Callable[..., None], log.log)
+
+    if with_exception:
+        try:
+            _raise_load_error(i)
+
+        except LoadError:
+            start = time.perf_counter_ns()
+            log_call(level, "load record %d failed", i, exc_info=True, **extra)
+            return time.perf_counter_ns() - start
+
+    start = time.perf_counter_ns()
+    log_call(level, "load record %d", i, **extra)
+    return time.perf_counter_ns() - start
+
+
+def _raise_load_error(i: int) -> None:
+    msg = "load error"
+    raise LoadError(msg, i)
+
+
+def _run_worker(load: LoadProfile, index: int, barrier: t.Optional[threading.Barrier] = None) -> _WorkerResult:
+    log, extra = _create_logger(load, index)
+    plan = _create_plan(load, index)
+    latencies = array("q")
+
+    if barrier is not None:
+        barrier.wait()
+
+    start = time.time()
+    for i, (level, with_exception) in enumerate(plan):
+        latencies.append(_emit(log, level, with_exception, i, extra))
+
+    return _WorkerResult(start, time.time(), latencies.tobytes(), 0.0, 0.0, 0)
+
+
+def _run_threads(load: LoadProfile) -> list[_WorkerResult]:
+    barrier = threading.Barrier(load["workers"])
+    results: list[t.Optional[_WorkerResult]] = [None] * load["workers"]
+
+    def run(index: int) -> None:
+        results[index] = _run_worker(load, index, barrier)
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(load["workers"])]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return [result for result in results if result is not None]
+
+
+async def _run_tasks(load: LoadProfile) -> list[_WorkerResult]:
+    async def run(index: int) -> _WorkerResult:
+        log, extra = _create_logger(load, index)
+        plan = _create_plan(load, index)
+        latencies = array("q")
+
+        start = time.time()
+        for i, (level, with_exception) in enumerate(plan):
+            latencies.append(_emit(log, level, with_exception, i, extra))
+            # NOTE: switch to other tasks after each call, like request handlers do on I/O.
+            await asyncio.sleep(0)
+
+        return _WorkerResult(start, time.time(), latencies.tobytes(), 0.0, 0.0, 0)
+
+    return list(await asyncio.gather(*(run(index) for index in range(load["workers"]))))
+
+
+def _init_process(barrier: threading.Barrier) -> None:
+    global _process_barrier  # noqa: PLW0603
+    _process_barrier = barrier
+
+
+def _run_process(load: LoadProfile, config: ConfigLike, index: int) -> _WorkerResult:
+    # NOTE: `LoggingSettings` is accepted when pydantic is installed.
+    configure_logging(config)  # type: ignore[arg-type]
+    meter = ByteMeter()
+    start_times = os.times()
+
+    result = _run_worker(load, index, _process_barrier)
+    written = meter.close()
+
+    end_times = os.times()
+
+    return result._replace(
+        end=time.time(),
+        user=end_times.user - start_times.user,
+        system=end_times.system - start_times.system,
+        written=written,
+    )
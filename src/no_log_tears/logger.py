@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import typing as t
 
 from typing_extensions import override
 
 from no_log_tears.config import is_debug_enabled, is_patch_enabled
+from no_log_tears.handler.stream import AsyncFlushable
 from no_log_tears.record import Record
 
 if t.TYPE_CHECKING:
@@ -51,9 +53,16 @@ class Logger(
         self,
         logger: logging.Logger,
         extra: t.Optional[t.Mapping[str, object]] = None,
+        extra_factory: t.Optional[t.Callable[[], t.Optional[t.Mapping[str, object]]]] = None,
     ) -> None:
-        """Logger constructor."""
+        """
+        Logger constructor.
+
+        `extra_factory` is invoked lazily: only when record passes the level check, so disabled log calls don't pay for
+        extra values evaluation.
+        """
         super().__init__(logger, extra or {})
+        self.__extra_factory = extra_factory
 
     def __call__(self, **kwargs: object) -> Logger:
         """Bind extra kwargs to logger, see `with_extra` method."""
@@ -61,7 +70,13 @@ class Logger(
 
     @override
     def process(self, msg: str, kwargs: t.Mapping[str, object]) -> tuple[str, t.MutableMapping[str, object]]:
-        return msg, {"extra": dict(**self.extra, **kwargs) if self.extra else kwargs}
+        extra = self.extra
+        if self.__extra_factory is not None:
+            lazy_extra = self.__extra_factory()
+            if lazy_extra:
+                extra = dict(**extra, **lazy_extra) if extra else lazy_extra
+
+        return msg, {"extra": dict(**extra, **kwargs) if extra else kwargs}
 
     def with_extra(self, extra: t.Optional[t.Mapping[str, object]]) -> Logger:
         """
@@ -75,8 +90,26 @@ class Logger(
         return Logger(
             logger=self.logger,
             extra=dict(**self.extra, **extra) if self.extra else extra,
+            extra_factory=self.__extra_factory,
         )
 
+    async def aflush(self) -> None:
+        """
+        Wait until records are written by all handlers of the logger (and its ancestors, respecting `propagate`).
+
+        Handlers that support async flush (see `AsyncFlushable`) are awaited without blocking the event loop, other
+        handlers are not flushed.
+        """
+        handlers = list[AsyncFlushable]()
+
+        logger: t.Optional[logging.Logger] = self.logger
+        while logger is not None:
+            handlers.extend(handler for handler in logger.handlers if isinstance(handler, AsyncFlushable))
+            logger = logger.parent if logger.propagate else None
+
+        if handlers:
+            await asyncio.gather(*(handler.aflush() for handler in handlers))
+
 
 get_logger = Logger.get_by_name
 
@@ -8,6 +8,8 @@ from typing_extensions import override
 
 from no_log_tears.logger import Logger
 
+_MIXIN_ATTRS: t.Final[frozenset[str]] = frozenset({"_logger"})
+
 
 class LoggerMixin:
     """
@@ -27,6 +29,9 @@ class LoggableMixin(LoggerMixin):
     Mixin for objects that can be logged.
 
     Implements `__str__` method that returns object representation based on current logging level of the class.
+
+    Implements `__log__` method that returns compact structured object representation based on logging level of the
+    record (used by structured formatters, e.g. `JSONFormatter`).
     """
 
     @override
@@ -41,18 +46,44 @@ class LoggableMixin(LoggerMixin):
             else repr(self)
         )
 
+    def __log__(self, level: int) -> t.Mapping[str, object]:
+        """Return structured object representation based on logging level (instance attributes are added on DEBUG)."""
+        info: dict[str, object] = {
+            "type": f"{self.__class__.__module__}.{self.__class__.__qualname__}",
+            "id": hex(id(self)),
+        }
+
+        if level <= logging.DEBUG:
+            info["attrs"] = {
+                key: value for key, value in getattr(self, "__dict__", {}).items() if key not in _MIXIN_ATTRS
+            }
+
+        return info
+
 
 class LogMixin(LoggerMixin):
     """
     Mixin for objects that can log messages.
 
     Provides `_log` property for logging from the instance with extra values.
-    `_log_extra` method can be implemented to provide extra values for logger.
+    `_log_extra` method can be implemented to provide extra values for logger. It is evaluated lazily -- only when a
+    record passes the level check, so it always reflects the current instance state and disabled log calls (e.g.
+    `self._log.debug(...)` at `INFO` level) don't invoke it at all.
     """
 
+    __lazy_extra: t.ClassVar[bool] = False
+
+    @override
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.__lazy_extra = cls._log_extra is not LogMixin._log_extra
+
     @property
     def _log(self) -> Logger:
-        return self._logger.with_extra(self._log_extra())
+        if not self.__lazy_extra:
+            return self._logger
+
+        return Logger(self._logger.logger, self._logger.extra, extra_factory=self._log_extra)
 
     def _log_extra(self) -> t.Optional[t.Mapping[str, object]]:
         return None
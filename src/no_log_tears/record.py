@@ -8,6 +8,34 @@ import typing as t
 if t.TYPE_CHECKING:
     from types import TracebackType
 
+BASE_FIELDS: t.Final[frozenset[str]] = frozenset(
+    {
+        "args",
+        "asctime",
+        "created",
+        "exc_info",
+        "exc_text",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "msg",
+        "name",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "stack_info",
+        "taskName",
+        "thread",
+        "threadName",
+    }
+)
+"""Base fields of `logging.LogRecord` (including `asctime` that is set by formatters)."""
+
 
 class Record(logging.LogRecord):
     """
@@ -40,9 +68,9 @@ class Record(logging.LogRecord):
         """Create custom log record."""
         super().__init__(_name, _level, _pathname, _lineno, _msg, _args, _exc_info, _func, _sinfo)
 
+        # NOTE: record attributes are updated in bulk: a single dict update per source instead of `setattr` per key.
         if _extra:
-            for key, value in _extra.items():
-                setattr(_self, key, value)
+            _self.__dict__.update(_extra)
 
-        for key, value in kwargs.items():
-            setattr(_self, key, value)
+        if kwargs:
+            _self.__dict__.update(kwargs)
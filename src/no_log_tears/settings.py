@@ -89,7 +89,13 @@ class LoggingSettings(BaseSettings):
         class_: t.Union[str, type[object]] = Field(alias="class")
 
     class RootLogger(BaseModel):
-        """Root logger settings."""
+        """
+        Root logger settings.
+
+        Extra options are passed to `DictConfigurator`, e.g. `caller` -- caller info lookup mode (see `CallerMode`).
+        """
+
+        model_config = ConfigDict(extra="allow")
 
         level: t.Optional[LoggingLevel] = None
         handlers: t.Optional[t.Sequence[str]] = None
@@ -102,6 +108,8 @@ class LoggingSettings(BaseSettings):
     version: t.Literal[1] = 1
     incremental: bool = False
     capture_warnings: bool = True
+    disable_unused_record_fields: bool = False
+    flatten_handlers: bool = False
     disable_existing_loggers: t.Optional[bool] = False
     root: t.Optional[RootLogger] = None
     loggers: t.Optional[t.Mapping[str, Logger]] = None
@@ -0,0 +1,100 @@
+import logging
+import os
+import threading
+import time
+import traceback
+import typing as t
+
+import pytest
+
+from no_log_tears.caller import set_caller_modes
+from no_log_tears.dispatch import set_handler_dispatch
+
+ForkRunner = t.Callable[[t.Callable[[], None]], int]
+LoadRunner = t.Callable[[logging.Handler, t.Callable[[], None]], list[str]]
+
+
+@pytest.fixture
+def restore_logging() -> t.Iterator[None]:
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    level = root.level
+    flags = {flag: getattr(logging, flag) for flag in ("logThreads", "logProcesses", "logMultiprocessing")}
+
+    try:
+        yield
+
+    finally:
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        for handler in handlers:
+            root.addHandler(handler)
+        root.setLevel(level)
+        for flag, value in flags.items():
+            setattr(logging, flag, value)
+        set_caller_modes({})
+        set_handler_dispatch(False)
+
+
+@pytest.fixture
+def run_in_fork() -> ForkRunner:
+    """Run the function in a forked child process, return the child exit code."""
+    if not hasattr(os, "fork"):
+        pytest.skip("os.fork is not available")
+
+    def run(func: t.Callable[[], None]) -> int:
+        pid = os.fork()
+
+        if pid == 0:
+            code = 1
+            try:
+                func()
+                code = 0
+
+            except BaseException:  # noqa: BLE001
+                traceback.print_exc()
+
+            finally:
+                # NOTE: skip pytest & atexit handlers of the parent process.
+                os._exit(code)
+
+        _, status = os.waitpid(pid, 0)
+        return os.waitstatus_to_exitcode(status)
+
+    return run
+
+
+@pytest.fixture
+def emit_under_load() -> LoadRunner:
+    """Call the action while threads emit records to the handler, return messages of the emitted records."""
+    return _emit_under_load
+
+
+def _emit_under_load(handler: logging.Handler, action: t.Callable[[], None], threads: int = 4) -> list[str]:
+    stop = threading.Event()
+    messages = [list[str]() for _ in range(threads)]
+
+    def emit(index: int) -> None:
+        i = 0
+        while not stop.is_set() or i < 100:  # noqa: PLR2004
+            msg = f"parent {index} {i}"
+            handler.handle(
+                logging.makeLogRecord({"name": "app", "msg": msg, "levelname": "INFO", "levelno": logging.INFO})
+            )
+            messages[index].append(msg)
+            i += 1
+
+    workers = [threading.Thread(target=emit, args=(index,)) for index in range(threads)]
+    for worker in workers:
+        worker.start()
+
+    try:
+        time.sleep(0.01)
+        action()
+
+    finally:
+        stop.set()
+        for worker in workers:
+            worker.join()
+
+    return [msg for thread_messages in messages for msg in thread_messages]
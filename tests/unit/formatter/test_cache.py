@@ -0,0 +1,41 @@
+import io
+import logging
+
+import pytest
+from typing_extensions import override
+
+from no_log_tears.formatter.json import JSONFormatter
+from no_log_tears.formatter.soft import SoftFormatter
+
+
+class CountingMessage:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @override
+    def __str__(self) -> str:
+        self.calls += 1
+        return "hello"
+
+
+@pytest.mark.parametrize(
+    "formatter",
+    [
+        pytest.param(SoftFormatter("%(levelname)s %(message)s"), id="soft"),
+        pytest.param(JSONFormatter(fields=["levelname", "message"]), id="json"),
+    ],
+)
+def test_record_is_formatted_once_for_shared_formatter(formatter: logging.Formatter) -> None:
+    streams = [io.StringIO(), io.StringIO()]
+    logger = logging.Logger("test-format-once")  # noqa: LOG001
+    for stream in streams:
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+
+    msg = CountingMessage()
+    logger.warning(msg)
+    logger.warning(msg)
+
+    assert msg.calls == 2  # noqa: PLR2004
+    assert streams[0].getvalue() == streams[1].getvalue() != ""
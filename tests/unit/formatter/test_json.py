@@ -1,13 +1,47 @@
 import json
+import logging
 import sys
+import typing as t
+from datetime import timedelta
 from unittest.mock import ANY
 
 import pytest
 
-from no_log_tears.formatter.json import JSONFormatter
+from no_log_tears.formatter.json import JSONFormatter, LogAdapter
+from no_log_tears.mixin import LoggableMixin
 from no_log_tears.record import Record
 
 
+class Point:
+    def __init__(self, x: int, y: int) -> None:
+        self.x = x
+        self.y = y
+
+    def __log__(self, level: int) -> object:
+        return {"x": self.x, "y": self.y} if level <= logging.DEBUG else [self.x, self.y]
+
+
+class Entity(LoggableMixin):
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class Node:
+    def __init__(self, child: t.Optional["Node"] = None) -> None:
+        self.child = child
+
+    def __log__(self, _: int) -> object:
+        return {"child": self.child}
+
+
+class Payload:
+    def __init__(self, value: object) -> None:
+        self.value = value
+
+    def __log__(self, _: int) -> object:
+        return self.value
+
+
 @pytest.mark.parametrize(
     ("record_extra", "expected_json"),
     [
@@ -80,6 +114,136 @@ def test_json_format_ok(
     assert json.loads(formatter.format(record)) == expected_json
 
 
+@pytest.mark.parametrize(
+    ("record_level", "record_extra", "adapters", "max_depth", "max_items", "expected_value"),
+    [
+        pytest.param(
+            logging.INFO,
+            {"value": Point(1, 2)},
+            None,
+            None,
+            None,
+            [1, 2],
+            id="__log__ info",
+        ),
+        pytest.param(
+            logging.DEBUG,
+            {"value": Point(1, 2)},
+            None,
+            None,
+            None,
+            {"x": 1, "y": 2},
+            id="__log__ debug",
+        ),
+        pytest.param(
+            logging.INFO,
+            {"value": (Point(1, 2), timedelta(seconds=3))},
+            {Point: lambda obj, _: f"{obj.x}:{obj.y}"},
+            None,
+            None,
+            ["1:2", "0:00:03"],
+            id="adapter has priority",
+        ),
+        pytest.param(
+            logging.INFO,
+            {"value": Node(Node(Node(Node())))},
+            None,
+            3,
+            None,
+            {"child": {"child": {"child": "..."}}},
+            id="depth limit",
+        ),
+        pytest.param(
+            logging.INFO,
+            {"value": Payload({"items": list(range(10)), "set": {"a"}})},
+            None,
+            None,
+            3,
+            {"items": [0, 1, 2, "... +7 items"], "set": ["a"]},
+            id="items limit",
+        ),
+    ],
+)
+def test_json_format_value_ok(
+    formatter: JSONFormatter,
+    record: Record,
+    expected_value: object,
+) -> None:
+    assert json.loads(formatter.format(record))["value"] == expected_value
+
+
+@pytest.mark.parametrize(
+    ("record_args", "record_extra"),
+    [
+        pytest.param(("spam",), {"custom": "value"}),
+    ],
+)
+def test_json_format_fields_ok(record: Record) -> None:
+    formatter = JSONFormatter(fields=["levelname", "message", "missing", "__other__"], exclude="__base__")
+    record.msg = "hello %s"
+
+    assert json.loads(formatter.format(record)) == {
+        "levelname": "INFO",
+        "message": "hello spam",
+        "missing": None,
+        "custom": "value",
+    }
+
+
+def test_json_format_strings_are_limited(record: Record) -> None:
+    formatter = JSONFormatter(max_string=5, max_bytes=1_000)
+    record.body = "x" * 1_000_000
+
+    assert json.loads(formatter.format(record))["body"] == "xxxxx...(+999995 chars)"
+
+
+@pytest.mark.parametrize(
+    ("record_level", "expected_attrs"),
+    [
+        pytest.param(logging.INFO, None),
+        pytest.param(logging.DEBUG, {"name": "spam"}),
+    ],
+)
+def test_json_format_loggable_ok(
+    formatter: JSONFormatter,
+    record: Record,
+    entity: Entity,
+    expected_attrs: t.Optional[dict[str, object]],
+) -> None:
+    record.entity = entity
+    _ = entity._logger  # noqa: SLF001
+
+    assert json.loads(formatter.format(record))["entity"] == {
+        "type": f"{Entity.__module__}.{Entity.__qualname__}",
+        "id": hex(id(entity)),
+        **({"attrs": expected_attrs} if expected_attrs is not None else {}),
+    }
+
+
+@pytest.fixture
+def adapters() -> t.Optional[t.Mapping[type[object], LogAdapter]]:
+    return None
+
+
+@pytest.fixture
+def max_depth() -> t.Optional[int]:
+    return 10
+
+
+@pytest.fixture
+def max_items() -> t.Optional[int]:
+    return None
+
+
+@pytest.fixture
+def entity() -> Entity:
+    return Entity("spam")
+
+
 @pytest.fixture
-def formatter() -> JSONFormatter:
-    return JSONFormatter()
+def formatter(
+    adapters: t.Optional[t.Mapping[type[object], LogAdapter]],
+    max_depth: t.Optional[int],
+    max_items: t.Optional[int],
+) -> JSONFormatter:
+    return JSONFormatter(adapters=adapters, max_depth=max_depth, max_items=max_items)
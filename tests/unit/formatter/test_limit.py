@@ -0,0 +1,77 @@
+import logging
+
+import pytest
+from typing_extensions import override
+
+from no_log_tears.formatter.limit import ValueLimiter, Verbatim
+
+
+class Blob:
+    @override
+    def __repr__(self) -> str:
+        return "<blob>"
+
+
+@pytest.mark.parametrize(
+    ("limiter", "value", "expected"),
+    [
+        pytest.param(
+            ValueLimiter(default=str),
+            {"a": [1, (2, 3)], "b": {4}},
+            {"a": [1, [2, 3]], "b": [4]},
+            id="no limits",
+        ),
+        pytest.param(
+            ValueLimiter(default=str, max_string=3),
+            ["abcdef", "abc"],
+            ["abc...(+3 chars)", "abc"],
+            id="string",
+        ),
+        pytest.param(
+            ValueLimiter(default=str, max_items=2),
+            {"a": list(range(5)), "b": 1, "c": 2},
+            {"a": [0, 1, "... +3 items"], "b": 1, "...": "+1 items"},
+            id="items",
+        ),
+        pytest.param(
+            ValueLimiter(default=str, max_depth=2),
+            [[[1]], 2],
+            [["..."], 2],
+            id="depth",
+        ),
+        pytest.param(
+            ValueLimiter(default=str, max_bytes=10),
+            ["abcdef", "abcdef", "abcdef"],
+            ["abcdef", "abcd...(+2 chars)", "..."],
+            id="bytes",
+        ),
+        pytest.param(
+            ValueLimiter(default=lambda obj: Verbatim(repr(obj)), max_string=3),
+            [Blob()],
+            [Verbatim("<bl...(+3 chars)")],
+            id="default",
+        ),
+        pytest.param(
+            ValueLimiter(default=str, resolve_adapter=lambda tp: (lambda _obj, _level: "blob") if tp is Blob else None),
+            {"x": Blob()},
+            {"x": "blob"},
+            id="adapter",
+        ),
+    ],
+)
+def test_convert_ok(limiter: ValueLimiter, value: object, expected: object) -> None:
+    assert limiter.convert(value, logging.INFO) == expected
+
+
+def test_convert_fields_shares_budget() -> None:
+    limiter = ValueLimiter(default=str, max_bytes=8)
+
+    assert limiter.convert_fields({"a": "x" * 5, "b": "y" * 5, "c": "z"}, logging.INFO) == {
+        "a": "xxxxx",
+        "b": "yyy...(+2 chars)",
+        "c": "...",
+    }
+
+
+def test_verbatim_repr() -> None:
+    assert repr([Verbatim("<blob>"), "str"]) == "[<blob>, 'str']"
@@ -1,11 +1,18 @@
 import typing as t
 
 import pytest
+from typing_extensions import override
 
 from no_log_tears.formatter.soft import SoftFormatter
 from no_log_tears.record import Record
 
 
+class Blob:
+    @override
+    def __repr__(self) -> str:
+        return "<blob>"
+
+
 @pytest.mark.parametrize(
     ("fmt", "exclude", "record_msg", "record_extra", "expected_str"),
     [
@@ -65,3 +72,13 @@ def exclude() -> t.Optional[str]:
 @pytest.fixture
 def formatter(fmt: t.Optional[str], exclude: t.Optional[str]) -> SoftFormatter:
     return SoftFormatter(fmt=fmt, exclude=exclude)
+
+
+def test_soft_format_other_is_limited(record: Record) -> None:
+    formatter = SoftFormatter(fmt="%(message)s %(__other__)s", exclude="__base__", max_string=4, max_items=2)
+    record.payload = {"body": "x" * 1_000_000, "rows": [Blob()] * 1_000}
+
+    assert formatter.format(record) == (
+        "test-msg {'payload': {'body': 'xxxx...(+999996 chars)', 'rows': [<blo...(+2 chars), <blo...(+2 chars), "
+        "'... +998 items']}}"
+    )
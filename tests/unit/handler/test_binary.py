@@ -0,0 +1,67 @@
+import io
+import logging
+from pathlib import Path
+
+from no_log_tears.binary import BinaryDecoder
+from no_log_tears.handler.binary import BinaryFileHandler
+from tests.unit.conftest import ForkRunner, LoadRunner
+
+
+def test_file_can_be_appended_by_multiple_handlers(tmp_path: Path) -> None:
+    path = tmp_path / "app.nltb"
+
+    for messages in (["first", "second"], ["third"]):
+        handler = BinaryFileHandler(path)
+        for msg in messages:
+            handler.handle(
+                logging.makeLogRecord({"name": "app", "levelno": logging.INFO, "msg": msg, "extra_value": msg.upper()})
+            )
+        handler.close()
+
+    with path.open("rb") as stream:
+        records = list(BinaryDecoder().decode_stream(stream))
+
+    assert [(record.getMessage(), record.extra_value) for record in records] == [  # type: ignore[attr-defined]
+        ("first", "FIRST"),
+        ("second", "SECOND"),
+        ("third", "THIRD"),
+    ]
+
+
+def test_file_is_not_created_until_first_record_if_delayed(tmp_path: Path) -> None:
+    path = tmp_path / "app.nltb"
+    handler = BinaryFileHandler(path, delay=True)
+
+    assert not path.exists()
+
+    handler.handle(logging.makeLogRecord({"name": "app", "levelno": logging.INFO, "msg": "hello"}))
+    handler.close()
+
+    assert [record.getMessage() for record in BinaryDecoder().decode_stream(io.BytesIO(path.read_bytes()))] == ["hello"]
+
+
+def test_fork_under_load(run_in_fork: ForkRunner, emit_under_load: LoadRunner, tmp_path: Path) -> None:
+    path = tmp_path / "app.nltb"
+    handler = BinaryFileHandler(path)
+    exit_codes = list[int]()
+
+    def child() -> None:
+        for i in range(100):
+            handler.handle(logging.makeLogRecord({"name": "app", "levelno": logging.INFO, "msg": f"child {i}"}))
+        handler.close()
+
+    messages = emit_under_load(handler, lambda: exit_codes.append(run_in_fork(child)))
+    handler.close()
+
+    # NOTE: child process writes to its own file (see `get_process_path`).
+    child_files = [p for p in path.parent.iterdir() if p != path]
+
+    assert exit_codes == [0]
+    assert sorted(read_messages(path)) == sorted(messages)
+    assert len(child_files) == 1
+    assert read_messages(child_files[0]) == [f"child {i}" for i in range(100)]
+
+
+def read_messages(path: Path) -> list[str]:
+    with path.open("rb") as stream:
+        return [record.getMessage() for record in BinaryDecoder().decode_stream(stream)]
@@ -0,0 +1,95 @@
+import logging
+from pathlib import Path
+
+import pytest
+
+from no_log_tears.formatter.json import JSONFormatter
+from no_log_tears.handler.file import MemoryMappedFileHandler
+from tests.unit.conftest import ForkRunner, LoadRunner
+
+
+def test_file_is_preallocated_and_trimmed_on_close(path: Path) -> None:
+    handler = MemoryMappedFileHandler(path, segment_size=4096)
+    emit(handler, "first", "second")
+
+    assert path.stat().st_size == 4096  # noqa: PLR2004
+    assert path.read_bytes().rstrip(b"\x00") == b"first\nsecond\n"
+
+    handler.close()
+
+    assert path.read_text() == "first\nsecond\n"
+
+
+def test_file_grows_by_segments(path: Path) -> None:
+    handler = MemoryMappedFileHandler(path, segment_size=16)
+    messages = [f"message {i}" for i in range(10)]
+    emit(handler, *messages)
+    handler.close()
+
+    assert path.read_text().splitlines() == messages
+
+
+def test_file_is_rotated(path: Path) -> None:
+    handler = MemoryMappedFileHandler(path, segment_size=64, max_bytes=20, backup_count=2)
+    emit(handler, "message 0", "message 1", "message 2", "message 3", "message 4", "message 5")
+    handler.close()
+
+    assert [(path.with_name(f"{path.name}{suffix}")).read_text().splitlines() for suffix in ("", ".1", ".2")] == [
+        ["message 4", "message 5"],
+        ["message 2", "message 3"],
+        ["message 0", "message 1"],
+    ]
+    assert not path.with_name(f"{path.name}.3").exists()
+
+
+def test_records_survive_without_close_and_file_is_continued(path: Path) -> None:
+    crashed = MemoryMappedFileHandler(path, segment_size=4096)
+    emit(crashed, "before crash")
+
+    # NOTE: the handler is not closed (as if the process was killed), file has zero bytes slack.
+    assert path.read_bytes().rstrip(b"\x00") == b"before crash\n"
+
+    handler = MemoryMappedFileHandler(path, segment_size=4096)
+    emit(handler, "after restart")
+    handler.close()
+
+    assert path.read_text() == "before crash\nafter restart\n"
+
+
+def test_json_formatter_output(path: Path) -> None:
+    handler = MemoryMappedFileHandler(path)
+    handler.setFormatter(JSONFormatter(fields=["levelname", "message"]))
+    emit(handler, "hello")
+    handler.close()
+
+    assert path.read_text() == '{"levelname":"INFO","message":"hello"}\n'
+
+
+def test_fork_under_load(run_in_fork: ForkRunner, emit_under_load: LoadRunner, path: Path) -> None:
+    handler = MemoryMappedFileHandler(path, segment_size=4096)
+    exit_codes = list[int]()
+
+    def child() -> None:
+        emit(handler, *(f"child {i}" for i in range(100)))
+        handler.close()
+
+    messages = emit_under_load(handler, lambda: exit_codes.append(run_in_fork(child)))
+    handler.close()
+
+    # NOTE: child process writes to its own file (see `get_process_path`).
+    child_files = [p for p in path.parent.iterdir() if p != path]
+
+    assert exit_codes == [0]
+    assert sorted(path.read_text().splitlines()) == sorted(messages)
+    assert len(child_files) == 1
+    assert child_files[0].read_text().splitlines() == [f"child {i}" for i in range(100)]
+
+
+def emit(handler: logging.Handler, *messages: str) -> None:
+    for msg in messages:
+        handler.handle(logging.makeLogRecord({"msg": msg, "levelname": "INFO", "levelno": logging.INFO}))
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    return tmp_path / "app.log"
@@ -0,0 +1,198 @@
+import json
+import logging
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+import typing as t
+from pathlib import Path
+
+import pytest
+from typing_extensions import override
+
+from no_log_tears.handler.network import NetworkHandler
+from tests.unit.conftest import ForkRunner, LoadRunner
+
+
+class Collector:
+    """Log collector stand-in: accepts connections and collects received lines."""
+
+    def __init__(self, server_type: type[socketserver.BaseServer], address: t.Union[str, tuple[str, int]]) -> None:
+        self.lines = list[str]()
+        lines = self.lines
+
+        class Handler(socketserver.StreamRequestHandler):
+            @override
+            def handle(self) -> None:
+                lines.extend(line.decode().rstrip("\n") for line in self.rfile)
+
+        self.server = server_type(address, Handler)
+        self.server.daemon_threads = True  # type: ignore[attr-defined]
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.01,), daemon=True)
+        self.thread.start()
+
+    @property
+    def messages(self) -> list[str]:
+        return [json.loads(line)["msg"] for line in self.lines]
+
+    def wait(self, count: int, timeout: float = 5.0) -> None:
+        deadline = time.monotonic() + timeout
+        while len(self.lines) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def test_records_are_sent_over_tcp(port: int) -> None:
+    collector = Collector(socketserver.ThreadingTCPServer, ("127.0.0.1", port))
+    handler = NetworkHandler(host="127.0.0.1", port=port, connections=2)
+
+    try:
+        for i in range(100):
+            handler.handle(logging.makeLogRecord({"msg": f"msg {i}"}))
+
+        handler.close()
+        collector.wait(100)
+
+    finally:
+        collector.stop()
+
+    assert sorted(collector.messages) == sorted(f"msg {i}" for i in range(100))
+
+
+def test_records_are_sent_over_unix_socket() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "collector.sock")
+        collector = Collector(socketserver.ThreadingUnixStreamServer, path)
+        handler = NetworkHandler(path=path)
+
+        try:
+            handler.handle(logging.makeLogRecord({"msg": "first"}))
+            handler.handle(logging.makeLogRecord({"msg": "second"}))
+
+            handler.close()
+            collector.wait(2)
+
+        finally:
+            collector.stop()
+
+    assert collector.messages == ["first", "second"]
+
+
+def test_records_are_buffered_until_collector_is_up(port: int) -> None:
+    handler = NetworkHandler(host="127.0.0.1", port=port, backoff_base=0.01, backoff_max=0.05)
+
+    try:
+        for i in range(10):
+            handler.handle(logging.makeLogRecord({"msg": f"msg {i}"}))
+
+        time.sleep(0.1)
+        collector = Collector(socketserver.ThreadingTCPServer, ("127.0.0.1", port))
+
+        try:
+            collector.wait(10)
+
+        finally:
+            collector.stop()
+
+    finally:
+        handler.close()
+
+    assert collector.messages == [f"msg {i}" for i in range(10)]
+
+
+def test_oldest_records_are_dropped_when_buffer_is_full(port: int) -> None:
+    handler = NetworkHandler(host="127.0.0.1", port=port, max_queue_size=3, timeout=0.1)
+
+    for i in range(10):
+        handler.handle(logging.makeLogRecord({"msg": f"msg {i}"}))
+
+    handler.close()
+
+    assert handler.dropped == 10  # noqa: PLR2004
+
+
+def test_records_are_spilled_to_disk_and_replayed(port: int, tmp_path: Path) -> None:
+    spill_path = tmp_path / "spill.ndjson"
+    handler = NetworkHandler(
+        host="127.0.0.1",
+        port=port,
+        spill_path=str(spill_path),
+        backoff_base=0.01,
+        backoff_max=0.05,
+    )
+
+    try:
+        for i in range(10):
+            handler.handle(logging.makeLogRecord({"msg": f"msg {i}"}))
+
+        deadline = time.monotonic() + 5.0
+        while not spill_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        spilled = spill_path.read_text().count("\n")
+        collector = Collector(socketserver.ThreadingTCPServer, ("127.0.0.1", port))
+
+        try:
+            collector.wait(10)
+
+        finally:
+            collector.stop()
+
+    finally:
+        handler.close()
+
+    assert spilled > 0
+    assert not spill_path.exists()
+    assert collector.messages == [f"msg {i}" for i in range(10)]
+
+
+def test_emit_does_not_block_when_collector_is_down(port: int) -> None:
+    handler = NetworkHandler(host="127.0.0.1", port=port, timeout=0.1)
+
+    start = time.perf_counter()
+    for i in range(1000):
+        handler.handle(logging.makeLogRecord({"msg": f"msg {i}"}))
+    elapsed = time.perf_counter() - start
+
+    handler.close()
+
+    assert elapsed < 1.0
+
+
+def test_address_is_required() -> None:
+    with pytest.raises(ValueError, match="either path or host and port must be provided"):
+        NetworkHandler(host="127.0.0.1")
+
+
+def test_fork_under_load(run_in_fork: ForkRunner, emit_under_load: LoadRunner, port: int) -> None:
+    collector = Collector(socketserver.ThreadingTCPServer, ("127.0.0.1", port))
+    handler = NetworkHandler(host="127.0.0.1", port=port, connections=2)
+    exit_codes = list[int]()
+
+    def child() -> None:
+        for i in range(100):
+            handler.handle(logging.makeLogRecord({"msg": f"child {i}"}))
+        handler.close()
+
+    try:
+        messages = emit_under_load(handler, lambda: exit_codes.append(run_in_fork(child)))
+        handler.close()
+        collector.wait(len(messages) + 100)
+
+    finally:
+        collector.stop()
+
+    assert exit_codes == [0]
+    assert sorted(collector.messages) == sorted([*messages, *(f"child {i}" for i in range(100))])
+
+
+@pytest.fixture
+def port() -> int:
+    # NOTE: get a free port, nothing listens on it until collector is started.
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return t.cast(int, sock.getsockname()[1])
@@ -0,0 +1,156 @@
+import asyncio
+import io
+import logging
+import threading
+import typing as t
+from pathlib import Path
+
+import pytest
+from typing_extensions import override
+
+from no_log_tears.handler.stream import AsyncStreamHandler
+from no_log_tears.logger import Logger
+from tests.unit.conftest import ForkRunner, LoadRunner
+
+
+class BlockingStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.unblocked = threading.Event()
+
+    @override
+    def write(self, s: str) -> int:
+        self.unblocked.wait()
+        return super().write(s)
+
+
+def test_records_are_written_in_order_on_flush(handler: AsyncStreamHandler, stream: io.StringIO) -> None:
+    for i in range(100):
+        handler.handle(logging.makeLogRecord({"msg": "msg %d", "args": (i,)}))
+
+    handler.flush()
+
+    assert stream.getvalue() == "".join(f"msg {i}\n" for i in range(100))
+
+
+def test_records_are_written_on_close(handler: AsyncStreamHandler, stream: io.StringIO) -> None:
+    handler.handle(logging.makeLogRecord({"msg": "first"}))
+    handler.handle(logging.makeLogRecord({"msg": "second"}))
+
+    handler.close()
+
+    assert stream.getvalue() == "first\nsecond\n"
+
+
+def test_filters_are_applied(handler: AsyncStreamHandler, stream: io.StringIO) -> None:
+    handler.addFilter(lambda record: record.msg != "skip")
+
+    assert handler.handle(logging.makeLogRecord({"msg": "skip"})) is False
+    assert handler.handle(logging.makeLogRecord({"msg": "keep"})) is True
+
+    handler.flush()
+
+    assert stream.getvalue() == "keep\n"
+
+
+def test_concurrent_emits_are_written(handler: AsyncStreamHandler, stream: io.StringIO) -> None:
+    def emit(i: int) -> None:
+        for j in range(100):
+            handler.handle(logging.makeLogRecord({"msg": "%d-%d", "args": (i, j)}))
+
+    threads = [threading.Thread(target=emit, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    handler.flush()
+
+    assert sorted(stream.getvalue().splitlines()) == sorted(f"{i}-{j}" for i in range(8) for j in range(100))
+
+
+def test_emit_does_not_block_on_stream_write(blocking_stream: BlockingStream) -> None:
+    handler = AsyncStreamHandler(blocking_stream)
+
+    handler.handle(logging.makeLogRecord({"msg": "first"}))
+    handler.handle(logging.makeLogRecord({"msg": "second"}))
+
+    assert blocking_stream.getvalue() == ""
+
+    blocking_stream.unblocked.set()
+    handler.close()
+
+    assert blocking_stream.getvalue() == "first\nsecond\n"
+
+
+def test_records_are_dropped_when_queue_is_full(blocking_stream: BlockingStream) -> None:
+    handler = AsyncStreamHandler(blocking_stream, max_queue_size=2)
+
+    for i in range(10):
+        handler.handle(logging.makeLogRecord({"msg": "msg %d", "args": (i,)}))
+
+    blocking_stream.unblocked.set()
+    handler.close()
+
+    assert handler.dropped > 0
+    assert blocking_stream.getvalue().endswith(f"... {handler.dropped} log records were dropped (queue is full)\n")
+
+
+def test_logger_aflush_waits_for_handlers(handler: AsyncStreamHandler, stream: io.StringIO) -> None:
+    logger = logging.Logger("test-aflush")  # noqa: LOG001
+    logger.addHandler(handler)
+    log = Logger(logger)
+
+    async def main() -> str:
+        for i in range(10):
+            log.warning("msg %d", i)
+
+        await log.aflush()
+
+        return stream.getvalue()
+
+    assert asyncio.run(main()) == "".join(f"msg {i}\n" for i in range(10))
+
+
+def test_fork_under_load(run_in_fork: ForkRunner, emit_under_load: LoadRunner, tmp_path: Path) -> None:
+    path = tmp_path / "app.log"
+    exit_codes = list[int]()
+
+    with path.open("a") as stream:
+        handler = AsyncStreamHandler(stream)
+
+        def child() -> None:
+            for i in range(100):
+                handler.handle(logging.makeLogRecord({"msg": f"child {i}"}))
+            handler.close()
+
+        messages = emit_under_load(handler, lambda: exit_codes.append(run_in_fork(child)))
+        handler.close()
+
+    assert exit_codes == [0]
+    assert sorted(path.read_text().splitlines()) == sorted([*messages, *(f"child {i}" for i in range(100))])
+
+
+@pytest.fixture
+def stream() -> io.StringIO:
+    return io.StringIO()
+
+
+@pytest.fixture
+def handler(stream: io.StringIO) -> t.Iterator[AsyncStreamHandler]:
+    handler = AsyncStreamHandler(stream)
+    try:
+        yield handler
+
+    finally:
+        handler.close()
+
+
+@pytest.fixture
+def blocking_stream() -> t.Iterator[BlockingStream]:
+    stream = BlockingStream()
+    try:
+        yield stream
+
+    finally:
+        stream.unblocked.set()
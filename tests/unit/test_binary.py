@@ -0,0 +1,132 @@
+import io
+import json
+import logging
+import typing as t
+from datetime import date
+from types import TracebackType
+
+import pytest
+
+from no_log_tears.binary import BinaryDecodeError, BinaryDecoder, BinaryEncoder, RecordFilter
+from no_log_tears.formatter.json import JSONFormatter
+from no_log_tears.formatter.soft import SoftFormatter
+
+
+def test_decoded_records_are_formatted_the_same(records: list[logging.LogRecord]) -> None:
+    decoded = decode(encode(records))
+    json_formatter = JSONFormatter(fields=["message", "__other__"], exclude=["msecs", "exc_info", "asctime"])
+    soft_formatter = SoftFormatter("%(levelname)s %(name)s %(module)s.%(funcName)s:%(lineno)d %(message)s %(exc_text)s")
+
+    assert [json.loads(json_formatter.format(record)) for record in decoded] == [
+        json.loads(json_formatter.format(record)) for record in records
+    ]
+    assert [soft_formatter.format(record) for record in decoded] == [
+        soft_formatter.format(record) for record in records
+    ]
+
+
+def test_record_time_has_microseconds_precision(records: list[logging.LogRecord]) -> None:
+    assert [record.created for record in decode(encode(records))] == [round(record.created, 6) for record in records]
+
+
+@pytest.mark.parametrize(
+    ("record_filter", "expected_messages"),
+    [
+        pytest.param(RecordFilter(level=logging.WARNING), ["db is slow", "failed: 1"], id="level"),
+        pytest.param(RecordFilter(loggers=["app"]), ["hello world", "db is slow"], id="logger"),
+        pytest.param(RecordFilter(loggers=["app.db", "other"]), ["db is slow", "failed: 1"], id="loggers"),
+        pytest.param(RecordFilter(since=1000.5, until=2000.0), ["db is slow"], id="time"),
+    ],
+)
+def test_records_are_filtered(
+    records: list[logging.LogRecord],
+    record_filter: RecordFilter,
+    expected_messages: list[str],
+) -> None:
+    assert [record.getMessage() for record in decode(encode(records), record_filter)] == expected_messages
+
+
+def test_incomplete_frame_is_ignored(records: list[logging.LogRecord]) -> None:
+    data = encode(records)
+
+    assert [record.getMessage() for record in decode(data[:-1])] == ["hello world", "db is slow"]
+
+
+def test_interned_strings_are_reset_when_limit_is_reached(records: list[logging.LogRecord]) -> None:
+    encoder = BinaryEncoder(max_interned=4)
+    data = encoder.header() + b"".join(encoder.encode(record) for record in records)
+
+    assert [record.getMessage() for record in decode(data)] == ["hello world", "db is slow", "failed: 1"]
+
+
+def test_stream_must_start_with_header(records: list[logging.LogRecord]) -> None:
+    encoder = BinaryEncoder()
+    encoder.header()
+
+    with pytest.raises(BinaryDecodeError, match="must start with header"):
+        decode(encoder.encode(records[0]))
+
+
+def encode(records: t.Sequence[logging.LogRecord]) -> bytes:
+    encoder = BinaryEncoder()
+    return encoder.header() + b"".join(encoder.encode(record) for record in records)
+
+
+def decode(data: bytes, record_filter: t.Optional[RecordFilter] = None) -> list[logging.LogRecord]:
+    return list(BinaryDecoder(record_filter).decode_stream(io.BytesIO(data), chunk_size=16))
+
+
+def get_exc_info() -> tuple[type[BaseException], BaseException, TracebackType]:
+    try:
+        1 / 0  # noqa: B018
+
+    except ZeroDivisionError as err:
+        return type(err), err, t.cast(TracebackType, err.__traceback__)
+
+    raise AssertionError
+
+
+@pytest.fixture
+def records() -> list[logging.LogRecord]:
+    error = logging.makeLogRecord(
+        {
+            "name": "other",
+            "msg": "failed: %(code)s",
+            "args": {"code": 1},
+            "levelno": logging.ERROR,
+            "levelname": "ERROR",
+            "created": 2000.25,
+            "exc_info": get_exc_info(),
+        }
+    )
+
+    return [
+        logging.makeLogRecord(
+            {
+                "name": "app",
+                "msg": "hello %s",
+                "args": ("world",),
+                "levelno": logging.INFO,
+                "levelname": "INFO",
+                "created": 1000.123456,
+                "user": {"id": 42, "tags": ["a", "b"], "ratio": 0.5, "active": True, "parent": None},
+                "day": date(2025, 1, 2),
+            }
+        ),
+        logging.makeLogRecord(
+            {
+                "name": "app.db",
+                "msg": "db is slow",
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "created": 1500.0,
+                "pathname": "/app/db.py",
+                "filename": "db.py",
+                "module": "db",
+                "lineno": 42,
+                "funcName": "query",
+                "elapsed": -1.5,
+            }
+        ),
+        error,
+    ]
@@ -0,0 +1,78 @@
+import logging
+import typing as t
+
+import pytest
+from _pytest.logging import LogCaptureFixture
+
+from no_log_tears.caller import CallerMode, get_caller_mode, set_caller_modes
+from no_log_tears.logger import Logger
+
+
+@pytest.mark.parametrize(
+    ("modes", "name", "expected_mode"),
+    [
+        pytest.param({}, "app", "full"),
+        pytest.param({"": "off"}, "app.db", "off"),
+        pytest.param({"": "off", "app": "frame"}, "app.db", "frame"),
+        pytest.param({"": "off", "app": "frame", "app.db": "full"}, "app.db.pool", "full"),
+        pytest.param({"app": "off"}, "application", "full"),
+    ],
+)
+def test_get_caller_mode(caller_modes: None, name: str, expected_mode: CallerMode) -> None:
+    assert get_caller_mode(name) == expected_mode
+
+
+@pytest.mark.parametrize(
+    ("modes", "expected_caller"),
+    [
+        pytest.param({}, (__file__, "log_via_adapter")),
+        pytest.param({"test": "frame"}, (__file__, "log_via_adapter")),
+        pytest.param({"test": "off"}, ("(unknown file)", "(unknown function)")),
+    ],
+)
+def test_adapter_caller(
+    caller_modes: None,
+    caplog: LogCaptureFixture,
+    expected_caller: tuple[str, str],
+) -> None:
+    with caplog.at_level(logging.DEBUG):
+        log_via_adapter()
+
+    assert [(r.pathname, r.funcName) for r in caplog.records] == [expected_caller]
+
+
+@pytest.mark.parametrize(
+    ("modes", "expected_caller"),
+    [
+        pytest.param({"test": "frame"}, (__file__, "log_via_logger")),
+        pytest.param({"test": "off"}, ("(unknown file)", "(unknown function)")),
+    ],
+)
+def test_builtin_logger_caller(
+    caller_modes: None,
+    caplog: LogCaptureFixture,
+    expected_caller: tuple[str, str],
+) -> None:
+    with caplog.at_level(logging.DEBUG):
+        log_via_logger()
+
+    assert [(r.pathname, r.funcName) for r in caplog.records] == [expected_caller]
+
+
+def log_via_adapter() -> None:
+    Logger.get_by_name("test.caller").info("hello")
+
+
+def log_via_logger() -> None:
+    logging.getLogger("test.caller").info("hello")
+
+
+@pytest.fixture
+def caller_modes(modes: t.Mapping[str, CallerMode]) -> t.Iterator[None]:
+    set_caller_modes(modes)
+
+    try:
+        yield
+
+    finally:
+        set_caller_modes({})
@@ -0,0 +1,132 @@
+import logging
+import logging.handlers
+import typing as t
+
+import pytest
+
+from no_log_tears.caller import get_caller_mode
+from no_log_tears.config import DictConfigurator, get_used_record_fields
+from no_log_tears.formatter.json import JSONFormatter
+from no_log_tears.formatter.soft import SoftFormatter
+
+
+def _with_formatter(handler: logging.Handler, formatter: logging.Formatter) -> logging.Handler:
+    handler.setFormatter(formatter)
+    return handler
+
+
+@pytest.mark.parametrize(
+    ("handler", "expected_fields"),
+    [
+        pytest.param(
+            logging.NullHandler(),
+            frozenset({"message"}),
+            id="no formatter",
+        ),
+        pytest.param(
+            _with_formatter(logging.NullHandler(), logging.Formatter("%(threadName)s %(message)s")),
+            frozenset({"threadName", "message"}),
+            id="builtin formatter",
+        ),
+        pytest.param(
+            _with_formatter(logging.NullHandler(), logging.Formatter("{message}", style="{")),
+            None,
+            id="builtin formatter with { style",
+        ),
+        pytest.param(
+            _with_formatter(logging.NullHandler(), SoftFormatter("%(asctime)s %(process)d %(message)s")),
+            frozenset({"asctime", "process", "message"}),
+            id="soft formatter",
+        ),
+        pytest.param(
+            _with_formatter(logging.NullHandler(), SoftFormatter("%(message)s %(__other__)s")),
+            None,
+            id="soft formatter with other",
+        ),
+        pytest.param(
+            _with_formatter(logging.NullHandler(), JSONFormatter()),
+            None,
+            id="json formatter",
+        ),
+        pytest.param(
+            _with_formatter(logging.NullHandler(), JSONFormatter(fields=["asctime", "message"])),
+            frozenset({"asctime", "message"}),
+            id="json formatter with fields",
+        ),
+        pytest.param(
+            logging.handlers.QueueHandler(t.cast(t.Any, None)),
+            None,
+            id="queue handler",
+        ),
+    ],
+)
+def test_get_used_record_fields(handler: logging.Handler, expected_fields: t.Optional[frozenset[str]]) -> None:
+    assert get_used_record_fields(handler) == expected_fields
+
+
+@pytest.mark.parametrize(
+    ("fmt", "expected_flags"),
+    [
+        pytest.param(
+            "%(message)s",
+            {"logThreads": False, "logProcesses": False, "logMultiprocessing": False},
+        ),
+        pytest.param(
+            "%(threadName)s %(processName)s %(message)s",
+            {"logThreads": True, "logProcesses": False, "logMultiprocessing": True},
+        ),
+        pytest.param(
+            "%(message)s %(__other__)s",
+            {"logThreads": True, "logProcesses": True, "logMultiprocessing": True},
+        ),
+    ],
+)
+def test_configure_disables_unused_record_fields(
+    restore_logging: None,
+    fmt: str,
+    expected_flags: t.Mapping[str, bool],
+) -> None:
+    DictConfigurator(
+        {
+            "version": 1,
+            "formatters": {"custom": {"()": SoftFormatter, "fmt": fmt}},
+            "handlers": {"null": {"class": "logging.NullHandler", "formatter": "custom"}},
+            "root": {"handlers": ["null"]},
+            "disable_existing_loggers": False,
+            "disable_unused_record_fields": True,
+        }
+    ).configure()
+
+    assert {flag: getattr(logging, flag) for flag in expected_flags} == expected_flags
+
+
+def test_configure_caller_modes(restore_logging: None) -> None:
+    DictConfigurator(
+        {
+            "version": 1,
+            "root": {"caller": "frame"},
+            "loggers": {"app.db": {"caller": "off"}},
+            "disable_existing_loggers": False,
+        }
+    ).configure()
+
+    assert [get_caller_mode(name) for name in ("app", "app.db.pool")] == ["frame", "off"]
+
+
+def test_configure_invalid_caller_mode(restore_logging: None) -> None:
+    with pytest.raises(ValueError, match="invalid caller mode"):
+        DictConfigurator({"version": 1, "root": {"caller": "fast"}, "disable_existing_loggers": False}).configure()
+
+
+def test_configure_flatten_handlers(restore_logging: None) -> None:
+    DictConfigurator(
+        {
+            "version": 1,
+            "handlers": {"null": {"class": "logging.NullHandler"}},
+            "root": {"handlers": ["null"]},
+            "disable_existing_loggers": False,
+            "flatten_handlers": True,
+        }
+    ).configure()
+
+    assert logging.Logger.callHandlers.__module__ == "no_log_tears.dispatch"
@@ -0,0 +1,91 @@
+import logging
+import typing as t
+import uuid
+
+import pytest
+from typing_extensions import override
+
+from no_log_tears.dispatch import invalidate_handler_dispatch, set_handler_dispatch
+
+
+class ListHandler(logging.Handler):
+    def __init__(self, level: int = logging.NOTSET) -> None:
+        super().__init__(level)
+        self.messages = list[str]()
+
+    @override
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+def test_handlers_of_hierarchy_are_called(name: str, dispatch: None) -> None:
+    top, child = ListHandler(), ListHandler(logging.ERROR)
+    logging.getLogger(name).addHandler(top)
+    logging.getLogger(f"{name}.a.b").addHandler(child)
+
+    log = logging.getLogger(f"{name}.a.b.c")
+    log.warning("warning")
+    log.error("error")
+
+    assert (top.messages, child.messages) == (["warning", "error"], ["error"])
+
+
+def test_handlers_are_invalidated_on_add_and_remove(name: str, dispatch: None) -> None:
+    first, second = ListHandler(), ListHandler()
+    parent = logging.getLogger(name)
+    log = logging.getLogger(f"{name}.child")
+
+    parent.addHandler(first)
+    log.warning("one")
+    parent.addHandler(second)
+    log.warning("two")
+    parent.removeHandler(first)
+    log.warning("three")
+
+    assert (first.messages, second.messages) == (["one", "two"], ["two", "three"])
+
+
+def test_handlers_are_invalidated_on_attribute_set(name: str, dispatch: None) -> None:
+    top, middle = ListHandler(), ListHandler()
+    logging.getLogger(name).addHandler(top)
+    log = logging.getLogger(f"{name}.a.b")
+    log.warning("one")
+
+    # NOTE: a new logger between existing loggers changes the `parent` of the child logger.
+    middle_logger = logging.getLogger(f"{name}.a")
+    middle_logger.handlers = [middle]
+    log.warning("two")
+    middle_logger.propagate = False
+    log.warning("three")
+
+    assert (top.messages, middle.messages) == (["one", "two"], ["two", "three"])
+
+
+def test_in_place_modification_requires_invalidation(name: str, dispatch: None) -> None:
+    first, second = ListHandler(), ListHandler()
+    log = logging.getLogger(name)
+    log.addHandler(first)
+    log.warning("one")
+
+    log.handlers.append(second)
+    log.warning("two")
+    invalidate_handler_dispatch()
+    log.warning("three")
+
+    assert (first.messages, second.messages) == (["one", "two", "three"], ["three"])
+
+
+@pytest.fixture
+def name() -> str:
+    return f"test-dispatch-{uuid.uuid4().hex}"
+
+
+@pytest.fixture
+def dispatch() -> t.Iterator[None]:
+    set_handler_dispatch(True)
+
+    try:
+        yield
+
+    finally:
+        set_handler_dispatch(False)
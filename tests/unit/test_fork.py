@@ -0,0 +1,63 @@
+import gc
+import json
+from pathlib import Path
+
+import pytest
+
+from no_log_tears.fork import get_process_path, register_at_fork
+from tests.unit.conftest import ForkRunner
+
+
+class Resource:
+    def __init__(self, calls: list[str]) -> None:
+        self.calls = calls
+        register_at_fork(
+            before=self.before,
+            after_in_parent=self.after_in_parent,
+            after_in_child=self.after_in_child,
+        )
+
+    def before(self) -> None:
+        self.calls.append("before")
+
+    def after_in_parent(self) -> None:
+        self.calls.append("after_in_parent")
+
+    def after_in_child(self) -> None:
+        self.calls.append("after_in_child")
+
+
+def test_hooks_are_called_around_fork(run_in_fork: ForkRunner, tmp_path: Path) -> None:
+    calls = list[str]()
+    resource = Resource(calls)
+    child_calls_path = tmp_path / "child.json"
+
+    def child() -> None:
+        child_calls_path.write_text(json.dumps(resource.calls))
+
+    assert run_in_fork(child) == 0
+
+    assert calls == ["before", "after_in_parent"]
+    assert json.loads(child_calls_path.read_text()) == ["before", "after_in_child"]
+
+
+def test_hooks_of_collected_objects_are_not_called(run_in_fork: ForkRunner) -> None:
+    calls = list[str]()
+    resource = Resource(calls)
+    del resource
+    gc.collect()
+
+    assert run_in_fork(lambda: None) == 0
+
+    assert calls == []
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        pytest.param(Path("/var/log/app.log"), Path("/var/log/app.1234.log"), id="suffix"),
+        pytest.param(Path("/var/log/app"), Path("/var/log/app.1234"), id="no suffix"),
+    ],
+)
+def test_get_process_path(path: Path, expected: Path) -> None:
+    assert get_process_path(path, 1234) == expected
@@ -0,0 +1,181 @@
+import json
+import logging
+import typing as t
+from pathlib import Path
+
+import pytest
+
+from no_log_tears import index as index_module
+from no_log_tears.binary import RecordFilter
+from no_log_tears.formatter.json import JSONFormatter
+from no_log_tears.handler.file import MemoryMappedFileHandler
+from no_log_tears.index import LogIndex
+
+RECORDS: t.Final[t.Sequence[tuple[str, int, float, dict[str, object]]]] = [
+    ("app", logging.INFO, 1000.0, {"user": "alice"}),
+    ("app.db", logging.DEBUG, 1010.0, {"user": "bob", "rows": 5}),
+    ("app.db", logging.WARNING, 1020.0, {"user": "alice", "rows": 500}),
+    ("other", logging.ERROR, 1030.0, {"user": "bob"}),
+    ("app.http", logging.INFO, 1040.0, {"user": "ålice"}),
+]
+
+
+@pytest.mark.parametrize(
+    ("record_filter", "fields", "expected_indexes"),
+    [
+        pytest.param(None, None, [0, 1, 2, 3, 4], id="all"),
+        pytest.param(RecordFilter(level=logging.WARNING), None, [2, 3], id="level"),
+        pytest.param(RecordFilter(loggers=["app.db", "other"]), None, [1, 2, 3], id="loggers"),
+        pytest.param(RecordFilter(loggers=["app"]), None, [0, 1, 2, 4], id="logger children"),
+        pytest.param(RecordFilter(since=1010.0, until=1020.0), None, [1, 2], id="time range"),
+        pytest.param(None, {"user": "alice"}, [0, 2], id="field"),
+        pytest.param(None, {"user": "ålice"}, [4], id="non-ascii field"),
+        pytest.param(None, {"user": "bob", "rows": 5}, [1], id="fields"),
+        pytest.param(RecordFilter(level=logging.INFO), {"user": "bob"}, [3], id="level and field"),
+        pytest.param(RecordFilter(loggers=["nope"]), None, [], id="no match"),
+    ],
+)
+@pytest.mark.parametrize("block_size", [1, 1024])
+def test_search(
+    log_path: Path,
+    block_size: int,
+    record_filter: t.Optional[RecordFilter],
+    fields: t.Optional[dict[str, object]],
+    expected_indexes: list[int],
+) -> None:
+    write_records(log_path, RECORDS)
+    index = LogIndex(log_path, block_size=block_size)
+    index.update()
+
+    assert get_messages(index.search(record_filter, fields)) == [f"record {i}" for i in expected_indexes]
+
+
+def test_update_is_incremental(log_path: Path) -> None:
+    write_records(log_path, RECORDS[:2])
+    assert LogIndex(log_path).update() == len(RECORDS[:2])
+
+    write_records(log_path, RECORDS[2:])
+    index = LogIndex(log_path)
+
+    assert index.update() == len(RECORDS[2:])
+    assert index.update() == 0
+    assert index.indexed_size == log_path.stat().st_size
+    assert get_messages(index.search(RecordFilter(level=logging.WARNING))) == ["record 2", "record 3"]
+
+
+def test_update_skips_incomplete_line(log_path: Path) -> None:
+    write_records(log_path, RECORDS[:1])
+    with log_path.open("a") as fd:
+        fd.write('{"name":"app","levelno":20,"msg":"parti')
+
+    index = LogIndex(log_path)
+
+    assert index.update() == 1
+    assert get_messages(index.search()) == ["record 0"]
+
+
+def test_search_checks_unindexed_lines(log_path: Path) -> None:
+    write_records(log_path, RECORDS[:2])
+    index = LogIndex(log_path)
+    index.update()
+
+    write_records(log_path, RECORDS[2:])
+
+    assert get_messages(index.search(RecordFilter(level=logging.ERROR))) == ["record 3"]
+
+
+def test_search_skips_blocks(log_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    write_records(log_path, RECORDS)
+    index = LogIndex(log_path, block_size=1)
+    index.update()
+
+    parsed = list[bytes]()
+    parse_line = index_module._parse_line  # noqa: SLF001
+
+    def count_parse_line(line: bytes) -> t.Optional[dict[str, object]]:
+        parsed.append(line)
+        return parse_line(line)
+
+    monkeypatch.setattr(index_module, "_parse_line", count_parse_line)
+
+    assert get_messages(index.search(RecordFilter(loggers=["other"]))) == ["record 3"]
+    assert len(parsed) == 1
+
+
+def test_update_rebuilds_truncated_file(log_path: Path) -> None:
+    write_records(log_path, RECORDS)
+    index = LogIndex(log_path)
+    index.update()
+
+    log_path.write_text("")
+    write_records(log_path, RECORDS[3:])
+
+    assert index.update() == len(RECORDS[3:])
+    assert get_messages(index.search()) == ["record 3", "record 4"]
+
+
+def test_update_moves_index_to_rotated_file(log_path: Path) -> None:
+    write_records(log_path, RECORDS[:2])
+    LogIndex(log_path).update()
+
+    backup_path = log_path.with_name(f"{log_path.name}.1")
+    log_path.rename(backup_path)
+    write_records(log_path, RECORDS[2:])
+
+    assert LogIndex(log_path).update() == len(RECORDS[2:])
+
+    backup_index = LogIndex(backup_path)
+    assert backup_index.index_path.exists()
+    assert backup_index.update() == 0
+    assert get_messages(backup_index.search()) == ["record 0", "record 1"]
+
+
+def test_update_ignores_memory_mapped_file_slack(log_path: Path) -> None:
+    handler = MemoryMappedFileHandler(log_path, segment_size=4096)
+    handler.setFormatter(JSONFormatter())
+    for record in create_records(RECORDS[:3]):
+        handler.handle(record)
+
+    index = LogIndex(log_path)
+    assert index.update() == len(RECORDS[:3])
+
+    for record in create_records(RECORDS[3:]):
+        handler.handle(record)
+
+    assert index.update() == len(RECORDS[3:])
+    assert get_messages(index.search(RecordFilter(level=logging.ERROR))) == ["record 3"]
+
+    handler.close()
+
+
+@pytest.fixture
+def log_path(tmp_path: Path) -> Path:
+    return tmp_path / "app.log"
+
+
+def create_records(records: t.Sequence[tuple[str, int, float, dict[str, object]]]) -> list[logging.LogRecord]:
+    return [
+        logging.makeLogRecord(
+            {
+                "name": name,
+                "levelno": level,
+                "levelname": logging.getLevelName(level),
+                "msg": f"record {RECORDS.index((name, level, created, extra))}",
+                "created": created,
+                **extra,
+            }
+        )
+        for name, level, created, extra in records
+    ]
+
+
+def write_records(path: Path, records: t.Sequence[tuple[str, int, float, dict[str, object]]]) -> None:
+    formatter = JSONFormatter()
+
+    with path.open("a") as fd:
+        for record in create_records(records):
+            fd.write(formatter.format(record) + "\n")
+
+
+def get_messages(lines: t.Iterable[str]) -> list[str]:
+    return [json.loads(line)["msg"] for line in lines]
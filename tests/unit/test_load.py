@@ -0,0 +1,75 @@
+import json
+import typing as t
+from pathlib import Path
+
+import pytest
+
+from no_log_tears.load import LoadMode, LoadProfile, run_load
+
+
+@pytest.mark.parametrize("mode", ["threads", "asyncio", "processes"])
+def test_run_load(restore_logging: None, log_path: Path, mode: LoadMode) -> None:
+    results = run_load({"mode": mode, "workers": 2, "records": 50}, create_config(log_path))
+
+    # NOTE: asyncio logs its own debug records.
+    records = [record for record in read_records(log_path) if record["name"].startswith("no_log_tears.load.")]
+
+    assert results["records"] == len(records) == 2 * 50
+    assert results["bytes_written"] == log_path.stat().st_size
+    assert t.cast(float, results["throughput_rps"]) > 0
+    assert set(t.cast(dict[str, float], results["latency_us"])) == {"p50", "p99", "p999", "max", "mean"}
+    assert json.loads(json.dumps(results)) == results
+
+
+@pytest.mark.parametrize(
+    ("profile", "expected_levels", "expected_failed"),
+    [
+        pytest.param({"levels": {"ERROR": 1}}, {"ERROR"}, False, id="single level"),
+        pytest.param({"levels": {"DEBUG": 1, 30: 1}}, {"DEBUG", "WARNING"}, False, id="level names & numbers"),
+        pytest.param({"exception_rate": 1.0}, {"DEBUG", "INFO", "WARNING", "ERROR"}, True, id="exceptions"),
+    ],
+)
+def test_run_load_mix(
+    restore_logging: None,
+    log_path: Path,
+    profile: LoadProfile,
+    expected_levels: set[str],
+    expected_failed: bool,  # noqa: FBT001
+) -> None:
+    run_load({"workers": 1, "records": 500, "extra_fields": 2, "context_depth": 3, **profile}, create_config(log_path))
+
+    records = read_records(log_path)
+
+    assert {record["levelname"] for record in records} == expected_levels
+    assert {record["msg"].endswith("failed") for record in records} == {expected_failed}
+    assert {key for key in records[0] if key.startswith(("extra_", "context_"))} == {
+        "extra_0",
+        "extra_1",
+        "context_0",
+        "context_1",
+        "context_2",
+    }
+
+
+def test_run_load_invalid_mode() -> None:
+    with pytest.raises(ValueError, match="unknown load mode"):
+        run_load(t.cast(LoadProfile, {"mode": "fibers"}))
+
+
+@pytest.fixture
+def log_path(tmp_path: Path) -> Path:
+    return tmp_path / "load.log"
+
+
+def create_config(path: Path) -> dict[str, object]:
+    return {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "formatters": {"json": {"()": "no_log_tears.formatter.JSONFormatter"}},
+        "handlers": {"file": {"class": "logging.FileHandler", "filename": str(path), "formatter": "json"}},
+        "root": {"level": "DEBUG", "handlers": ["file"]},
+    }
+
+
+def read_records(path: Path) -> list[dict[str, t.Any]]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
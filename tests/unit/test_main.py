@@ -0,0 +1,140 @@
+import json
+import logging
+from pathlib import Path
+
+import pytest
+from _pytest.capture import CaptureFixture
+
+from no_log_tears.__main__ import main
+from no_log_tears.formatter.json import JSONFormatter
+from no_log_tears.handler.binary import BinaryFileHandler
+
+
+@pytest.mark.parametrize(
+    ("args", "expected_messages"),
+    [
+        pytest.param([], ["started", "db is slow", "failed"], id="all"),
+        pytest.param(["--level", "warning"], ["db is slow", "failed"], id="level"),
+        pytest.param(["--logger", "app"], ["started", "db is slow"], id="logger"),
+        pytest.param(["--since", "1970-01-01T00:16:50Z"], ["db is slow", "failed"], id="since"),
+        pytest.param(["--until", "1970-01-01T00:16:45+00:00"], ["started"], id="until"),
+    ],
+)
+def test_read_json(
+    binary_log: Path,
+    capsys: CaptureFixture[str],
+    args: list[str],
+    expected_messages: list[str],
+) -> None:
+    assert main(["read", str(binary_log), *args]) == 0
+
+    assert [json.loads(line)["msg"] for line in capsys.readouterr().out.splitlines()] == expected_messages
+
+
+def test_read_brief(binary_log: Path, capsys: CaptureFixture[str]) -> None:
+    assert main(["read", "--format", "brief", "--level", "ERROR", str(binary_log)]) == 0
+
+    # NOTE: skip date & time, brief formatter uses local time zone.
+    assert capsys.readouterr().out.split()[2:] == ["ERROR", "other", "failed"]
+
+
+@pytest.fixture
+def binary_log(tmp_path: Path) -> Path:
+    path = tmp_path / "app.nltb"
+    handler = BinaryFileHandler(path)
+
+    for name, level, msg, created in (
+        ("app", logging.INFO, "started", 1000.0),
+        ("app.db", logging.WARNING, "db is slow", 1010.0),
+        ("other", logging.ERROR, "failed", 1020.0),
+    ):
+        handler.handle(
+            logging.makeLogRecord(
+                {
+                    "name": name,
+                    "levelno": level,
+                    "levelname": logging.getLevelName(level),
+                    "msg": msg,
+                    "created": created,
+                }
+            )
+        )
+
+    handler.close()
+
+    return path
+
+
+def test_index_and_search(json_log: Path, capsys: CaptureFixture[str]) -> None:
+    assert main(["index", str(json_log)]) == 0
+    assert capsys.readouterr().out == f"{json_log}: 3 new lines indexed\n"
+
+    assert main(["search", str(json_log), "--no-update", "--level", "WARNING", "--field", "user=alice"]) == 0
+    assert [json.loads(line)["msg"] for line in capsys.readouterr().out.splitlines()] == ["db is slow"]
+
+
+def test_search_updates_index(json_log: Path, capsys: CaptureFixture[str]) -> None:
+    assert main(["search", str(json_log), "--logger", "app", "--field", "rows=5"]) == 0
+
+    assert [json.loads(line)["msg"] for line in capsys.readouterr().out.splitlines()] == ["started"]
+    assert json_log.with_name(f"{json_log.name}.idx").exists()
+
+
+@pytest.fixture
+def json_log(tmp_path: Path) -> Path:
+    path = tmp_path / "app.log"
+    formatter = JSONFormatter()
+
+    with path.open("w") as fd:
+        for name, level, msg, extra in (
+            ("app", logging.INFO, "started", {"user": "alice", "rows": 5}),
+            ("app.db", logging.WARNING, "db is slow", {"user": "alice", "rows": "5"}),
+            ("other", logging.ERROR, "failed", {"user": "bob"}),
+        ):
+            record = logging.makeLogRecord(
+                {"name": name, "levelno": level, "levelname": logging.getLevelName(level), "msg": msg, **extra}
+            )
+            fd.write(formatter.format(record) + "\n")
+
+    return path
+
+
+def test_load(restore_logging: None, tmp_path: Path, capsys: CaptureFixture[str]) -> None:
+    config_path = tmp_path / "logging.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "disable_existing_loggers": False,
+                "handlers": {"file": {"class": "logging.FileHandler", "filename": str(tmp_path / "load.log")}},
+                "root": {"level": "DEBUG", "handlers": ["file"]},
+            }
+        )
+    )
+    output_path = tmp_path / "results.json"
+
+    assert (
+        main(
+            [
+                "load",
+                "--config",
+                str(config_path),
+                "--workers",
+                "2",
+                "--records",
+                "10",
+                "--level",
+                "info=3",
+                "--level",
+                "ERROR",
+                "--output",
+                str(output_path),
+            ]
+        )
+        == 0
+    )
+
+    results = json.loads(output_path.read_text())
+    assert results["records"] == 20  # noqa: PLR2004
+    assert results["profile"]["levels"] == {"20": 3.0, "40": 1.0}
+    assert capsys.readouterr().out.startswith("records: 20 in ")
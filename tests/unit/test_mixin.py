@@ -0,0 +1,55 @@
+import logging
+import typing as t
+
+import pytest
+from _pytest.logging import LogCaptureFixture
+from typing_extensions import override
+
+from no_log_tears.mixin import LogMixin
+
+
+class Counter(LogMixin):
+    def __init__(self) -> None:
+        self.value = 0
+        self.extra_calls = 0
+
+    def inc(self) -> None:
+        self.value += 1
+        self._log.debug("incremented")
+
+    @override
+    def _log_extra(self) -> t.Mapping[str, object]:
+        self.extra_calls += 1
+        return {"value": self.value}
+
+
+def test_log_extra_is_not_evaluated_for_disabled_level(counter: Counter, caplog: LogCaptureFixture) -> None:
+    with caplog.at_level(logging.INFO):
+        counter.inc()
+        counter.inc()
+
+    assert counter.extra_calls == 0
+    assert caplog.records == []
+
+
+def test_log_extra_is_evaluated_on_emit(counter: Counter, caplog: LogCaptureFixture) -> None:
+    with caplog.at_level(logging.DEBUG):
+        log = counter._log(bound="yes")  # noqa: SLF001
+        counter.inc()
+        counter.inc()
+        log.info("done")
+
+    assert [
+        (r.message, r.value, getattr(r, "bound", None))  # type: ignore[attr-defined]
+        for r in caplog.records
+    ] == [
+        ("incremented", 1, None),
+        ("incremented", 2, None),
+        ("done", 2, "yes"),
+    ]
+    assert counter.extra_calls == 3  # noqa: PLR2004
+
+
+@pytest.fixture
+def counter() -> Counter:
+    return Counter()